@@ -7,6 +7,7 @@ ID mapping and error handling, following Clean Architecture principles.
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ...domain.exceptions import (
@@ -14,7 +15,7 @@ from ...domain.exceptions import (
     PaperlessAPIError,
     ValidationError,
 )
-from ...infrastructure.paperless import PaperlessApiClient
+from ...infrastructure.paperless import PaperlessApiClient, get_client
 from .paperless_api_service import PaperlessApiService
 from ..use_cases.metadata_extraction import MetadataExtractor
 
@@ -39,10 +40,14 @@ class DocumentMetadataService:
             api_client: Optional pre-configured API client
             api_service: Optional pre-configured API service
         """
-        self.api_client = api_client or PaperlessApiClient()
+        self.api_client = api_client or get_client()
         self.api_service = api_service or PaperlessApiService(self.api_client)
         self.metadata_extractor = MetadataExtractor()
         
+        # Name-to-ID mapping may create entities; serialize it so concurrent
+        # updates do not create the same tag or correspondent twice
+        self._mapping_lock = threading.Lock()
+        
         # Track operations for reporting
         self._operation_stats = {
             'documents_processed': 0,
@@ -63,6 +68,8 @@ class DocumentMetadataService:
         
         This method takes metadata with string values (names) and converts them
         to the appropriate numeric IDs required by the Paperless NGX API.
+        It may be called from several threads; only the ID mapping is
+        serialized, the update requests run concurrently.
         
         Args:
             document_id: The numeric ID of the document to update
@@ -84,7 +91,8 @@ class DocumentMetadataService:
         """
         try:
             # Prepare update data with proper ID mapping
-            update_data = self._prepare_update_data(metadata)
+            with self._mapping_lock:
+                update_data = self._prepare_update_data(metadata)
             
             # Log the transformation for debugging
             logger.debug(f"Transformed metadata for document {document_id}:")
@@ -95,7 +103,8 @@ class DocumentMetadataService:
             result = self.api_client.update_document(document_id, update_data)
             
             # Track statistics
-            self._operation_stats['documents_processed'] += 1
+            with self._mapping_lock:
+                self._operation_stats['documents_processed'] += 1
             
             logger.info(f"Successfully updated document {document_id}")
             return result
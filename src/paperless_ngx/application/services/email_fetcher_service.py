@@ -6,8 +6,10 @@ tracking processed emails, and coordinating with the attachment processor.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import threading
 import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
@@ -59,11 +61,16 @@ class EmailProcessingState:
 class EmailFetcherService:
     """Service to fetch and process email attachments from multiple accounts."""
     
+    # Seconds between NOOPs on pooled connections; most providers drop
+    # idle IMAP sessions after about 30 minutes
+    KEEPALIVE_INTERVAL = 25 * 60
+    
     def __init__(
         self,
         email_settings: Optional[EmailSettings] = None,
         attachment_processor: Optional[AttachmentProcessor] = None,
-        state_file: Optional[Path] = None
+        state_file: Optional[Path] = None,
+        keep_alive: bool = False
     ):
         """Initialize email fetcher service.
         
@@ -71,8 +78,11 @@ class EmailFetcherService:
             email_settings: Email configuration settings
             attachment_processor: Attachment processor instance
             state_file: Path to state persistence file
+            keep_alive: Keep IMAP connections open between operations
+                until close() instead of logging in for each one
         """
         self.settings = email_settings or load_email_config_from_env()
+        self.keep_alive = keep_alive
         
         # Initialize attachment processor
         if attachment_processor:
@@ -91,6 +101,10 @@ class EmailFetcherService:
         # Email clients
         self.clients: Dict[str, IMAPEmailClient] = {}
         self._initialize_clients()
+        
+        # Serializes use of each client's connection across worker threads
+        self._client_locks: Dict[str, threading.Lock] = {}
+        self._keepalive_task: Optional[asyncio.Task] = None
     
     def _initialize_clients(self) -> None:
         """Initialize IMAP clients for all configured accounts."""
@@ -116,13 +130,116 @@ class EmailFetcherService:
             except Exception as e:
                 logger.error(f"Failed to initialize client for {account.name}: {e}")
     
+    def _connect(self, client: IMAPEmailClient) -> None:
+        """Connect a client, reusing a live connection in keep-alive mode.
+        
+        Args:
+            client: IMAP client to connect
+        """
+        if self.keep_alive and client.connection is not None:
+            try:
+                if client.connection.noop()[0] == "OK":
+                    return
+            except Exception as e:
+                logger.debug(f"Kept-alive connection for {client.account.name} is gone: {e}")
+            client.disconnect()
+        client.connect()
+    
+    def _release(self, client: IMAPEmailClient) -> None:
+        """Disconnect a client unless connections are kept alive.
+        
+        Args:
+            client: IMAP client to release
+        """
+        if self.keep_alive:
+            return
+        try:
+            client.disconnect()
+        except:
+            pass
+    
+    def _run_locked(self, account_name: str, func, *args):
+        """Run func while holding the account's connection lock.
+        
+        Args:
+            account_name: Account whose connection func uses
+            func: Callable to run
+            *args: Arguments for func
+            
+        Returns:
+            Result of func
+        """
+        with self._client_locks.setdefault(account_name, threading.Lock()):
+            return func(*args)
+    
+    async def acquire(self, account_name: str) -> Optional[IMAPEmailClient]:
+        """Get a connected client, logging in only when necessary.
+        
+        In keep-alive mode the connection stays open for later calls and a
+        background task sends NOOPs to idle connections every
+        KEEPALIVE_INTERVAL seconds. Connections that fail the NOOP are
+        dropped and replaced on the next acquire().
+        
+        Args:
+            account_name: Name of email account
+            
+        Returns:
+            Connected client, or None if the connection failed
+        """
+        if account_name not in self.clients:
+            logger.error(f"Account {account_name} not configured")
+            return None
+        
+        client = self.clients[account_name]
+        try:
+            await asyncio.to_thread(self._run_locked, account_name, self._connect, client)
+        except Exception as e:
+            logger.error(f"Failed to connect to {account_name}: {e}")
+            return None
+        
+        if self.keep_alive and (self._keepalive_task is None or self._keepalive_task.done()):
+            self._keepalive_task = asyncio.create_task(self._noop_keepalive())
+        return client
+    
+    async def _noop_keepalive(self) -> None:
+        """Keep pooled connections from timing out."""
+        while True:
+            await asyncio.sleep(self.KEEPALIVE_INTERVAL)
+            await asyncio.to_thread(self._noop_idle_clients)
+    
+    def _noop_idle_clients(self) -> None:
+        """Send a NOOP on every open connection that is not in use."""
+        for name, client in self.clients.items():
+            lock = self._client_locks.setdefault(name, threading.Lock())
+            if client.connection is None or not lock.acquire(blocking=False):
+                continue
+            try:
+                client.connection.noop()
+            except Exception as e:
+                logger.debug(f"Pooled connection for {name} is gone: {e}")
+                client.disconnect()
+            finally:
+                lock.release()
+    
+    def close(self) -> None:
+        """Close all IMAP connections."""
+        if self._keepalive_task is not None and not self._keepalive_task.done():
+            self._keepalive_task.cancel()
+        for client in self.clients.values():
+            try:
+                client.disconnect()
+            except Exception as e:
+                logger.debug(f"Error disconnecting {client.account.name}: {e}")
+    
     # State persistence methods removed - using in-memory statistics only
     
     def fetch_account(
         self,
         account_name: str,
         since_date: Optional[datetime] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        batch_size: int = 1,
+        since_imap: Optional[str] = None
     ) -> List[ProcessedAttachment]:
         """Fetch attachments from specific email account.
         
@@ -130,6 +247,10 @@ class EmailFetcherService:
             account_name: Name of email account
             since_date: Only process emails after this date
             dry_run: Don't actually download, just report
+            batch_size: Emails fetched per IMAP FETCH command (1 fetches
+                each email separately)
+            since_imap: since_date preformatted as IMAP date (DD-Mon-YYYY),
+                so callers fetching many accounts format it once
             
         Returns:
             List of processed attachments
@@ -144,7 +265,7 @@ class EmailFetcherService:
         
         try:
             # Connect to email server
-            client.connect()
+            self._connect(client)
             client.select_folder()
             
             # Determine since date
@@ -153,7 +274,10 @@ class EmailFetcherService:
                 since_date = state.last_check - timedelta(days=1)
             
             # Search for emails by date only - no UID filtering
-            uids = client.search_emails(since_date=since_date)
+            if since_imap:
+                uids = client.search_emails(since_imap=since_imap)
+            else:
+                uids = client.search_emails(since_date=since_date)
             
             logger.info(
                 f"{account_name}: Found {len(uids)} emails in date range to process (all will be processed)"
@@ -162,46 +286,52 @@ class EmailFetcherService:
             if dry_run:
                 logger.info(f"[DRY RUN] Would process {len(uids)} emails from {account_name}")
             
-            # Process ALL emails found in date range
+            # Process ALL emails found in date range, fetching each batch
+            # with one FETCH; emails missing from a batch are fetched singly
             emails_processed_count = 0
-            for uid in uids:
-                try:
-                    # Fetch email
-                    email_msg = client.fetch_email(uid)
-                    if not email_msg:
-                        continue
-                    
-                    # Process attachments
-                    if email_msg.attachments:
-                        if dry_run:
-                            for att in email_msg.attachments:
-                                logger.info(
-                                    f"[DRY RUN] Would download: {att.filename} "
-                                    f"({att.size} bytes) from {att.email_sender}"
+            batch_size = max(1, batch_size)
+            for start in range(0, len(uids), batch_size):
+                batch = uids[start:start + batch_size]
+                prefetched = client.fetch_emails(batch) if len(batch) > 1 else {}
+                
+                for uid in batch:
+                    try:
+                        # Fetch email
+                        email_msg = prefetched.get(uid) or client.fetch_email(uid)
+                        if not email_msg:
+                            continue
+                        
+                        # Process attachments
+                        if email_msg.attachments:
+                            if dry_run:
+                                for att in email_msg.attachments:
+                                    logger.info(
+                                        f"[DRY RUN] Would download: {att.filename} "
+                                        f"({att.size} bytes) from {att.email_sender}"
+                                    )
+                            else:
+                                # Process attachments
+                                processed = self.processor.process_attachments(
+                                    email_msg.attachments,
+                                    skip_duplicates=True
                                 )
-                        else:
-                            # Process attachments
-                            processed = self.processor.process_attachments(
-                                email_msg.attachments,
-                                skip_duplicates=True
-                            )
-                            processed_attachments.extend(processed)
-                            state.total_attachments += len(processed)
-                    
-                    emails_processed_count += 1
-                    state.total_processed += 1
-                    
-                    # Mark email as read if configured
-                    if self.settings.mark_as_read and not dry_run:
-                        client.mark_as_read(uid)
-                    
-                    # Delete if configured
-                    if self.settings.delete_after_processing and not dry_run:
-                        client.delete_email(uid)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing email {uid}: {e}")
-                    state.last_error = str(e)
+                                processed_attachments.extend(processed)
+                                state.total_attachments += len(processed)
+                        
+                        emails_processed_count += 1
+                        state.total_processed += 1
+                        
+                        # Mark email as read if configured
+                        if self.settings.mark_as_read and not dry_run:
+                            client.mark_as_read(uid)
+                        
+                        # Delete if configured
+                        if self.settings.delete_after_processing and not dry_run:
+                            client.delete_email(uid)
+                        
+                    except Exception as e:
+                        logger.error(f"Error processing email {uid}: {e}")
+                        state.last_error = str(e)
             
             # Update in-memory state only
             state.last_check = datetime.now()
@@ -218,23 +348,24 @@ class EmailFetcherService:
             state.last_error = str(e)
         finally:
             # Disconnect
-            try:
-                client.disconnect()
-            except:
-                pass
+            self._release(client)
         
         return processed_attachments
     
     def fetch_all_accounts(
         self,
         since_date: Optional[datetime] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        batch_size: int = 1,
+        since_imap: Optional[str] = None
     ) -> Dict[str, List[ProcessedAttachment]]:
         """Fetch attachments from all configured accounts.
         
         Args:
             since_date: Only process emails after this date
             dry_run: Don't actually download, just report
+            batch_size: Emails fetched per IMAP FETCH command
+            since_imap: since_date preformatted as IMAP date (DD-Mon-YYYY)
             
         Returns:
             Dictionary mapping account names to processed attachments
@@ -244,7 +375,9 @@ class EmailFetcherService:
         for account_name in self.clients.keys():
             logger.info(f"Processing account: {account_name}")
             try:
-                attachments = self.fetch_account(account_name, since_date, dry_run)
+                attachments = self.fetch_account(
+                    account_name, since_date, dry_run, batch_size, since_imap
+                )
                 results[account_name] = attachments
             except Exception as e:
                 logger.error(f"Failed to process {account_name}: {e}")
@@ -352,21 +485,34 @@ class EmailFetcherService:
         Returns:
             Dictionary mapping account names to connection status
         """
-        results = {}
+        return {
+            account_name: self.test_account_connection(account_name)
+            for account_name in self.clients
+        }
+    
+    def test_account_connection(self, account_name: str) -> bool:
+        """Test the connection to a single account.
         
-        for account_name, client in self.clients.items():
-            try:
-                success = client.test_connection()
-                results[account_name] = success
-                if success:
-                    logger.info(f"✓ Connection successful: {account_name}")
-                else:
-                    logger.warning(f"✗ Connection failed: {account_name}")
-            except Exception as e:
-                logger.error(f"✗ Connection test error for {account_name}: {e}")
-                results[account_name] = False
+        Args:
+            account_name: Name of email account
+            
+        Returns:
+            True if the connection succeeded
+        """
+        if account_name not in self.clients:
+            logger.error(f"Account {account_name} not configured")
+            return False
         
-        return results
+        try:
+            success = self.clients[account_name].test_connection()
+            if success:
+                logger.info(f"✓ Connection successful: {account_name}")
+            else:
+                logger.warning(f"✗ Connection failed: {account_name}")
+            return success
+        except Exception as e:
+            logger.error(f"✗ Connection test error for {account_name}: {e}")
+            return False
     
     def list_folders(self, account_name: str) -> List[str]:
         """List available folders for specific account.
@@ -385,16 +531,13 @@ class EmailFetcherService:
         folders = []
         
         try:
-            client.connect()
+            self._connect(client)
             folders = client.get_folder_list()
             logger.info(f"Found {len(folders)} folders in {account_name}")
         except Exception as e:
             logger.error(f"Error listing folders for {account_name}: {e}")
         finally:
-            try:
-                client.disconnect()
-            except:
-                pass
+            self._release(client)
         
         return folders
     
@@ -421,7 +564,7 @@ class EmailFetcherService:
         
         try:
             client = self.clients[account_name]
-            client.connect()
+            await asyncio.to_thread(client.connect)
             logger.info(f"Connected to {account_name}")
             return True
         except Exception as e:
@@ -436,7 +579,7 @@ class EmailFetcherService:
         """
         if account_name in self.clients:
             try:
-                self.clients[account_name].disconnect()
+                await asyncio.to_thread(self.clients[account_name].disconnect)
                 logger.info(f"Disconnected from {account_name}")
             except Exception as e:
                 logger.error(f"Error disconnecting from {account_name}: {e}")
@@ -444,51 +587,128 @@ class EmailFetcherService:
     async def fetch_emails_in_range(
         self,
         account: str,
-        date_range: 'DateRange'
+        date_range: 'DateRange',
+        bulk_size: int = 100
     ) -> List[Dict[str, Any]]:
-        """Fetch emails within a date range.
+        """Fetch emails with attachments within a date range.
+        
+        Complete messages are downloaded with one FETCH per bulk_size
+        emails instead of one round trip per email; emails missing from a
+        bulk response are fetched singly. Processed emails are marked as
+        read or deleted as configured and counted in the account's
+        processing state, like in fetch_account(). An open connection
+        (see connect()) is reused; otherwise one is opened for this call.
+        The blocking IMAP work runs in a worker thread, so several accounts
+        can be fetched concurrently.
         
         Args:
             account: Account name
             date_range: Date range to fetch emails from
+            bulk_size: Emails per FETCH command
             
         Returns:
-            List of email dictionaries with attachments
+            List of email dictionaries whose attachments carry their content
+            under 'data'
         """
         if account not in self.clients:
             logger.error(f"Account {account} not configured")
             return []
         
+        return await asyncio.to_thread(
+            self._run_locked, account, self._fetch_range, account, date_range, max(1, bulk_size)
+        )
+    
+    def _fetch_range(
+        self,
+        account: str,
+        date_range: 'DateRange',
+        bulk_size: int
+    ) -> List[Dict[str, Any]]:
+        """Blocking part of fetch_emails_in_range().
+        
+        Args:
+            account: Account name
+            date_range: Date range to fetch emails from
+            bulk_size: Emails per FETCH command
+            
+        Returns:
+            List of email dictionaries with attachment content
+        """
         client = self.clients[account]
+        state = self.processing_states[account]
         emails = []
+        owns_connection = client.connection is None
         
         try:
-            # Use existing fetch_account method with date
-            attachments = self.fetch_account(
-                account_name=account,
-                since_date=date_range.start_date,
-                dry_run=False
-            )
+            if owns_connection:
+                self._connect(client)
+            client.select_folder()
+            uids = client.search_emails(criteria=date_range.to_imap_search())
+            
+            emails_processed_count = 0
+            for start in range(0, len(uids), bulk_size):
+                batch = uids[start:start + bulk_size]
+                prefetched = client.fetch_emails(batch)
+                
+                missing = [uid for uid in batch if uid not in prefetched]
+                if missing:
+                    logger.warning(
+                        f"{account}: {len(missing)} emails missing from bulk fetch, "
+                        f"fetching singly: {missing}"
+                    )
+                
+                for uid in batch:
+                    try:
+                        email_msg = prefetched.get(uid) or client.fetch_email(uid)
+                        if not email_msg:
+                            logger.warning(f"{account}: Could not fetch email {uid}")
+                            continue
+                        
+                        if email_msg.attachments:
+                            emails.append({
+                                'date': email_msg.date,
+                                'subject': email_msg.subject,
+                                'sender': email_msg.sender,
+                                'attachments': [
+                                    {
+                                        'filename': att.filename,
+                                        'type': Path(att.filename).suffix,
+                                        'data': att.content
+                                    }
+                                    for att in email_msg.attachments
+                                ]
+                            })
+                            state.total_attachments += len(email_msg.attachments)
+                        
+                        emails_processed_count += 1
+                        state.total_processed += 1
+                        
+                        # Mark email as read if configured
+                        if self.settings.mark_as_read:
+                            client.mark_as_read(uid)
+                        
+                        # Delete if configured
+                        if self.settings.delete_after_processing:
+                            client.delete_email(uid)
+                        
+                    except Exception as e:
+                        logger.error(f"Error processing email {uid}: {e}")
+                        state.last_error = str(e)
             
-            # Convert attachments to email format for compatibility
-            for att in attachments:
-                email_dict = {
-                    'date': att.email_date if hasattr(att, 'email_date') else datetime.now(),
-                    'subject': att.email_subject if hasattr(att, 'email_subject') else 'No Subject',
-                    'sender': att.email_sender if hasattr(att, 'email_sender') else 'Unknown',
-                    'attachments': [{
-                        'filename': att.filename,
-                        'type': Path(att.filename).suffix,
-                        'data': att.content if hasattr(att, 'content') else None
-                    }]
-                }
-                emails.append(email_dict)
+            # Update in-memory state only
+            state.last_check = datetime.now()
+            if emails_processed_count > 0:
+                state.last_error = None
             
             return emails
             
         except Exception as e:
             logger.error(f"Error fetching emails from {account}: {e}")
-            return []
+            state.last_error = str(e)
+            return emails
+        finally:
+            if owns_connection:
+                self._release(client)
     
     async def download_attachment(self, attachment_data: Any, filepath: Path) -> bool:
         """Download attachment to specified path.
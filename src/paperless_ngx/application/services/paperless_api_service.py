@@ -7,6 +7,8 @@ including pagination, chunked retrieval, and entity management.
 from __future__ import annotations
 
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional, Set, Tuple, TYPE_CHECKING
@@ -19,7 +21,7 @@ from ...domain.exceptions import (
     ValidationError,
 )
 from ...infrastructure.config import get_settings
-from ...infrastructure.paperless import PaperlessApiClient
+from ...infrastructure.paperless import PaperlessApiClient, get_client
 from ..use_cases.metadata_extraction import MetadataExtractor
 
 if TYPE_CHECKING:
@@ -45,7 +47,7 @@ class PaperlessApiService:
         Args:
             api_client: Optional pre-configured API client
         """
-        self.api_client = api_client or PaperlessApiClient()
+        self.api_client = api_client or get_client()
         self.metadata_extractor = MetadataExtractor()
         
         # Caches for entities to reduce API calls
@@ -83,26 +85,14 @@ class PaperlessApiService:
         Yields:
             Chunks of document dictionaries
         """
-        filters = {}
-        filters['format'] = 'json'  # CRITICAL: Force JSON response
-        
-        # Date filtering
-        if since_date:
-            filters['created__date__gte'] = since_date.date().isoformat()
-        if until_date:
-            filters['created__date__lte'] = until_date.date().isoformat()
-        
-        # Entity filtering
-        if correspondent_id:
-            filters['correspondent__id'] = correspondent_id
-        if document_type_id:
-            filters['document_type__id'] = document_type_id
-        if tag_ids:
-            filters['tags__id__in'] = ','.join(map(str, tag_ids))
-        
-        # OCR filtering
-        if has_ocr is not None:
-            filters['has_ocr'] = 'true' if has_ocr else 'false'
+        filters = self._document_filters(
+            since_date=since_date,
+            until_date=until_date,
+            correspondent_id=correspondent_id,
+            document_type_id=document_type_id,
+            tag_ids=tag_ids,
+            has_ocr=has_ocr,
+        )
         
         page = 1
         total_documents = 0
@@ -142,6 +132,51 @@ class PaperlessApiService:
         
         logger.info(f"Retrieved {total_documents} documents in {page} chunks")
     
+    @staticmethod
+    def _document_filters(
+        since_date: Optional[datetime] = None,
+        until_date: Optional[datetime] = None,
+        correspondent_id: Optional[int] = None,
+        document_type_id: Optional[int] = None,
+        tag_ids: Optional[List[int]] = None,
+        has_ocr: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Build the query filters for document listings.
+        
+        Args:
+            since_date: Filter documents created after this date
+            until_date: Filter documents created before this date
+            correspondent_id: Filter by correspondent
+            document_type_id: Filter by document type
+            tag_ids: Filter by tags (documents with ANY of these tags)
+            has_ocr: Filter by OCR status
+            
+        Returns:
+            Dictionary of query parameters
+        """
+        filters = {}
+        filters['format'] = 'json'  # CRITICAL: Force JSON response
+        
+        # Date filtering
+        if since_date:
+            filters['created__date__gte'] = since_date.date().isoformat()
+        if until_date:
+            filters['created__date__lte'] = until_date.date().isoformat()
+        
+        # Entity filtering
+        if correspondent_id:
+            filters['correspondent__id'] = correspondent_id
+        if document_type_id:
+            filters['document_type__id'] = document_type_id
+        if tag_ids:
+            filters['tags__id__in'] = ','.join(map(str, tag_ids))
+        
+        # OCR filtering
+        if has_ocr is not None:
+            filters['has_ocr'] = 'true' if has_ocr else 'false'
+        
+        return filters
+    
     def get_documents_for_quarter(
         self,
         year: int,
@@ -181,27 +216,47 @@ class PaperlessApiService:
     def get_documents_in_range(
         self,
         date_range: 'DateRange',
-        chunk_size: int = 100
+        chunk_size: int = 500,
+        workers: int = 8
     ) -> List[Dict[str, Any]]:
         """Get all documents within a date range (synchronous version).
         
+        The first page reveals the total count; the other pages are then
+        requested concurrently, bounded by the client's connection pool.
+        
         Args:
             date_range: DateRange object specifying the period
-            chunk_size: Documents per chunk for pagination
+            chunk_size: Documents per page
+            workers: Maximum number of concurrent page requests
             
         Returns:
-            List of document dictionaries
+            List of document dictionaries in page order
         """
         logger.info(f"Retrieving documents for range: {date_range}")
         
-        documents = []
+        filters = self._document_filters(
+            since_date=date_range.start_date,
+            until_date=date_range.end_date
+        )
+        
+        def get_page(page: int) -> Dict[str, Any]:
+            return self.api_client.get_documents(
+                page=page,
+                page_size=chunk_size,
+                ordering='-created',
+                **filters
+            )
+        
         try:
-            for chunk in self.get_documents_chunked(
-                chunk_size=chunk_size,
-                since_date=date_range.start_date,
-                until_date=date_range.end_date
-            ):
-                documents.extend(chunk)
+            first_page = get_page(1)
+            documents = list(first_page['results'])
+            
+            page_count = math.ceil(first_page['count'] / chunk_size)
+            if page_count > 1:
+                max_workers = max(1, min(workers, self.api_client.pool_maxsize, page_count - 1))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for data in executor.map(get_page, range(2, page_count + 1)):
+                        documents.extend(data['results'])
         except Exception as e:
             logger.error(f"Error retrieving documents: {e}")
             # Return empty list on error instead of raising
@@ -213,7 +268,7 @@ class PaperlessApiService:
     async def get_documents_in_range_async(
         self,
         date_range: 'DateRange',
-        chunk_size: int = 100
+        chunk_size: int = 500
     ) -> List[Dict[str, Any]]:
         """Get all documents within a date range (async version).
         
@@ -466,20 +521,20 @@ class PaperlessApiService:
                         continue
                     
                     # Find documents with this tag
-                    docs_with_tag = list(self.api_client.get_documents_generator(
-                        tags__id__in=str(tag['id'])
-                    ))
+                    doc_ids = [
+                        doc['id'] for doc in self.api_client.get_documents_generator(
+                            tags__id__in=str(tag['id'])
+                        )
+                    ]
                     
-                    # Update documents to use primary tag
-                    for doc in docs_with_tag:
-                        current_tags = doc.get('tags', [])
-                        # Remove old tag, add primary tag if not present
-                        new_tags = [t for t in current_tags if t != tag['id']]
-                        if primary_tag['id'] not in new_tags:
-                            new_tags.append(primary_tag['id'])
-                        
-                        self.api_client.update_document(doc['id'], {'tags': new_tags})
-                        results['documents_updated'] += 1
+                    # Swap old tag for primary tag on all documents at once
+                    if doc_ids:
+                        self.api_client.bulk_edit(
+                            doc_ids,
+                            'modify_tags',
+                            {'add_tags': [primary_tag['id']], 'remove_tags': [tag['id']]}
+                        )
+                        results['documents_updated'] += len(doc_ids)
                     
                     # Delete the redundant tag
                     self.api_client.delete_tag(tag['id'])
@@ -511,14 +566,7 @@ class PaperlessApiService:
         """
         # Refresh cache if needed
         if self._correspondent_cache is None:
-            page = 1
-            self._correspondent_cache = []
-            while True:
-                data = self.api_client.get_correspondents(page=page)
-                self._correspondent_cache.extend(data['results'])
-                if not data['next']:
-                    break
-                page += 1
+            self._correspondent_cache = self.api_client.get_all_correspondents()
         
         # Case-insensitive search
         name_lower = name.lower().strip()
@@ -550,14 +598,7 @@ class PaperlessApiService:
         """
         # Refresh cache if needed
         if self._document_type_cache is None:
-            page = 1
-            self._document_type_cache = []
-            while True:
-                data = self.api_client.get_document_types(page=page)
-                self._document_type_cache.extend(data['results'])
-                if not data['next']:
-                    break
-                page += 1
+            self._document_type_cache = self.api_client.get_all_document_types()
         
         # Case-insensitive search
         name_lower = name.lower().strip()
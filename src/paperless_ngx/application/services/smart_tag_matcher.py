@@ -92,6 +92,11 @@ class SmartTagMatcher:
         self.similarity_threshold = similarity_threshold
         self.similarity_cache: Dict[Tuple[str, str], float] = {}
         self.existing_tags_cache: Optional[List[str]] = None
+        # Normalized form of existing_tags_cache, its reverse lookup for exact
+        # matches and how many entries both cover
+        self._normalized_tags: Optional[Dict[str, str]] = None
+        self._exact_tags: Dict[str, str] = {}
+        self._normalized_count = 0
         self.tag_hierarchy: Optional[TagHierarchy] = None
         
         logger.info(f"SmartTagMatcher initialized with {similarity_threshold:.0%} threshold")
@@ -117,6 +122,7 @@ class SmartTagMatcher:
             tags_response = self.paperless_client.get_tags(page_size=100)
             tags = tags_response.get('results', [])
             self.existing_tags_cache = [tag['name'] for tag in tags]
+            self._normalized_tags = None
             logger.info(f"Loaded {len(self.existing_tags_cache)} existing tags from Paperless")
             return self.existing_tags_cache
         except Exception as e:
@@ -141,12 +147,89 @@ class SmartTagMatcher:
         if existing_tags is None:
             existing_tags = await self.get_existing_tags()
         
+        return self._match(proposed_tag, existing_tags, *self._tag_index(existing_tags))
+    
+    def _tag_index(self, existing_tags: List[str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Get the lookup structures of existing tags for matching.
+        
+        For the cached Paperless tags they are built once per run and only
+        extended by tags appended to the cache since the last call.
+        
+        Args:
+            existing_tags: Existing tags
+            
+        Returns:
+            Tuple of existing tags mapped by TagSimilarity.normalize_candidates()
+            and normalized form mapped back to the first tag having it
+        """
+        if existing_tags is not self.existing_tags_cache:
+            normalized: Dict[str, str] = {}
+            exact: Dict[str, str] = {}
+            self._extend_index(normalized, exact, existing_tags)
+            return normalized, exact
+        
+        if self._normalized_tags is None or len(existing_tags) < self._normalized_count:
+            self._normalized_tags = {}
+            self._exact_tags = {}
+            self._extend_index(self._normalized_tags, self._exact_tags, existing_tags)
+        elif len(existing_tags) > self._normalized_count:
+            self._extend_index(
+                self._normalized_tags,
+                self._exact_tags,
+                existing_tags[self._normalized_count:]
+            )
+        self._normalized_count = len(existing_tags)
+        return self._normalized_tags, self._exact_tags
+    
+    @staticmethod
+    def _extend_index(
+        normalized: Dict[str, str],
+        exact: Dict[str, str],
+        tags: List[str]
+    ) -> None:
+        """Add tags to the lookup structures built by _tag_index().
+        
+        Args:
+            normalized: Tags mapped to their normalized form
+            exact: Normalized form mapped back to the first tag having it
+            tags: Tags to add
+        """
+        added = TagSimilarity.normalize_candidates(tags)
+        normalized.update(added)
+        for tag, key in added.items():
+            exact.setdefault(key, tag)
+    
+    def _match(
+        self,
+        proposed_tag: str,
+        existing_tags: List[str],
+        normalized: Optional[Dict[str, str]] = None,
+        exact: Optional[Dict[str, str]] = None
+    ) -> TagMatch:
+        """Match a proposed tag against the given existing tags.
+        
+        Args:
+            proposed_tag: Tag to match
+            existing_tags: Existing tags
+            normalized: Existing tags prepared by TagSimilarity.normalize_candidates()
+            exact: Normalized form mapped back to the existing tag, checked
+                before the fuzzy search over all existing tags
+            
+        Returns:
+            TagMatch result with matched tag or indication to create new
+        """
+        # An existing tag that only differs in case or surrounding whitespace
+        # needs no fuzzy search
+        best_match = exact.get(proposed_tag.lower().strip()) if exact else None
+        
         # Try to find best match
-        best_match = TagSimilarity.find_best_match(
-            proposed_tag,
-            existing_tags,
-            threshold=self.similarity_threshold
-        )
+        if best_match is None:
+            best_match = TagSimilarity.find_best_match(
+                proposed_tag,
+                existing_tags,
+                threshold=self.similarity_threshold,
+                normalized=normalized
+            )
         
         if best_match:
             # Calculate exact similarity for explanation
@@ -176,6 +259,11 @@ class SmartTagMatcher:
     ) -> List[TagMatch]:
         """Match multiple tags in batch.
         
+        The existing tags are normalized once for the whole batch, or once
+        per run for the cached Paperless tags. Tags without a match are
+        appended to existing_tags, so later tags of the batch (and later
+        batches sharing the list) can match them.
+        
         Args:
             proposed_tags: List of tags to match
             existing_tags: Optional list of existing tags
@@ -187,14 +275,16 @@ class SmartTagMatcher:
         if existing_tags is None:
             existing_tags = await self.get_existing_tags()
         
+        normalized, exact = self._tag_index(existing_tags)
         results = []
         for tag in proposed_tags:
-            match = await self.match_tag(tag, existing_tags)
+            match = self._match(tag, existing_tags, normalized, exact)
             results.append(match)
             
             # Add new tags to existing tags for subsequent matches
             if match.is_new_tag:
                 existing_tags.append(tag)
+                self._extend_index(normalized, exact, [tag])
         
         return results
     
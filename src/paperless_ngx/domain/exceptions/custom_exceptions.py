@@ -172,11 +172,21 @@ class ConfigurationValidationError(ConfigurationError):
 class APIError(BaseApplicationException):
     """Base exception for API-related errors."""
     
-    def __init__(self, message: str, status_code: Optional[int] = None, **kwargs):
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        error_code: ErrorCode = ErrorCode.API_CONNECTION_FAILED,
+        details: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ):
+        details = dict(details or {})
+        if status_code:
+            details["status_code"] = status_code
         super().__init__(
             message=message,
-            error_code=ErrorCode.API_CONNECTION_FAILED,
-            details={"status_code": status_code} if status_code else {},
+            error_code=error_code,
+            details=details,
             **kwargs
         )
         self.status_code = status_code
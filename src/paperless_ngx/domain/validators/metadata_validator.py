@@ -14,6 +14,31 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# datetime.fromisoformat() accepts a trailing 'Z' from Python 3.11 on;
+# older versions need it spelled as a UTC offset
+try:
+    datetime.fromisoformat('2024-01-01T00:00:00Z')
+    _FROMISOFORMAT_ACCEPTS_Z = True
+except ValueError:
+    _FROMISOFORMAT_ACCEPTS_Z = False
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, including a trailing 'Z' for UTC.
+    
+    Args:
+        value: Timestamp string
+        
+    Returns:
+        Parsed datetime
+        
+    Raises:
+        ValueError: If value is not a valid ISO 8601 timestamp
+    """
+    if _FROMISOFORMAT_ACCEPTS_Z or not value.endswith('Z'):
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value[:-1] + '+00:00')
+
 
 class MetadataValidator:
     """Validator for document metadata according to business rules.
@@ -398,7 +423,7 @@ class MetadataValidator:
                 if isinstance(date_value, str):
                     try:
                         # Try to parse ISO format
-                        datetime.fromisoformat(date_value.replace('Z', '+00:00'))
+                        _parse_iso(date_value)
                     except ValueError:
                         errors.append(f"Ungültiges Datumsformat für {field}: '{date_value}'")
                 elif not isinstance(date_value, datetime):
@@ -411,9 +436,9 @@ class MetadataValidator:
                 modified = metadata['modified']
                 
                 if isinstance(created, str):
-                    created = datetime.fromisoformat(created.replace('Z', '+00:00'))
+                    created = _parse_iso(created)
                 if isinstance(modified, str):
-                    modified = datetime.fromisoformat(modified.replace('Z', '+00:00'))
+                    modified = _parse_iso(modified)
                 
                 if created > modified:
                     errors.append("Erstellungsdatum liegt nach Änderungsdatum")
@@ -459,7 +484,7 @@ class MetadataValidator:
         if created_date and correspondent and document_type:
             try:
                 if isinstance(created_date, str):
-                    date_obj = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
+                    date_obj = _parse_iso(created_date)
                 else:
                     date_obj = created_date
                 
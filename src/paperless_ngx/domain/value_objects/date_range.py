@@ -9,6 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import cached_property
 from typing import Optional, Tuple
 
 from dateutil.relativedelta import relativedelta
@@ -325,6 +326,11 @@ class DateRange:
         Returns:
             List of YYYY-MM strings for each month in range
         """
+        return list(self._months)
+    
+    @cached_property
+    def _months(self) -> Tuple[str, ...]:
+        """Months of the range, computed once as the range is immutable."""
         months = []
         current = datetime(self.start_date.year, self.start_date.month, 1)
         end = datetime(self.end_date.year, self.end_date.month, 1)
@@ -333,7 +339,7 @@ class DateRange:
             months.append(current.strftime("%Y-%m"))
             current += relativedelta(months=1)
         
-        return months
+        return tuple(months)
     
     def format_display(self) -> str:
         """Format date range for display.
@@ -341,6 +347,11 @@ class DateRange:
         Returns:
             Human-readable date range string
         """
+        return self._display
+    
+    @cached_property
+    def _display(self) -> str:
+        """Display string of the range, computed once."""
         if self.format_type == DateFormatType.YYYY_MM:
             start_str = self.start_date.strftime("%Y-%m")
             end_str = self.end_date.strftime("%Y-%m")
@@ -254,13 +254,22 @@ class TagSimilarity:
                 f"{self.similarity_score:.3f}, {self.calculation_method.value})")
     
     @classmethod
-    def find_best_match(cls, tag: str, candidates: list[str], threshold: float = 0.95) -> Optional[str]:
+    def find_best_match(
+        cls,
+        tag: str,
+        candidates: list[str],
+        threshold: float = 0.95,
+        normalized: Optional[dict[str, str]] = None
+    ) -> Optional[str]:
         """Find the best matching tag from a list of candidates.
         
         Args:
             tag: Tag to match
             candidates: List of candidate tags
             threshold: Minimum similarity threshold
+            normalized: Candidates mapped to their lowercased, stripped form
+                (see normalize_candidates()); saves normalizing them again
+                when many tags are matched against the same candidates
             
         Returns:
             Best matching tag or None if no match above threshold
@@ -269,20 +278,17 @@ class TagSimilarity:
             return None
         
         if RAPIDFUZZ_AVAILABLE:
-            # Use RapidFuzz for efficient searching
+            # Use RapidFuzz for efficient searching; with a mapping as choices
+            # the original candidate (with original casing) is returned as key
             result = process.extractOne(
                 tag.lower().strip(),
-                [c.lower().strip() for c in candidates],
+                normalized if normalized is not None else cls.normalize_candidates(candidates),
                 scorer=fuzz.WRatio,
                 score_cutoff=threshold * 100
             )
             
             if result:
-                # Find original candidate (with original casing)
-                matched_lower = result[0]
-                for candidate in candidates:
-                    if candidate.lower().strip() == matched_lower:
-                        return candidate
+                return result[2]
         else:
             # Fallback to manual comparison
             best_match = None
@@ -296,4 +302,16 @@ class TagSimilarity:
             
             return best_match
         
-        return None
\ No newline at end of file
+        return None
+    
+    @staticmethod
+    def normalize_candidates(candidates: list[str]) -> dict[str, str]:
+        """Map candidate tags to the form used for fuzzy matching.
+        
+        Args:
+            candidates: List of candidate tags
+            
+        Returns:
+            Dictionary of candidate to lowercased, stripped candidate
+        """
+        return {candidate: candidate.lower().strip() for candidate in candidates}
\ No newline at end of file
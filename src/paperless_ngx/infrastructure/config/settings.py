@@ -85,6 +85,12 @@ class Settings(BaseSettings):
         default=True,
         description="Use LiteLLM for unified LLM interface"
     )
+    llm_max_parallel: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum concurrent LLM requests during document processing"
+    )
     
     _llm_provider_order_cache: Optional[List[str]] = None
     
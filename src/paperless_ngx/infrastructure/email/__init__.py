@@ -2,18 +2,22 @@
 
 from .email_client import EmailAttachment, EmailMessage, IMAPEmailClient
 from .email_config import (
+    CREDENTIAL_ENV_VARS,
     DEFAULT_EMAIL_ACCOUNTS,
     EmailAccount,
     EmailSettings,
+    load_credentials_from_env,
     load_email_config_from_env,
 )
 
 __all__ = [
+    "CREDENTIAL_ENV_VARS",
     "DEFAULT_EMAIL_ACCOUNTS",
     "EmailAccount",
     "EmailAttachment",
     "EmailMessage",
     "EmailSettings",
     "IMAPEmailClient",
+    "load_credentials_from_env",
     "load_email_config_from_env",
 ]
\ No newline at end of file
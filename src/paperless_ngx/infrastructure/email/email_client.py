@@ -243,7 +243,8 @@ class IMAPEmailClient:
         since_date: Optional[datetime] = None,
         sender_filter: Optional[str] = None,
         subject_filter: Optional[str] = None,
-        unseen_only: bool = False
+        unseen_only: bool = False,
+        since_imap: Optional[str] = None
     ) -> List[str]:
         """Search for emails matching criteria.
         
@@ -253,6 +254,8 @@ class IMAPEmailClient:
             sender_filter: Filter by sender email/name
             subject_filter: Filter by subject substring
             unseen_only: Only return unread emails
+            since_imap: since_date already formatted as IMAP date
+                (DD-Mon-YYYY); takes precedence over since_date
             
         Returns:
             List of email UIDs
@@ -270,7 +273,9 @@ class IMAPEmailClient:
             if unseen_only:
                 search_parts.append("UNSEEN")
             
-            if since_date:
+            if since_imap:
+                search_parts.append(f'SINCE "{since_imap}"')
+            elif since_date:
                 date_str = since_date.strftime("%d-%b-%Y")
                 search_parts.append(f'SINCE "{date_str}"')
             
@@ -323,41 +328,104 @@ class IMAPEmailClient:
                 logger.warning(f"Failed to fetch email {uid}")
                 return None
             
-            # Parse email
-            raw_email = data[0][1]
-            msg = email.message_from_bytes(raw_email)
-            
-            # Extract headers
-            subject = self._decode_header(msg.get("Subject", ""))
-            sender = self._decode_header(msg.get("From", ""))
-            date_str = msg.get("Date", "")
-            
-            # Parse date
-            try:
-                date = email.utils.parsedate_to_datetime(date_str)
-            except:
-                date = datetime.now()
-            
-            # Extract body
-            body = self._extract_body(msg)
-            
-            # Extract attachments
-            attachments = self._extract_attachments(msg, uid, subject, sender, date)
-            
-            return EmailMessage(
-                uid=uid,
-                subject=subject,
-                sender=sender,
-                date=date,
-                body=body,
-                attachments=attachments,
-                raw_message=msg
-            )
+            return self._parse_email(uid, data[0][1])
             
         except Exception as e:
             logger.error(f"Error fetching email {uid}: {e}")
             return None
     
+    def fetch_emails(self, uids: List[str]) -> Dict[str, EmailMessage]:
+        """Fetch several complete emails with a single FETCH command.
+        
+        If the server rejects the request (e.g. "maximum request size
+        exceeded"), the batch is split in half and each half fetched
+        separately. Messages missing from the response or failing to parse
+        are left out, so callers can fall back to fetch_email() for them.
+        
+        Args:
+            uids: Email UIDs as returned by search_emails()
+            
+        Returns:
+            Dictionary mapping UIDs to parsed EmailMessages
+        """
+        if not self.connection:
+            raise RuntimeError("Not connected to IMAP server")
+        
+        messages: Dict[str, EmailMessage] = {}
+        try:
+            status, data = self.connection.fetch(",".join(uids).encode(), "(RFC822)")
+        except imaplib.IMAP4.abort as e:
+            logger.error(f"Error fetching {len(uids)} emails: {e}")
+            return messages
+        except imaplib.IMAP4.error as e:
+            if len(uids) < 2:
+                logger.error(f"Error fetching email {uids[0] if uids else ''}: {e}")
+                return messages
+            half = len(uids) // 2
+            logger.debug(f"FETCH of {len(uids)} emails rejected ({e}), splitting batch")
+            messages.update(self.fetch_emails(uids[:half]))
+            messages.update(self.fetch_emails(uids[half:]))
+            return messages
+        except Exception as e:
+            logger.error(f"Error fetching {len(uids)} emails: {e}")
+            return messages
+        
+        if status != "OK":
+            logger.warning(f"Failed to fetch {len(uids)} emails")
+            return messages
+        
+        # The response alternates (b"<uid> (RFC822 {<size>}", raw) tuples
+        # with closing b")" lines
+        for part in data:
+            if not isinstance(part, tuple):
+                continue
+            uid = part[0].split(None, 1)[0].decode()
+            try:
+                messages[uid] = self._parse_email(uid, part[1])
+            except Exception as e:
+                logger.error(f"Error parsing email {uid}: {e}")
+        
+        return messages
+    
+    def _parse_email(self, uid: str, raw_email: bytes) -> EmailMessage:
+        """Parse a raw RFC822 message.
+        
+        Args:
+            uid: Email UID
+            raw_email: Raw message bytes
+            
+        Returns:
+            Parsed EmailMessage
+        """
+        msg = email.message_from_bytes(raw_email)
+        
+        # Extract headers
+        subject = self._decode_header(msg.get("Subject", ""))
+        sender = self._decode_header(msg.get("From", ""))
+        date_str = msg.get("Date", "")
+        
+        # Parse date
+        try:
+            date = email.utils.parsedate_to_datetime(date_str)
+        except:
+            date = datetime.now()
+        
+        # Extract body
+        body = self._extract_body(msg)
+        
+        # Extract attachments
+        attachments = self._extract_attachments(msg, uid, subject, sender, date)
+        
+        return EmailMessage(
+            uid=uid,
+            subject=subject,
+            sender=sender,
+            date=date,
+            body=body,
+            attachments=attachments,
+            raw_message=msg
+        )
+    
     def _decode_header(self, header_value: str) -> str:
         """Decode email header value.
         
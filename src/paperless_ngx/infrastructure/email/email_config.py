@@ -216,6 +216,30 @@ class EmailSettings(BaseModel):
         return results
 
 
+# Environment variables holding the account credentials, by settings field
+CREDENTIAL_ENV_VARS = {
+    "gmail1_email": "EMAIL_ACCOUNT_1_USERNAME",      # Gmail Account 1
+    "gmail1_app_password": "EMAIL_ACCOUNT_1_PASSWORD",
+    "gmail2_email": "EMAIL_ACCOUNT_2_USERNAME",      # Gmail Account 2
+    "gmail2_app_password": "EMAIL_ACCOUNT_2_PASSWORD",
+    "ionos_email": "EMAIL_ACCOUNT_3_USERNAME",       # IONOS Account
+    "ionos_password": "EMAIL_ACCOUNT_3_PASSWORD",
+}
+
+
+def load_credentials_from_env() -> Dict[str, SecretStr]:
+    """Load the account credentials from environment variables.
+    
+    Returns:
+        Credential settings fields of all variables that are set
+    """
+    return {
+        field: SecretStr(value)
+        for field, env_name in CREDENTIAL_ENV_VARS.items()
+        if (value := os.getenv(env_name))
+    }
+
+
 def load_email_config_from_env() -> EmailSettings:
     """Load email configuration from environment variables.
     
@@ -229,23 +253,8 @@ def load_email_config_from_env() -> EmailSettings:
         "email_processed_db": Path(os.getenv("EMAIL_PROCESSED_DB", "./data/processed_emails.json")),
     }
     
-    # Check for EMAIL_ACCOUNT_1 (Gmail Account 1)
-    if email1 := os.getenv("EMAIL_ACCOUNT_1_USERNAME"):
-        config["gmail1_email"] = SecretStr(email1)
-    if password1 := os.getenv("EMAIL_ACCOUNT_1_PASSWORD"):
-        config["gmail1_app_password"] = SecretStr(password1)
-    
-    # Check for EMAIL_ACCOUNT_2 (Gmail Account 2)
-    if email2 := os.getenv("EMAIL_ACCOUNT_2_USERNAME"):
-        config["gmail2_email"] = SecretStr(email2)
-    if password2 := os.getenv("EMAIL_ACCOUNT_2_PASSWORD"):
-        config["gmail2_app_password"] = SecretStr(password2)
-    
-    # Check for EMAIL_ACCOUNT_3 (IONOS Account)
-    if email3 := os.getenv("EMAIL_ACCOUNT_3_USERNAME"):
-        config["ionos_email"] = SecretStr(email3)
-    if password3 := os.getenv("EMAIL_ACCOUNT_3_PASSWORD"):
-        config["ionos_password"] = SecretStr(password3)
+    # Account credentials (EMAIL_ACCOUNT_1..3)
+    config.update(load_credentials_from_env())
     
     # Additional settings
     if mark_as_read := os.getenv("EMAIL_MARK_AS_READ"):
@@ -8,15 +8,24 @@ from __future__ import annotations
 
 import logging
 import logging.handlers
+import os
+import re
+import secrets
 import sys
-import uuid
+import threading
 from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Optional, Union
 
 import structlog
-from pythonjsonlogger import jsonlogger
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
 
 from src.paperless_ngx.infrastructure.config.settings import get_settings
 
@@ -24,6 +33,24 @@ from src.paperless_ngx.infrastructure.config.settings import get_settings
 request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
 
+def _json_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize an event dict for structlog's JSONRenderer.
+    
+    Uses orjson when available and always returns ``str`` so the result
+    can be handed to stdlib formatters and text-mode file handlers.
+    
+    Args:
+        obj: Event dictionary to serialize
+        **kwargs: Renderer options, only ``default`` is honoured
+        
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=kwargs.get("default")).decode("utf-8")
+    return json.dumps(obj, default=kwargs.get("default"))
+
+
 class RequestIdFilter(logging.Filter):
     """Add request ID to log records."""
     
@@ -51,6 +78,12 @@ class SensitiveDataFilter(logging.Filter):
         ("secret=", "secret=[MASKED]"),
     ]
     
+    # All prefixes folded into one alternation so each message is scanned once
+    _SENSITIVE_RE = re.compile(
+        "(" + "|".join(re.escape(pattern) for pattern, _ in SENSITIVE_PATTERNS) + r")\S+"
+    )
+    _REPLACEMENTS = dict(SENSITIVE_PATTERNS)
+    
     def filter(self, record: logging.LogRecord) -> bool:
         """Mask sensitive data in log messages.
         
@@ -60,30 +93,44 @@ class SensitiveDataFilter(logging.Filter):
         Returns:
             Always True to keep the record
         """
-        if hasattr(record, "msg"):
-            msg = str(record.msg)
-            for pattern, replacement in self.SENSITIVE_PATTERNS:
-                if pattern in msg:
-                    msg = msg.replace(pattern + msg.split(pattern)[1].split()[0], replacement)
-            record.msg = msg
+        if isinstance(record.msg, dict):
+            # Structlog event dict, rendered later by ProcessorFormatter
+            record.msg = {
+                key: self._mask(value) if isinstance(value, str) else value
+                for key, value in record.msg.items()
+            }
+        elif hasattr(record, "msg"):
+            record.msg = self._mask(str(record.msg))
         
         if hasattr(record, "args") and record.args:
-            args = []
-            for arg in record.args:
-                arg_str = str(arg)
-                for pattern, replacement in self.SENSITIVE_PATTERNS:
-                    if pattern in arg_str:
-                        arg_str = arg_str.replace(
-                            pattern + arg_str.split(pattern)[1].split()[0],
-                            replacement
-                        )
-                args.append(arg_str)
-            record.args = tuple(args)
+            record.args = tuple(self._mask(str(arg)) for arg in record.args)
         
         return True
+    
+    def _mask(self, text: str) -> str:
+        """Mask sensitive values in a single string.
+        
+        Args:
+            text: Text to mask
+            
+        Returns:
+            Text with sensitive values replaced
+        """
+        return self._SENSITIVE_RE.sub(self._replace_match, text)
+    
+    def _replace_match(self, match: re.Match) -> str:
+        """Return the masked replacement for a matched prefix.
+        
+        Args:
+            match: Match of a sensitive prefix and its value
+            
+        Returns:
+            Replacement text
+        """
+        return self._REPLACEMENTS[match.group(1)]
 
 
-class ColoredFormatter(logging.Formatter):
+class ColoredFormatter(structlog.stdlib.ProcessorFormatter):
     """Colored formatter for console output."""
     
     COLORS = {
@@ -118,6 +165,73 @@ class ColoredFormatter(logging.Formatter):
         return result
 
 
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that tracks the file size itself.
+    
+    The stdlib handler formats every record twice and calls ``stream.tell()``
+    to decide on rollover. This handler keeps a running byte counter that is
+    seeded with ``os.fstat`` when the stream is opened, so the rollover
+    check is a single comparison. Messages are counted in encoded bytes, so
+    non-ASCII text (e.g. German umlauts) does not delay rotation.
+    """
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize handler and seed the size counter from the open file."""
+        self._bytes_written = 0
+        self._pending_bytes = 0
+        super().__init__(*args, **kwargs)
+        self._sync_size()
+    
+    def _sync_size(self) -> None:
+        """Reset the size counter from the current file on disk."""
+        self._bytes_written = os.fstat(self.stream.fileno()).st_size if self.stream else 0
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format record and remember its size for the counter.
+        
+        Args:
+            record: Log record to format
+            
+        Returns:
+            Formatted log string
+        """
+        msg = super().format(record)
+        self._pending_bytes = len((msg + self.terminator).encode(self.encoding or "utf-8", "replace"))
+        return msg
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit record and advance the size counter.
+        
+        Args:
+            record: Log record to emit
+        """
+        super().emit(record)
+        self._bytes_written += self._pending_bytes
+        self._pending_bytes = 0
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Check the cached size instead of probing the stream.
+        
+        Args:
+            record: Log record about to be emitted
+            
+        Returns:
+            True if the file has reached maxBytes
+        """
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            # Stream is opened lazily, pick up the size of the existing file
+            self.stream = self._open()
+            self._sync_size()
+        return self._bytes_written >= self.maxBytes
+    
+    def doRollover(self) -> None:
+        """Rotate files and reset the size counter."""
+        super().doRollover()
+        self._sync_size()
+
+
 class LoggerSetup:
     """Setup and configure application logging."""
     
@@ -128,14 +242,24 @@ class LoggerSetup:
             settings: Optional settings object, uses get_settings() if None
         """
         self.settings = settings or get_settings()
-        self.loggers: Dict[str, logging.Logger] = {}
         self._setup_complete = False
+        self._setup_lock = threading.Lock()
         
     def setup(self) -> None:
-        """Setup logging configuration."""
+        """Setup logging configuration.
+        
+        Safe to call from several threads; the configuration runs once.
+        """
         if self._setup_complete:
             return
         
+        with self._setup_lock:
+            if not self._setup_complete:
+                self._configure()
+                self._setup_complete = True
+    
+    def _configure(self) -> None:
+        """Install handlers, filters and structlog configuration."""
         # Get root logger
         root_logger = logging.getLogger()
         root_logger.setLevel(getattr(logging, self.settings.log_level))
@@ -169,8 +293,6 @@ class LoggerSetup:
         logging.getLogger("litellm").setLevel(logging.INFO)
         logging.getLogger("openai").setLevel(logging.WARNING)
         
-        self._setup_complete = True
-        
     def _create_console_handler(self) -> logging.StreamHandler:
         """Create console handler with colored output.
         
@@ -181,18 +303,30 @@ class LoggerSetup:
         
         # Use colored formatter for TTY, plain for non-TTY (e.g., logs)
         if sys.stdout.isatty():
-            formatter = ColoredFormatter(self.settings.log_format)
+            formatter_class = ColoredFormatter
+            renderer = structlog.dev.ConsoleRenderer()
         else:
-            formatter = logging.Formatter(self.settings.log_format)
+            formatter_class = structlog.stdlib.ProcessorFormatter
+            renderer = structlog.processors.JSONRenderer(serializer=_json_dumps)
+        
+        formatter = formatter_class(
+            processors=[self._console_renderer(renderer)],
+            fmt=self.settings.log_format,
+            keep_exc_info=True,
+            keep_stack_info=True,
+        )
         
         handler.setFormatter(formatter)
         handler.setLevel(getattr(logging, self.settings.log_level))
         
         return handler
     
-    def _create_file_handler(self) -> logging.handlers.RotatingFileHandler:
+    def _create_file_handler(self) -> FastRotatingFileHandler:
         """Create rotating file handler with JSON formatting.
         
+        Both stdlib records and structlog events are rendered by structlog's
+        JSONRenderer so the file contains a single JSON format.
+        
         Returns:
             Configured file handler
         """
@@ -201,7 +335,7 @@ class LoggerSetup:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Create rotating file handler
-        handler = logging.handlers.RotatingFileHandler(
+        handler = FastRotatingFileHandler(
             filename=str(log_file),
             maxBytes=self.settings.log_rotation_size,
             backupCount=self.settings.log_backup_count,
@@ -209,10 +343,18 @@ class LoggerSetup:
         )
         
         # Use JSON formatter for file logs
-        json_formatter = jsonlogger.JsonFormatter(
-            "%(asctime)s %(name)s %(levelname)s %(request_id)s %(message)s",
-            rename_fields={"asctime": "timestamp", "levelname": "level"},
-            timestamp=True
+        json_formatter = structlog.stdlib.ProcessorFormatter(
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                structlog.processors.JSONRenderer(serializer=_json_dumps),
+            ],
+            foreign_pre_chain=[
+                structlog.stdlib.add_logger_name,
+                structlog.stdlib.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.format_exc_info,
+                self._add_request_id,
+            ],
         )
         
         handler.setFormatter(json_formatter)
@@ -233,13 +375,36 @@ class LoggerSetup:
                 structlog.processors.format_exc_info,
                 structlog.processors.UnicodeDecoder(),
                 self._add_request_id,
-                structlog.dev.ConsoleRenderer() if sys.stdout.isatty() else structlog.processors.JSONRenderer(),
+                # Rendering happens in the handlers' ProcessorFormatter
+                structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
             ],
             context_class=dict,
             logger_factory=structlog.stdlib.LoggerFactory(),
             cache_logger_on_first_use=True,
         )
     
+    @staticmethod
+    def _console_renderer(renderer):
+        """Build the console processor for structlog and stdlib records.
+        
+        Structlog events are rendered with ``renderer``; plain stdlib records
+        keep their message so the console format stays unchanged.
+        
+        Args:
+            renderer: Structlog renderer for structlog events
+            
+        Returns:
+            Processor for ProcessorFormatter
+        """
+        remove_meta = structlog.stdlib.ProcessorFormatter.remove_processors_meta
+        
+        def render(logger, method_name, event_dict):
+            if not event_dict.get("_from_structlog"):
+                return event_dict["event"]
+            return renderer(logger, method_name, remove_meta(logger, method_name, event_dict))
+        
+        return render
+    
     @staticmethod
     def _add_request_id(logger, method_name, event_dict):
         """Add request ID to structlog events.
@@ -256,37 +421,6 @@ class LoggerSetup:
         if request_id:
             event_dict["request_id"] = request_id
         return event_dict
-    
-    def get_logger(self, name: str) -> logging.Logger:
-        """Get a configured logger instance.
-        
-        Args:
-            name: Logger name (usually __name__)
-            
-        Returns:
-            Configured logger instance
-        """
-        if not self._setup_complete:
-            self.setup()
-        
-        if name not in self.loggers:
-            self.loggers[name] = logging.getLogger(name)
-        
-        return self.loggers[name]
-    
-    def get_struct_logger(self, name: str) -> structlog.BoundLogger:
-        """Get a structured logger instance.
-        
-        Args:
-            name: Logger name
-            
-        Returns:
-            Structured logger instance
-        """
-        if not self._setup_complete:
-            self.setup()
-        
-        return structlog.get_logger(name)
 
 
 class RequestContext:
@@ -296,9 +430,10 @@ class RequestContext:
         """Initialize request context.
         
         Args:
-            request_id: Optional request ID, generates UUID if None
+            request_id: Optional request ID, generates a random 16-char hex ID if None
         """
-        self.request_id = request_id or str(uuid.uuid4())
+        # 64 random bits are plenty to correlate log lines of one process
+        self.request_id = request_id or secrets.token_hex(8)
         self.token = None
         
     def __enter__(self):
@@ -385,8 +520,9 @@ class LoggingMixin:
         self.struct_logger.critical(message, exc_info=exc_info, **kwargs)
 
 
-# Singleton instance
+# Singleton instance, only assigned once setup() has completed
 _logger_setup: Optional[LoggerSetup] = None
+_logger_setup_lock = threading.Lock()
 
 
 def setup_logging(settings: Optional[Any] = None) -> LoggerSetup:
@@ -401,8 +537,11 @@ def setup_logging(settings: Optional[Any] = None) -> LoggerSetup:
     global _logger_setup
     
     if _logger_setup is None:
-        _logger_setup = LoggerSetup(settings)
-        _logger_setup.setup()
+        with _logger_setup_lock:
+            if _logger_setup is None:
+                logger_setup = LoggerSetup(settings)
+                logger_setup.setup()
+                _logger_setup = logger_setup
     
     return _logger_setup
 
@@ -419,7 +558,8 @@ def get_logger(name: str) -> logging.Logger:
     if _logger_setup is None:
         setup_logging()
     
-    return _logger_setup.get_logger(name)
+    # logging.getLogger caches loggers and is thread-safe
+    return logging.getLogger(name)
 
 
 def get_struct_logger(name: str) -> structlog.BoundLogger:
@@ -434,7 +574,7 @@ def get_struct_logger(name: str) -> structlog.BoundLogger:
     if _logger_setup is None:
         setup_logging()
     
-    return _logger_setup.get_struct_logger(name)
+    return structlog.get_logger(name)
 
 
 def log_function_call(func):
@@ -487,4 +627,4 @@ def log_function_call(func):
             
             raise
     
-    return wrapper
\ No newline at end of file
+    return wrapper
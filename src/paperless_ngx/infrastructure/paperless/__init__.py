@@ -1,5 +1,5 @@
 """Paperless NGX infrastructure components."""
 
-from .api_client import ApiRequestBuilder, PaperlessApiClient
+from .api_client import ApiRequestBuilder, PaperlessApiClient, get_client
 
-__all__ = ['ApiRequestBuilder', 'PaperlessApiClient']
\ No newline at end of file
+__all__ = ['ApiRequestBuilder', 'PaperlessApiClient', 'get_client']
\ No newline at end of file
@@ -5,12 +5,21 @@ including authentication, retry mechanisms, and efficient connection management.
 
 CRITICAL: This client automatically adds format=json to all API requests to ensure
 JSON responses instead of HTML browsable API responses from Django REST Framework.
+The parameter is set once as a session-wide default (Session.params), which
+requests merges into every request.
 """
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
 import logging
+import math
+import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional, Tuple, Union
@@ -19,15 +28,29 @@ from urllib.parse import urljoin, urlparse, parse_qs, urlencode
 import requests
 from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-    before_sleep_log,
-)
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import HTTPError as Urllib3HTTPError, ReadTimeoutError
+from urllib3.util import make_headers
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from requests_toolbelt import MultipartEncoder
+    TOOLBELT_AVAILABLE = True
+except ImportError:
+    TOOLBELT_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 from ...domain.exceptions import (
     PaperlessAPIError,
     PaperlessAuthenticationError,
@@ -40,6 +63,45 @@ from ..config import get_settings
 logger = logging.getLogger(__name__)
 
 
+def _noop() -> None:
+    """Do nothing; stands in for _apply_rate_limit on unlimited clients."""
+
+
+def _ttl_cached(ttl: float) -> Any:
+    """Cache the result of an argument-less client method for `ttl` seconds.
+    
+    Results are stored per client instance in `_ttl_cache` and dropped by
+    `close()`. Meant for health checks and server info that UI refresh loops
+    call repeatedly. A failed check (False) is not cached, so a recovered
+    server is noticed on the next call. Callers get deep copies and may
+    mutate them freely.
+    
+    Args:
+        ttl: Time to live in seconds
+        
+    Returns:
+        Method decorator
+    """
+    def decorator(method: Any) -> Any:
+        key = method.__name__
+        
+        @functools.wraps(method)
+        def wrapper(self: 'PaperlessApiClient') -> Any:
+            cached = self._ttl_cache.get(key)
+            now = time.monotonic()
+            if cached is not None and now - cached[0] < ttl:
+                return copy.deepcopy(cached[1])
+            
+            result = method(self)
+            if result is not False:
+                self._ttl_cache[key] = (now, result)
+            return copy.deepcopy(result)
+        
+        return wrapper
+    
+    return decorator
+
+
 class ApiRequestBuilder:
     """Builder class for constructing API requests with proper formatting.
     
@@ -96,6 +158,44 @@ class ApiRequestBuilder:
         return params
 
 
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keepalive probes on pooled sockets.
+    
+    Load balancers and NAT gateways often drop idle connections after about
+    30 seconds without notice, so the next request on a pooled connection
+    fails and has to reconnect. Keepalive probes after `idle` seconds keep
+    such connections alive.
+    """
+    
+    def __init__(self, *args: Any, idle: int = 20, interval: int = 10, count: int = 3, **kwargs: Any):
+        """Initialize the adapter.
+        
+        Args:
+            idle: Seconds a connection is idle before the first probe
+            interval: Seconds between probes
+            count: Failed probes before the connection is dropped
+            *args: Positional arguments for HTTPAdapter
+            **kwargs: Keyword arguments for HTTPAdapter
+        """
+        self.socket_options = list(HTTPConnection.default_socket_options)
+        self.socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # Option names differ per platform (TCP_KEEPALIVE is macOS's TCP_KEEPIDLE)
+        for name, value in (
+            ('TCP_KEEPIDLE', idle),
+            ('TCP_KEEPALIVE', idle),
+            ('TCP_KEEPINTVL', interval),
+            ('TCP_KEEPCNT', count),
+        ):
+            if hasattr(socket, name):
+                self.socket_options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+        super().__init__(*args, **kwargs)
+    
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool manager with keepalive socket options."""
+        kwargs.setdefault('socket_options', self.socket_options)
+        super().init_poolmanager(*args, **kwargs)
+
+
 class PaperlessApiClient:
     """Low-level client for Paperless NGX API interactions.
     
@@ -109,6 +209,13 @@ class PaperlessApiClient:
     - Automatic format=json parameter injection
     """
     
+    # Upper bound for page_size accepted by Paperless; reference tables
+    # (tags, correspondents, document types) fit into a single page.
+    MAX_PAGE_SIZE = 100000
+    
+    # Status codes worth retrying; 5xx other than these are not transient
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
     def __init__(
         self,
         base_url: Optional[str] = None,
@@ -116,6 +223,10 @@ class PaperlessApiClient:
         timeout: Optional[Tuple[int, int]] = None,
         max_retries: int = 3,
         rate_limit: Optional[float] = None,
+        burst: Optional[float] = None,
+        pool_connections: int = 20,
+        pool_maxsize: int = 20,
+        pool_block: bool = True,
     ):
         """Initialize the Paperless API client.
         
@@ -125,12 +236,25 @@ class PaperlessApiClient:
             timeout: Tuple of (connect_timeout, read_timeout) in seconds
             max_retries: Maximum number of retry attempts
             rate_limit: Maximum requests per second (0 for no limit)
+            burst: Token bucket capacity, i.e. how many requests may be sent
+                back to back after an idle period (defaults to 2x rate_limit)
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum kept-alive connections per host; size this to
+                the number of threads sharing the client
+            pool_block: Wait for a free pooled connection instead of opening a
+                throwaway one when all connections are busy, so keep-alive
+                connections are always reused
         """
         settings = get_settings()
         
         self.base_url = (base_url or settings.paperless_base_url).rstrip('/')
         self.api_token = api_token or settings.get_secret_value('paperless_api_token')
         
+        # Precomputed once so _make_request can concatenate instead of urljoin
+        self._base_with_slash = self.base_url + '/'
+        self._documents_prefix = self._base_with_slash + 'documents/'
+        self._upload_url = self._documents_prefix + 'post_document/'
+        
         if not self.api_token:
             raise PaperlessAuthenticationError("API token is required")
         
@@ -139,10 +263,25 @@ class PaperlessApiClient:
             settings.paperless_timeout_read
         )
         self.max_retries = max_retries
-        self.rate_limit = rate_limit or settings.paperless_rate_limit
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.rate_limit = rate_limit if rate_limit is not None else settings.paperless_rate_limit
+        
+        # Conditional-GET cache: (endpoint, params) -> (validator headers, parsed JSON)
+        self._etag_cache: Dict[Tuple[str, frozenset], Tuple[Dict[str, str], Any]] = {}
         
-        # Track last request time for rate limiting
-        self._last_request_time = 0.0
+        # Short-lived results of health/info calls: name -> (timestamp, value)
+        self._ttl_cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # Token bucket for rate limiting: idle time accrues credit up to `burst`
+        self.burst = max(1.0, burst if burst is not None else 2 * self.rate_limit)
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._rl_lock = threading.Lock()
+        if self.rate_limit <= 0:
+            # Keep the bucket bookkeeping off the hot path entirely
+            self._apply_rate_limit = _noop
         
         # Create request builder for URL construction
         self.request_builder = ApiRequestBuilder(self.base_url)
@@ -155,11 +294,18 @@ class PaperlessApiClient:
     def _create_session(self) -> requests.Session:
         """Create HTTP session with connection pooling and retry logic.
         
+        Connections are kept alive and reused across requests. With
+        pool_block enabled, callers beyond pool_maxsize wait for a pooled
+        connection rather than paying a new TCP/TLS handshake.
+        
         Returns:
             Configured requests Session
         """
         session = requests.Session()
         
+        # CRITICAL: Force JSON responses for every request made with this session
+        session.params = {'format': 'json'}
+        
         # Set authentication header
         session.headers.update({
             'Authorization': f'Token {self.api_token}',
@@ -167,46 +313,88 @@ class PaperlessApiClient:
             'Content-Type': 'application/json',
         })
         
-        # Configure connection pooling and retries
+        # Ask for compressed responses; OCR content compresses very well.
+        # urllib3 only advertises codings it can decode (br/zstd when the
+        # brotli/zstandard packages are installed) and decompresses
+        # transparently. Keep-alive is stated explicitly for proxies.
+        session.headers['Accept-Encoding'] = make_headers(accept_encoding=True)['accept-encoding']
+        session.headers['Connection'] = 'keep-alive'
+        
+        # Configure connection pooling and retries. This is the only retry
+        # layer: connection errors, timeouts and retryable status codes are
+        # retried here, and the final response is returned instead of raised
+        # so _make_request can map its status to a domain exception.
         retry_strategy = Retry(
             total=self.max_retries,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=self.RETRY_STATUSES,
             allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
         )
         
-        adapter = HTTPAdapter(
+        adapter = KeepAliveHTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=10,
-            pool_maxsize=20,
-            pool_block=False,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
         )
         
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
+        # A streamed multipart body is read once and cannot be rewound, so
+        # urllib3 must not resend an upload after the server has answered.
+        # upload_document retries those itself with a fresh body; connection
+        # failures are still retried here since no body was sent yet.
+        upload_adapter = KeepAliveHTTPAdapter(
+            max_retries=Retry(
+                total=self.max_retries,
+                read=0,
+                other=0,
+                backoff_factor=1,
+                raise_on_status=False,
+            ),
+            pool_connections=1,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount(self._upload_url, upload_adapter)
+        
         return session
     
     def _apply_rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        if self.rate_limit > 0:
-            current_time = time.time()
-            time_since_last = current_time - self._last_request_time
-            min_interval = 1.0 / self.rate_limit
-            
-            if time_since_last < min_interval:
-                sleep_time = min_interval - time_since_last
-                logger.debug(f"Rate limiting: sleeping for {sleep_time:.3f}s")
-                time.sleep(sleep_time)
-            
-            self._last_request_time = time.time()
-    
-    @retry(
-        retry=retry_if_exception_type((ConnectionError, Timeout)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-    )
+        """Apply token bucket rate limiting before a request.
+        
+        Tokens refill at `rate_limit` per second up to `burst`. A request
+        consumes one token and only sleeps when the bucket is empty, so
+        short bursts after idle periods go out without delay.
+        
+        Thread-safe: the token is reserved under a lock (the balance may go
+        negative) and the wait for it happens outside the lock, so
+        concurrent callers are queued one refill interval apart instead of
+        all waking up at the same time.
+        
+        Unlimited clients (rate_limit <= 0) replace this method with a no-op
+        in __init__.
+        """
+        with self._rl_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._last_refill) * self.rate_limit
+            )
+            self._last_refill = now
+            self._tokens -= 1
+            
+            if self._tokens >= 0:
+                return
+            
+            sleep_time = -self._tokens / self.rate_limit
+        
+        logger.debug(f"Rate limiting: sleeping for {sleep_time:.3f}s")
+        time.sleep(sleep_time)
+    
     def _make_request(
         self,
         method: str,
@@ -216,8 +404,9 @@ class PaperlessApiClient:
         data: Optional[Any] = None,
         files: Optional[Dict[str, Any]] = None,
         stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
-        """Make HTTP request with retry logic.
+        """Make HTTP request; retries are handled by the session's urllib3 Retry.
         
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
@@ -227,6 +416,7 @@ class PaperlessApiClient:
             data: Form data for request body
             files: Files for multipart upload
             stream: Whether to stream the response
+            headers: Extra headers for this request only
             
         Returns:
             HTTP response object
@@ -238,29 +428,53 @@ class PaperlessApiClient:
             PaperlessTimeoutError: For timeout errors
             PaperlessConnectionError: For connection errors
         """
-        # Apply rate limiting
-        self._apply_rate_limit()
+        # Build full URL (plain concatenation keeps /api, no urljoin parsing)
+        return self._make_request_absolute(
+            method,
+            self._base_with_slash + endpoint.lstrip('/'),
+            params=params,
+            json_data=json_data,
+            data=data,
+            files=files,
+            stream=stream,
+            headers=headers,
+        )
+    
+    def _make_request_absolute(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        files: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Make HTTP request to an already complete URL.
         
-        # Build full URL
-        # Fix urljoin behavior - ensure /api is preserved
-        if not self.base_url.endswith('/'):
-            base = self.base_url + '/'
-        else:
-            base = self.base_url
-        url = urljoin(base, endpoint.lstrip('/'))
-        
-        # CRITICAL: Ensure format=json is ALWAYS in params
-        if params is None:
-            params = {}
+        Same as _make_request, but skips endpoint joining for callers that
+        hold a prebuilt URL (see _doc_url).
         
-        # Force format=json to prevent HTML responses
-        params['format'] = 'json'
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+            json_data: JSON data for request body
+            data: Form data for request body
+            files: Files for multipart upload
+            stream: Whether to stream the response
+            headers: Extra headers for this request only
+            
+        Returns:
+            HTTP response object
+        """
+        # Apply rate limiting
+        self._apply_rate_limit()
         
         # Log the full URL with params for debugging
-        param_string = urlencode(params) if params else ""
-        full_url = f"{url}?{param_string}" if param_string else url
-        logger.debug(f"{method} {full_url}")
-        logger.debug(f"Request params: {params}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s %s?%s", method, url, urlencode(params or {}))
         
         try:
             response = self.session.request(
@@ -270,6 +484,7 @@ class PaperlessApiClient:
                 json=json_data,
                 data=data,
                 files=files,
+                headers=headers,
                 timeout=self.timeout,
                 stream=stream,
             )
@@ -279,9 +494,14 @@ class PaperlessApiClient:
                 raise PaperlessAuthenticationError("Invalid API token or unauthorized access")
             elif response.status_code == 429:
                 retry_after = response.headers.get('Retry-After', '60')
-                raise PaperlessRateLimitError(f"Rate limited. Retry after {retry_after} seconds")
+                raise PaperlessRateLimitError(
+                    retry_after=int(retry_after) if retry_after.isdigit() else None
+                )
             elif response.status_code >= 500:
-                raise PaperlessAPIError(f"Server error: {response.status_code} - {response.text}")
+                raise PaperlessAPIError(
+                    f"Server error: {response.status_code} - {response.text}",
+                    status_code=response.status_code,
+                )
             
             # Raise for other HTTP errors
             response.raise_for_status()
@@ -289,9 +509,9 @@ class PaperlessApiClient:
             return response
             
         except Timeout as e:
-            raise PaperlessTimeoutError(f"Request timed out: {e}")
+            raise PaperlessTimeoutError(self.timeout, user_message=f"Request timed out: {e}")
         except ConnectionError as e:
-            raise PaperlessConnectionError(f"Connection error: {e}")
+            raise PaperlessConnectionError(url, original_error=e)
         except HTTPError as e:
             if e.response is not None:
                 error_detail = e.response.text
@@ -301,6 +521,144 @@ class PaperlessApiClient:
         except RequestException as e:
             raise PaperlessAPIError(f"Request failed: {e}")
     
+    @staticmethod
+    def _parse_json(response: requests.Response) -> Any:
+        """Decode a JSON response body, using orjson when available.
+        
+        Args:
+            response: HTTP response with a JSON body
+            
+        Returns:
+            Parsed JSON data
+            
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    def _get_json(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+    ) -> Any:
+        """GET an endpoint and return parsed JSON, revalidating cached bodies.
+        
+        When a previous response carried an ETag or Last-Modified header, the
+        request is sent with If-None-Match/If-Modified-Since and a
+        304 Not Modified answer returns the cached body without transferring
+        or decoding it again.
+        
+        Callers get a shallow copy of the cached body (including its
+        'results' list), so appending to or replacing items in the result
+        does not alter the cache. The result items themselves are shared.
+        
+        Args:
+            endpoint: API endpoint (relative to base_url)
+            params: Query parameters
+            use_cache: Whether to use conditional requests for this call
+            
+        Returns:
+            Parsed JSON response
+        """
+        if not use_cache:
+            return self._parse_json(self._make_request('GET', endpoint, params=params))
+        
+        key = (endpoint, frozenset((params or {}).items()))
+        cached = self._etag_cache.get(key)
+        
+        headers = None
+        if cached:
+            validators = cached[0]
+            headers = {}
+            if 'ETag' in validators:
+                headers['If-None-Match'] = validators['ETag']
+            if 'Last-Modified' in validators:
+                headers['If-Modified-Since'] = validators['Last-Modified']
+        
+        response = self._make_request('GET', endpoint, params=params, headers=headers)
+        
+        if response.status_code == 304 and cached:
+            logger.debug(f"Not modified, using cached response for {endpoint}")
+            return self._copy_cached(cached[1])
+        
+        data = self._parse_json(response)
+        validators = {
+            name: response.headers[name]
+            for name in ('ETag', 'Last-Modified')
+            if name in response.headers
+        }
+        if validators:
+            self._etag_cache[key] = (validators, data)
+            return self._copy_cached(data)
+        
+        self._etag_cache.pop(key, None)
+        return data
+    
+    @staticmethod
+    def _copy_cached(data: Any) -> Any:
+        """Shallow-copy a cached JSON body and its result list.
+        
+        Args:
+            data: Cached parsed JSON
+            
+        Returns:
+            Copy that callers may mutate without touching the cache
+        """
+        if isinstance(data, list):
+            return list(data)
+        if isinstance(data, dict):
+            copied = dict(data)
+            if isinstance(copied.get('results'), list):
+                copied['results'] = list(copied['results'])
+            return copied
+        return data
+    
+    def _doc_url(self, document_id: int) -> str:
+        """Build the absolute URL of a single document.
+        
+        Args:
+            document_id: Document ID
+            
+        Returns:
+            Absolute document URL
+        """
+        return self._documents_prefix + str(document_id) + '/'
+    
+    def _get_all_pages(self, get_page: Any) -> List[Dict[str, Any]]:
+        """Collect all results of a paginated reference endpoint.
+        
+        Requests MAX_PAGE_SIZE items per page so the whole table normally
+        arrives in a single round trip. If the server caps the page size,
+        the first page reveals the count and the remaining pages are
+        requested concurrently, bounded by the connection pool size.
+        
+        Args:
+            get_page: Paginated getter accepting page and page_size
+            
+        Returns:
+            List of all result dictionaries in page order
+        """
+        first_page = get_page(page=1, page_size=self.MAX_PAGE_SIZE)
+        results: List[Dict[str, Any]] = list(first_page['results'])
+        if not first_page['next'] or not results:
+            return results
+        
+        # The server's page size is the length of the (full) first page
+        page_count = math.ceil(first_page['count'] / len(results))
+        max_workers = max(1, min(self.pool_maxsize, page_count - 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = executor.map(
+                lambda page: get_page(page=page, page_size=self.MAX_PAGE_SIZE),
+                range(2, page_count + 1)
+            )
+            for data in pages:
+                results.extend(data['results'])
+        
+        return results
+    
     # Document operations
     
     def get_documents(
@@ -332,11 +690,8 @@ class PaperlessApiClient:
         # Add any additional filters
         params.update(filters)
         
-        # CRITICAL: Force JSON response (must be AFTER update to not get overwritten!)
-        params['format'] = 'json'
-        
         response = self._make_request('GET', '/documents/', params=params)
-        return response.json()
+        return self._parse_json(response)
     
     def get_documents_generator(
         self,
@@ -354,23 +709,75 @@ class PaperlessApiClient:
         Yields:
             Individual document dictionaries
         """
-        page = 1
+        params: Optional[Dict[str, Any]] = {'page': 1, 'page_size': page_size, **filters}
+        if ordering:
+            params['ordering'] = ordering
+        url = self._documents_prefix
         
         while True:
-            data = self.get_documents(
-                page=page,
-                page_size=page_size,
-                ordering=ordering,
-                **filters
-            )
+            if IJSON_AVAILABLE:
+                # Parse each page incrementally instead of buffering it
+                response = self._make_request_absolute('GET', url, params=params, stream=True)
+                next_url = yield from self._stream_results(response)
+            else:
+                data = self._parse_json(self._make_request_absolute('GET', url, params=params))
+                yield from data['results']
+                next_url = data['next']
             
-            for document in data['results']:
-                yield document
-            
-            if not data['next']:
+            if not next_url:
                 break
             
-            page += 1
+            # Follow the server's pagination cursor. Only its query string is
+            # reused so requests (and the token) stay on the configured base URL.
+            url = self._documents_prefix + '?' + urlparse(next_url).query
+            params = None
+    
+    def _stream_results(self, response: requests.Response) -> Generator[Dict[str, Any], None, Optional[str]]:
+        """Yield items of a paginated response while it is being received.
+        
+        Args:
+            response: Streamed response of a paginated endpoint
+            
+        Yields:
+            Individual result dictionaries
+            
+        Returns:
+            URL of the next page, or None on the last page
+            
+        Raises:
+            PaperlessTimeoutError: If the server stops sending mid-body
+            PaperlessConnectionError: If the connection breaks mid-body
+            PaperlessAPIError: If the body is truncated or not valid JSON
+        """
+        next_url = None
+        builder = None
+        
+        # Let urllib3 undo any Content-Encoding before ijson reads the body
+        response.raw.decode_content = True
+        try:
+            for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                if prefix == 'next':
+                    next_url = value
+                elif prefix == 'results.item' and event == 'start_map':
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif builder is not None:
+                    builder.event(event, value)
+                    if prefix == 'results.item' and event == 'end_map':
+                        yield builder.value
+                        builder = None
+        # The body is read lazily here, after _make_request has returned, so
+        # transport and parse errors need the same mapping it applies
+        except ReadTimeoutError as e:
+            raise PaperlessTimeoutError(self.timeout, user_message=f"Read timed out while streaming: {e}")
+        except Urllib3HTTPError as e:
+            raise PaperlessConnectionError(response.url, original_error=e)
+        except ijson.JSONError as e:
+            raise PaperlessAPIError(f"Invalid JSON in paginated response: {e}")
+        finally:
+            response.close()
+        
+        return next_url
     
     def get_document(self, document_id: int) -> Dict[str, Any]:
         """Get single document by ID.
@@ -381,8 +788,8 @@ class PaperlessApiClient:
         Returns:
             Document dictionary
         """
-        response = self._make_request('GET', f'/documents/{document_id}/')
-        return response.json()
+        response = self._make_request_absolute('GET', self._doc_url(document_id))
+        return self._parse_json(response)
     
     def update_document(
         self,
@@ -398,8 +805,8 @@ class PaperlessApiClient:
         Returns:
             Updated document dictionary
         """
-        response = self._make_request('PATCH', f'/documents/{document_id}/', json_data=data)
-        return response.json()
+        response = self._make_request_absolute('PATCH', self._doc_url(document_id), json_data=data)
+        return self._parse_json(response)
     
     def delete_document(self, document_id: int) -> None:
         """Delete a document.
@@ -407,7 +814,40 @@ class PaperlessApiClient:
         Args:
             document_id: Document ID
         """
-        self._make_request('DELETE', f'/documents/{document_id}/')
+        self._make_request_absolute('DELETE', self._doc_url(document_id))
+    
+    def bulk_edit(
+        self,
+        document_ids: List[int],
+        method: str,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Apply one operation to many documents in a single request.
+        
+        Prefer this over calling update_document in a loop when the same
+        change applies to every document.
+        
+        Args:
+            document_ids: IDs of the documents to edit
+            method: Paperless bulk operation, e.g. 'set_correspondent',
+                'set_document_type', 'add_tag', 'remove_tag', 'modify_tags'
+                or 'delete'
+            parameters: Operation parameters, e.g. {'correspondent': 5} or
+                {'add_tags': [1], 'remove_tags': [2]}
+            
+        Returns:
+            Server response, usually {'result': 'OK'}
+        """
+        response = self._make_request(
+            'POST',
+            '/documents/bulk_edit/',
+            json_data={
+                'documents': list(document_ids),
+                'method': method,
+                'parameters': parameters or {},
+            },
+        )
+        return self._parse_json(response)
     
     def upload_document(
         self,
@@ -434,8 +874,6 @@ class PaperlessApiClient:
             Created document dictionary
         """
         with open(file_path, 'rb') as f:
-            files = {'document': (file_path.name, f, 'application/octet-stream')}
-            
             data = {}
             if title:
                 data['title'] = title
@@ -450,8 +888,58 @@ class PaperlessApiClient:
             if custom_fields:
                 data['custom_fields'] = custom_fields
             
-            response = self._make_request('POST', '/documents/post_document/', data=data, files=files)
-            return response.json()
+            # The session does not resend uploads (see _create_session), so
+            # transient server errors are retried here with a fresh body
+            for attempt in range(self.max_retries + 1):
+                f.seek(0)
+                try:
+                    response = self._post_document((file_path.name, f, 'application/octet-stream'), data)
+                    break
+                except (PaperlessAPIError, PaperlessRateLimitError) as e:
+                    if attempt == self.max_retries or e.status_code not in self.RETRY_STATUSES:
+                        raise
+                    delay = getattr(e, 'retry_after', None) or 2 ** attempt
+                    logger.warning(
+                        "Upload of %s failed with HTTP %s, retrying in %ss",
+                        file_path.name, e.status_code, delay,
+                    )
+                    time.sleep(delay)
+            return self._parse_json(response)
+    
+    def _post_document(self, document: Tuple[str, Any, str], data: Dict[str, Any]) -> requests.Response:
+        """Send one upload attempt to the post_document endpoint.
+        
+        Args:
+            document: (filename, file object, content type) positioned at the start
+            data: Form fields sent along with the file
+            
+        Returns:
+            HTTP response object
+        """
+        if TOOLBELT_AVAILABLE:
+            # Stream the multipart body from disk instead of building it in memory
+            fields = [
+                (name, str(item))
+                for name, value in data.items()
+                for item in (value if isinstance(value, list) else [value])
+            ]
+            fields.append(('document', document))
+            encoder = MultipartEncoder(fields=fields)
+            return self._make_request_absolute(
+                'POST',
+                self._upload_url,
+                data=encoder,
+                headers={'Content-Type': encoder.content_type},
+            )
+        # Drop the session's JSON Content-Type so requests sets the
+        # multipart boundary itself
+        return self._make_request_absolute(
+            'POST',
+            self._upload_url,
+            data=data,
+            files={'document': document},
+            headers={'Content-Type': None},
+        )
     
     # Correspondent operations
     
@@ -466,9 +954,15 @@ class PaperlessApiClient:
             Paginated response dictionary
         """
         params = {'page': page, 'page_size': page_size}
-        params['format'] = 'json'  # Force JSON response
-        response = self._make_request('GET', '/correspondents/', params=params)
-        return response.json()
+        return self._get_json('/correspondents/', params=params)
+    
+    def get_all_correspondents(self) -> List[Dict[str, Any]]:
+        """Get all correspondents (unpaginated).
+        
+        Returns:
+            List of all correspondent dictionaries
+        """
+        return self._get_all_pages(self.get_correspondents)
     
     def get_correspondent(self, correspondent_id: int) -> Dict[str, Any]:
         """Get single correspondent by ID.
@@ -480,7 +974,7 @@ class PaperlessApiClient:
             Correspondent dictionary
         """
         response = self._make_request('GET', f'/correspondents/{correspondent_id}/')
-        return response.json()
+        return self._parse_json(response)
     
     def create_correspondent(self, name: str, **kwargs: Any) -> Dict[str, Any]:
         """Create a new correspondent.
@@ -494,7 +988,7 @@ class PaperlessApiClient:
         """
         data = {'name': name, **kwargs}
         response = self._make_request('POST', '/correspondents/', json_data=data)
-        return response.json()
+        return self._parse_json(response)
     
     def update_correspondent(
         self,
@@ -511,7 +1005,7 @@ class PaperlessApiClient:
             Updated correspondent dictionary
         """
         response = self._make_request('PATCH', f'/correspondents/{correspondent_id}/', json_data=data)
-        return response.json()
+        return self._parse_json(response)
     
     # Tag operations
     
@@ -526,9 +1020,7 @@ class PaperlessApiClient:
             Paginated response dictionary
         """
         params = {'page': page, 'page_size': page_size}
-        params['format'] = 'json'  # Force JSON response
-        response = self._make_request('GET', '/tags/', params=params)
-        return response.json()
+        return self._get_json('/tags/', params=params)
     
     def get_all_tags(self) -> List[Dict[str, Any]]:
         """Get all tags (unpaginated).
@@ -536,19 +1028,7 @@ class PaperlessApiClient:
         Returns:
             List of all tag dictionaries
         """
-        all_tags = []
-        page = 1
-        
-        while True:
-            data = self.get_tags(page=page, page_size=100)
-            all_tags.extend(data['results'])
-            
-            if not data['next']:
-                break
-            
-            page += 1
-        
-        return all_tags
+        return self._get_all_pages(self.get_tags)
     
     def get_tag(self, tag_id: int) -> Dict[str, Any]:
         """Get single tag by ID.
@@ -560,7 +1040,7 @@ class PaperlessApiClient:
             Tag dictionary
         """
         response = self._make_request('GET', f'/tags/{tag_id}/')
-        return response.json()
+        return self._parse_json(response)
     
     def create_tag(self, name: str, color: Optional[str] = None, **kwargs: Any) -> Dict[str, Any]:
         """Create a new tag.
@@ -579,7 +1059,7 @@ class PaperlessApiClient:
         data.update(kwargs)
         
         response = self._make_request('POST', '/tags/', json_data=data)
-        return response.json()
+        return self._parse_json(response)
     
     def update_tag(self, tag_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update tag.
@@ -592,7 +1072,7 @@ class PaperlessApiClient:
             Updated tag dictionary
         """
         response = self._make_request('PATCH', f'/tags/{tag_id}/', json_data=data)
-        return response.json()
+        return self._parse_json(response)
     
     def delete_tag(self, tag_id: int) -> None:
         """Delete a tag.
@@ -615,9 +1095,15 @@ class PaperlessApiClient:
             Paginated response dictionary
         """
         params = {'page': page, 'page_size': page_size}
-        params['format'] = 'json'  # Force JSON response
-        response = self._make_request('GET', '/document_types/', params=params)
-        return response.json()
+        return self._get_json('/document_types/', params=params)
+    
+    def get_all_document_types(self) -> List[Dict[str, Any]]:
+        """Get all document types (unpaginated).
+        
+        Returns:
+            List of all document type dictionaries
+        """
+        return self._get_all_pages(self.get_document_types)
     
     def get_document_type(self, document_type_id: int) -> Dict[str, Any]:
         """Get single document type by ID.
@@ -629,7 +1115,7 @@ class PaperlessApiClient:
             Document type dictionary
         """
         response = self._make_request('GET', f'/document_types/{document_type_id}/')
-        return response.json()
+        return self._parse_json(response)
     
     def create_document_type(self, name: str, **kwargs: Any) -> Dict[str, Any]:
         """Create a new document type.
@@ -643,7 +1129,7 @@ class PaperlessApiClient:
         """
         data = {'name': name, **kwargs}
         response = self._make_request('POST', '/document_types/', json_data=data)
-        return response.json()
+        return self._parse_json(response)
     
     # Custom field operations
     
@@ -653,8 +1139,7 @@ class PaperlessApiClient:
         Returns:
             List of custom field dictionaries
         """
-        response = self._make_request('GET', '/custom_fields/')
-        return response.json()['results']
+        return self._get_json('/custom_fields/')['results']
     
     def get_custom_field(self, field_id: int) -> Dict[str, Any]:
         """Get single custom field by ID.
@@ -666,7 +1151,7 @@ class PaperlessApiClient:
             Custom field dictionary
         """
         response = self._make_request('GET', f'/custom_fields/{field_id}/')
-        return response.json()
+        return self._parse_json(response)
     
     # Search operations
     
@@ -696,13 +1181,16 @@ class PaperlessApiClient:
         params.update(filters)
         
         response = self._make_request('GET', '/documents/', params=params)
-        return response.json()
+        return self._parse_json(response)
     
     # Utility methods
     
+    @_ttl_cached(10.0)
     def test_connection(self) -> bool:
         """Test connection to Paperless API.
         
+        A successful result is cached for 10 seconds; failures are not.
+        
         Returns:
             True if connection successful, False otherwise
         """
@@ -713,7 +1201,7 @@ class PaperlessApiClient:
             # Also verify we get JSON response
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = self._parse_json(response)
                     # Check for expected JSON structure
                     if 'results' in data or 'count' in data:
                         logger.info("Connection test successful - JSON response received")
@@ -746,7 +1234,7 @@ class PaperlessApiClient:
                 'headers': dict(response.headers),
                 'content_type': response.headers.get('Content-Type', ''),
                 'is_json': 'application/json' in response.headers.get('Content-Type', ''),
-                'data': response.json() if 'application/json' in response.headers.get('Content-Type', '') else response.text[:500]
+                'data': self._parse_json(response) if 'application/json' in response.headers.get('Content-Type', '') else response.text[:500]
             }
         except Exception as e:
             return {
@@ -761,24 +1249,39 @@ class PaperlessApiClient:
     def get_statistics(self) -> Dict[str, Any]:
         """Get Paperless statistics.
         
+        Not cached: the counts change with every upload or edit.
+        
         Returns:
             Statistics dictionary
         """
         response = self._make_request('GET', '/statistics/')
-        return response.json()
+        return self._parse_json(response)
     
+    @_ttl_cached(30.0)
     def get_server_info(self) -> Dict[str, Any]:
         """Get server information.
         
+        The result is cached for 30 seconds.
+        
         Returns:
             Server info dictionary
         """
         response = self._make_request('GET', '/ui_settings/')
-        return response.json()
+        return self._parse_json(response)
     
     def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the HTTP session.
+        
+        Also drops the client from the get_client() registry, so the next
+        get_client() call builds a fresh one.
+        """
+        with _client_cache_lock:
+            for key, cached in list(_CLIENT_CACHE.items()):
+                if cached is self:
+                    del _CLIENT_CACHE[key]
         self.session.close()
+        self._etag_cache.clear()
+        self._ttl_cache.clear()
         logger.debug("Closed Paperless API client session")
     
     def __enter__(self) -> 'PaperlessApiClient':
@@ -787,4 +1290,37 @@ class PaperlessApiClient:
     
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Context manager exit."""
-        self.close()
\ No newline at end of file
+        self.close()
+
+
+# Shared clients keyed by (base_url, token fingerprint)
+_CLIENT_CACHE: Dict[Tuple[str, str], PaperlessApiClient] = {}
+_client_cache_lock = threading.Lock()
+
+
+def get_client(base_url: Optional[str] = None, api_token: Optional[str] = None) -> PaperlessApiClient:
+    """Get or create the shared API client for a server and token.
+    
+    Reusing one client per server keeps its connection pool, and with it
+    the kept-alive TCP/TLS connections, across callers.
+    
+    Args:
+        base_url: Base URL for Paperless NGX API (defaults to settings)
+        api_token: API authentication token (defaults to settings)
+        
+    Returns:
+        Shared PaperlessApiClient instance
+    """
+    settings = get_settings()
+    base_url = (base_url or settings.paperless_base_url).rstrip('/')
+    api_token = api_token or settings.get_secret_value('paperless_api_token') or ''
+    # Key on a fingerprint so the registry does not hold the raw token
+    key = (base_url, hashlib.sha256(api_token.encode('utf-8')).hexdigest()[:16])
+    
+    with _client_cache_lock:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = PaperlessApiClient(base_url=base_url, api_token=api_token or None)
+            _CLIENT_CACHE[key] = client
+    
+    return client
@@ -6,24 +6,45 @@ platform and return the appropriate platform service implementation.
 
 from __future__ import annotations
 
+import os
 import platform
-from typing import Optional
+import sys
+from functools import cache
 
 from .interfaces import PlatformService
 from .posix_platform import PosixPlatform
 from .windows_platform import WindowsPlatform
 
 
-# Singleton instance
-_platform_service: Optional[PlatformService] = None
+# Compiled into the interpreter, unlike platform.system() which goes through
+# uname() (and a subprocess on some Windows versions)
+_SYS_PLATFORM = sys.platform
 
+# sys.platform prefixes mapped to platform.system() names
+_PLATFORM_NAMES = (
+    ("win32", "Windows"),
+    ("darwin", "Darwin"),
+    ("linux", "Linux"),
+    ("freebsd", "FreeBSD"),
+    ("openbsd", "OpenBSD"),
+    ("netbsd", "NetBSD"),
+)
 
+
+@cache
 def detect_platform() -> str:
     """Detect the current operating system platform.
     
+    The platform cannot change at runtime, so the result is computed once
+    per process.
+    
     Returns:
         Platform name ('Windows', 'Linux', 'Darwin', etc.)
     """
+    for prefix, name in _PLATFORM_NAMES:
+        if _SYS_PLATFORM.startswith(prefix):
+            return name
+    # Rare platforms (cygwin, aix, ...) keep platform.system()'s naming
     return platform.system()
 
 
@@ -46,7 +67,6 @@ def create_platform_service() -> PlatformService:
     else:
         # Fallback to POSIX for unknown Unix-like systems
         # This is safer than failing completely
-        import os
         if hasattr(os, 'posix'):
             return PosixPlatform()
         else:
@@ -56,8 +76,12 @@ def create_platform_service() -> PlatformService:
             )
 
 
+# Singleton instance, created at import since there is one platform per process
+_platform_service: PlatformService = create_platform_service()
+
+
 def get_platform_service() -> PlatformService:
-    """Get or create singleton platform service instance.
+    """Get the singleton platform service instance.
     
     This function ensures only one platform service instance exists
     throughout the application lifecycle.
@@ -65,23 +89,19 @@ def get_platform_service() -> PlatformService:
     Returns:
         Singleton platform service instance
     """
-    global _platform_service
-    
-    if _platform_service is None:
-        _platform_service = create_platform_service()
-    
     return _platform_service
 
 
 def reset_platform_service() -> None:
-    """Reset the singleton platform service instance.
+    """Replace the singleton platform service with a fresh instance.
     
     This is mainly useful for testing purposes.
     """
     global _platform_service
-    _platform_service = None
+    _platform_service = create_platform_service()
 
 
+@cache
 def is_windows() -> bool:
     """Quick check if running on Windows.
     
@@ -91,6 +111,7 @@ def is_windows() -> bool:
     return detect_platform() == "Windows"
 
 
+@cache
 def is_linux() -> bool:
     """Quick check if running on Linux.
     
@@ -100,6 +121,7 @@ def is_linux() -> bool:
     return detect_platform() == "Linux"
 
 
+@cache
 def is_macos() -> bool:
     """Quick check if running on macOS.
     
@@ -109,13 +131,13 @@ def is_macos() -> bool:
     return detect_platform() == "Darwin"
 
 
+@cache
 def is_posix() -> bool:
     """Quick check if running on POSIX-compliant system.
     
     Returns:
         True if running on POSIX system, False otherwise
     """
-    import os
     return hasattr(os, 'posix') or detect_platform() != "Windows"
 
 
@@ -123,16 +145,25 @@ def get_platform_info() -> dict:
     """Get detailed platform information.
     
     Returns:
-        Dictionary with platform details
+        Dictionary with platform details (a fresh copy on every call)
     """
-    import sys
+    return dict(_platform_snapshot())
+
+
+@cache
+def _platform_snapshot() -> dict:
+    """Collect platform details once per process.
     
+    Returns:
+        Dictionary with platform details
+    """
+    uname = platform.uname()
     return {
-        "system": platform.system(),
-        "release": platform.release(),
-        "version": platform.version(),
-        "machine": platform.machine(),
-        "processor": platform.processor(),
+        "system": uname.system,
+        "release": uname.release,
+        "version": uname.version,
+        "machine": uname.machine,
+        "processor": uname.processor,
         "python_version": sys.version,
         "python_implementation": platform.python_implementation(),
         "is_64bit": sys.maxsize > 2**32,
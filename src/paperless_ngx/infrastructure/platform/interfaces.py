@@ -8,12 +8,16 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Tuple, List, Any
+from typing import Optional, Sequence, Tuple, Any
 import tempfile
 
 
 class PlatformService(ABC):
-    """Abstract interface for platform-specific operations."""
+    """Abstract interface for platform-specific operations.
+    
+    Implementations may satisfy the constant properties below with plain
+    class attributes.
+    """
     
     @property
     @abstractmethod
@@ -106,7 +110,9 @@ class PlatformService(ABC):
     def normalize_path(self, path: Path) -> Path:
         """Normalize path for the platform.
         
-        Handles case sensitivity, UNC paths on Windows, etc.
+        Makes the path absolute and removes redundant separators and
+        up-level references lexically, without touching the filesystem.
+        Use resolve_path when symlinks must be resolved.
         
         Args:
             path: Path to normalize
@@ -116,6 +122,20 @@ class PlatformService(ABC):
         """
         pass
     
+    def resolve_path(self, path: Path) -> Path:
+        """Resolve symlinks and make path absolute.
+        
+        Unlike normalize_path this stats every path component, so keep it
+        out of bulk loops unless symlink resolution is actually needed.
+        
+        Args:
+            path: Path to resolve
+            
+        Returns:
+            Resolved absolute path
+        """
+        return path.resolve()
+    
     @abstractmethod
     def create_temp_file(
         self, 
@@ -171,11 +191,11 @@ class PlatformService(ABC):
         pass
     
     @abstractmethod
-    def get_reserved_names(self) -> List[str]:
-        """Get list of reserved filenames for the platform.
+    def get_reserved_names(self) -> Sequence[str]:
+        """Get reserved filenames for the platform.
         
         Returns:
-            List of reserved names (e.g., 'CON', 'PRN' on Windows)
+            Immutable sequence of reserved names (e.g., 'CON', 'PRN' on Windows)
         """
         pass
     
@@ -9,51 +9,93 @@ from __future__ import annotations
 import os
 import platform
 import tempfile
+from functools import cache
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import ClassVar, Optional, Sequence, Tuple
 
 from .interfaces import PlatformService
 
 
+def _truncate_utf8(data: bytes, limit: int) -> str:
+    """Cut UTF-8 bytes to at most `limit` bytes without splitting a character.
+    
+    Args:
+        data: UTF-8 encoded text
+        limit: Maximum number of bytes
+        
+    Returns:
+        Decoded text of at most `limit` bytes
+    """
+    if len(data) <= limit:
+        return data.decode('utf-8')
+    end = limit
+    # Back off while the first dropped byte continues the kept character
+    while end > 0 and data[end] & 0xC0 == 0x80:
+        end -= 1
+    return data[:end].decode('utf-8')
+
+
+@cache
+def _probe_case_sensitivity(test_dir: Path) -> bool:
+    """Check once per directory whether its filesystem is case-sensitive.
+    
+    Creates two files whose names differ only in case and compares inodes.
+    
+    Args:
+        test_dir: Writable directory on the filesystem to probe
+        
+    Returns:
+        True if the filesystem is case-sensitive (also if the probe fails)
+    """
+    test_file_lower = test_dir / "test_case_sensitivity"
+    test_file_upper = test_dir / "TEST_CASE_SENSITIVITY"
+    
+    try:
+        test_file_lower.touch()
+        test_file_upper.touch()
+        # If both exist as separate files, filesystem is case-sensitive
+        result = test_file_lower.stat().st_ino != test_file_upper.stat().st_ino
+        test_file_lower.unlink(missing_ok=True)
+        test_file_upper.unlink(missing_ok=True)
+        return result
+    except OSError:
+        # Assume case-sensitive if test fails
+        return True
+
+
 class PosixPlatform(PlatformService):
     """POSIX-specific platform service implementation."""
     
+    # Drop null bytes and replace path separators in one pass
+    _SANITIZE_TABLE = {0: None, ord("/"): "_"}
+    
+    # POSIX handles auto-delete of temporary files well
+    _delete_default = True
+    
+    # Platform constants as plain class attributes (no property dispatch)
+    is_windows: ClassVar[bool] = False
+    is_posix: ClassVar[bool] = True
+    path_separator: ClassVar[str] = "/"
+    line_separator: ClassVar[str] = "\n"
+    
     def __init__(self):
         """Initialize POSIX platform service."""
         self._system = platform.system()
+        # gettempdir() scans env vars and probes directories; do it once
+        self._temp_dir = Path(tempfile.gettempdir())
     
     @property
     def name(self) -> str:
         """Get platform name."""
         return self._system
     
-    @property
-    def is_windows(self) -> bool:
-        """Check if running on Windows."""
-        return False
-    
-    @property
-    def is_posix(self) -> bool:
-        """Check if running on POSIX-compliant system."""
-        return True
-    
-    @property
-    def path_separator(self) -> str:
-        """Get platform-specific path separator."""
-        return "/"
-    
-    @property
-    def line_separator(self) -> str:
-        """Get platform-specific line separator."""
-        return "\n"
-    
     def get_temp_dir(self) -> Path:
         """Get POSIX temporary directory.
         
         Returns:
             Path to temporary directory (usually /tmp or /var/tmp)
         """
-        return Path(tempfile.gettempdir())
+        return self._temp_dir
     
     def get_user_data_dir(self, app_name: str) -> Path:
         """Get POSIX user data directory.
@@ -102,29 +144,22 @@ class PosixPlatform(PlatformService):
         Returns:
             Sanitized filename safe for POSIX
         """
-        # Remove null bytes
-        filename = filename.replace("\x00", "")
+        # Remove null bytes and replace path separators
+        filename = filename.translate(self._SANITIZE_TABLE)
         
-        # Replace path separators
-        filename = filename.replace("/", "_")
-        
-        # Remove leading dots (hidden files) unless that's all there is
-        while filename.startswith(".") and len(filename) > 1:
-            filename = filename[1:]
+        # Remove leading dots (hidden files); a name of only dots keeps one
+        filename = filename.lstrip(".") or filename[:1]
         
         # Limit length (most filesystems support 255 bytes)
         # Account for UTF-8 encoding where characters can be multiple bytes
-        while len(filename.encode('utf-8')) > 255:
-            # Remove characters from the end, preserving extension if possible
-            if "." in filename:
-                name, ext = filename.rsplit(".", 1)
-                if len(name) > 1:
-                    name = name[:-1]
-                    filename = f"{name}.{ext}"
-                else:
-                    filename = filename[:-1]
-            else:
-                filename = filename[:-1]
+        encoded = filename.encode('utf-8')
+        if len(encoded) > 255:
+            # Cut the name, preserving the extension if possible
+            name, dot, ext = filename.rpartition(".")
+            suffix = dot + ext
+            budget = 255 - len(suffix.encode('utf-8'))
+            name = _truncate_utf8(name.encode('utf-8'), budget) if dot and budget > 0 else ""
+            filename = name + suffix if name else _truncate_utf8(encoded, 255)
         
         # Ensure filename is not empty
         if not filename or filename == ".":
@@ -141,7 +176,7 @@ class PosixPlatform(PlatformService):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        path_str = str(path)
+        path_str = os.fspath(path)
         
         # Check for null bytes
         if "\x00" in path_str:
@@ -153,31 +188,40 @@ class PosixPlatform(PlatformService):
                 return False, f"Path component too long: {component}"
         
         # Check total path length (typically 4096 bytes max)
-        if len(path_str.encode('utf-8')) > 4096:
-            return False, f"Path too long ({len(path_str.encode('utf-8'))} > 4096 bytes)"
+        path_bytes = len(path_str.encode('utf-8'))
+        if path_bytes > 4096:
+            return False, f"Path too long ({path_bytes} > 4096 bytes)"
         
         return True, None
     
     def normalize_path(self, path: Path) -> Path:
-        """Normalize path for POSIX.
+        """Normalize path for POSIX without touching the filesystem.
         
         Args:
             path: Path to normalize
             
         Returns:
-            Normalized path
+            Normalized absolute path
         """
-        # Resolve symlinks and make absolute
+        # Remove redundant separators and up-level references
+        return Path(os.path.normpath(path.absolute()))
+    
+    def resolve_path(self, path: Path) -> Path:
+        """Resolve symlinks and make path absolute for POSIX.
+        
+        Args:
+            path: Path to resolve
+            
+        Returns:
+            Resolved absolute path
+        """
+        # Resolve symlinks and make absolute; the result is already canonical
         try:
-            path = path.resolve()
+            return path.resolve()
         except (OSError, RuntimeError):
             # If resolve fails (broken symlink, etc.), just make absolute
-            path = path.absolute()
-        
-        # Remove redundant separators and up-level references
-        path = Path(os.path.normpath(str(path)))
-        
-        return path
+            # and remove redundant separators and up-level references
+            return self.normalize_path(path)
     
     def create_temp_file(
         self, 
@@ -195,21 +239,16 @@ class PosixPlatform(PlatformService):
         Returns:
             Temporary file wrapper
         """
+        kwargs = {
+            'suffix': suffix,
+            'prefix': prefix,
+            'delete': self._delete_default,
+        }
         if text:
-            return tempfile.NamedTemporaryFile(
-                mode='w+',
-                suffix=suffix,
-                prefix=prefix,
-                delete=True,  # POSIX handles auto-delete well
-                encoding='utf-8'
-            )
+            kwargs.update(mode='w+', encoding='utf-8')
         else:
-            return tempfile.NamedTemporaryFile(
-                mode='w+b',
-                suffix=suffix,
-                prefix=prefix,
-                delete=True
-            )
+            kwargs['mode'] = 'w+b'
+        return tempfile.NamedTemporaryFile(**kwargs)
     
     def create_temp_dir(
         self,
@@ -241,35 +280,21 @@ class PosixPlatform(PlatformService):
         Returns:
             True for most POSIX filesystems (can be overridden for macOS)
         """
-        # macOS can have case-insensitive filesystems
+        # macOS can have case-insensitive filesystems; probe the temp dir
+        # once, the answer cannot change while the process runs
         if self._system == "Darwin":
-            # Test by creating temp files with different cases
-            test_dir = self.get_temp_dir()
-            test_file_lower = test_dir / "test_case_sensitivity"
-            test_file_upper = test_dir / "TEST_CASE_SENSITIVITY"
-            
-            try:
-                test_file_lower.touch()
-                test_file_upper.touch()
-                # If both exist as separate files, filesystem is case-sensitive
-                result = test_file_lower.stat().st_ino != test_file_upper.stat().st_ino
-                test_file_lower.unlink(missing_ok=True)
-                test_file_upper.unlink(missing_ok=True)
-                return result
-            except:
-                # Assume case-sensitive if test fails
-                return True
+            return _probe_case_sensitivity(self.get_temp_dir())
         
         # Linux and other Unix systems are typically case-sensitive
         return True
     
-    def get_reserved_names(self) -> List[str]:
-        """Get list of reserved filenames for POSIX.
+    def get_reserved_names(self) -> Sequence[str]:
+        """Get reserved filenames for POSIX.
         
         Returns:
-            Empty list (POSIX has no reserved filenames like Windows)
+            Empty tuple (POSIX has no reserved filenames like Windows)
         """
-        return []
+        return ()
     
     def get_invalid_path_chars(self) -> str:
         """Get characters that are invalid in paths on POSIX.
@@ -9,7 +9,7 @@ from __future__ import annotations
 import os
 import tempfile
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import ClassVar, Optional, Sequence, Tuple
 import re
 
 from .interfaces import PlatformService
@@ -19,42 +19,41 @@ class WindowsPlatform(PlatformService):
     """Windows-specific platform service implementation."""
     
     # Windows reserved filenames
-    RESERVED_NAMES = {
+    RESERVED_NAMES = frozenset({
         "CON", "PRN", "AUX", "NUL",
         "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7", "COM8", "COM9",
         "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9"
-    }
+    })
+    
+    # Handed out by get_reserved_names() without allocating
+    _RESERVED_NAMES_TUPLE = tuple(sorted(RESERVED_NAMES))
     
     # Invalid characters in Windows filenames
     INVALID_CHARS = '<>:"|?*'
     
     # Additional invalid characters for paths (excludes : for drive letters)
     INVALID_PATH_CHARS = '<>"|?*'
+    _INVALID_PATH_RE = re.compile(f"[{re.escape(INVALID_PATH_CHARS)}]")
     
-    @property
-    def name(self) -> str:
-        """Get platform name."""
-        return "Windows"
-    
-    @property
-    def is_windows(self) -> bool:
-        """Check if running on Windows."""
-        return True
+    # Windows often has issues with auto-delete of open temporary files
+    _delete_default = False
     
-    @property
-    def is_posix(self) -> bool:
-        """Check if running on POSIX-compliant system."""
-        return False
+    # Platform constants as plain class attributes (no property dispatch)
+    name: ClassVar[str] = "Windows"
+    is_windows: ClassVar[bool] = True
+    is_posix: ClassVar[bool] = False
+    path_separator: ClassVar[str] = "\\"
+    line_separator: ClassVar[str] = "\r\n"
     
-    @property
-    def path_separator(self) -> str:
-        """Get platform-specific path separator."""
-        return "\\"
+    # Invalid and control characters (0-31) -> "_", applied in one pass
+    _SANITIZE_TABLE = str.maketrans(
+        dict.fromkeys(INVALID_CHARS + "".join(map(chr, range(32))), "_")
+    )
     
-    @property
-    def line_separator(self) -> str:
-        """Get platform-specific line separator."""
-        return "\r\n"
+    def __init__(self):
+        """Initialize Windows platform service."""
+        # gettempdir() scans env vars and probes directories; do it once
+        self._temp_dir = Path(tempfile.gettempdir())
     
     def get_temp_dir(self) -> Path:
         """Get Windows temporary directory.
@@ -62,8 +61,8 @@ class WindowsPlatform(PlatformService):
         Returns:
             Path to temporary directory (usually %TEMP%)
         """
-        # Use tempfile.gettempdir() for cross-platform compatibility
-        return Path(tempfile.gettempdir())
+        # Resolved once via tempfile.gettempdir() for cross-platform compatibility
+        return self._temp_dir
     
     def get_user_data_dir(self, app_name: str) -> Path:
         """Get Windows user data directory.
@@ -106,18 +105,14 @@ class WindowsPlatform(PlatformService):
         Returns:
             Sanitized filename safe for Windows
         """
-        # Remove invalid characters
-        for char in self.INVALID_CHARS:
-            filename = filename.replace(char, "_")
-        
-        # Remove control characters (0-31)
-        filename = "".join(char if ord(char) >= 32 else "_" for char in filename)
+        # Replace invalid and control characters
+        filename = filename.translate(self._SANITIZE_TABLE)
         
         # Remove trailing dots and spaces (Windows doesn't like them)
         filename = filename.rstrip(". ")
         
         # Check for reserved names
-        name_without_ext = filename.split(".")[0].upper()
+        name_without_ext = filename.partition(".")[0].upper()
         if name_without_ext in self.RESERVED_NAMES:
             filename = f"file_{filename}"
         
@@ -145,10 +140,12 @@ class WindowsPlatform(PlatformService):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        path_str = str(path)
+        path_str = os.fspath(path)
         
-        # Check for invalid characters (excluding : for drive letters)
-        if any(char in path_str.replace(":\\", "\\") for char in self.INVALID_PATH_CHARS):
+        # Check for invalid characters in one scan; the ? of an extended
+        # \\?\ prefix is not part of the path itself
+        tail = path_str[4:] if path_str.startswith("\\\\?\\") else path_str
+        if self._INVALID_PATH_RE.search(tail):
             return False, f"Path contains invalid characters: {self.INVALID_PATH_CHARS}"
         
         # Check path length (260 chars limit without extended path)
@@ -158,7 +155,7 @@ class WindowsPlatform(PlatformService):
         # Check for reserved names in any path component
         parts = path.parts
         for part in parts:
-            name_without_ext = part.split(".")[0].upper()
+            name_without_ext = part.partition(".")[0].upper()
             if name_without_ext in self.RESERVED_NAMES:
                 return False, f"Path contains reserved name: {part}"
         
@@ -179,8 +176,9 @@ class WindowsPlatform(PlatformService):
         Returns:
             Normalized path
         """
-        # Convert to absolute path
-        path = path.resolve()
+        # Convert to absolute path lexically; resolve() would stat every
+        # component (see resolve_path)
+        path = Path(os.path.normpath(path.absolute()))
         
         # Handle case-insensitive filesystem
         # Windows paths are case-insensitive but case-preserving
@@ -204,23 +202,17 @@ class WindowsPlatform(PlatformService):
         Returns:
             Temporary file wrapper
         """
-        # Ensure text files use UTF-8 encoding
+        kwargs = {
+            'suffix': suffix,
+            'prefix': prefix,
+            'delete': self._delete_default,
+        }
         if text:
-            return tempfile.NamedTemporaryFile(
-                mode='w+',
-                suffix=suffix,
-                prefix=prefix,
-                delete=False,  # Windows often has issues with auto-delete
-                encoding='utf-8',
-                newline=''  # Universal newline mode
-            )
+            # Ensure text files use UTF-8 encoding, universal newline mode
+            kwargs.update(mode='w+', encoding='utf-8', newline='')
         else:
-            return tempfile.NamedTemporaryFile(
-                mode='w+b',
-                suffix=suffix,
-                prefix=prefix,
-                delete=False
-            )
+            kwargs['mode'] = 'w+b'
+        return tempfile.NamedTemporaryFile(**kwargs)
     
     def create_temp_dir(
         self,
@@ -255,13 +247,13 @@ class WindowsPlatform(PlatformService):
         """
         return False
     
-    def get_reserved_names(self) -> List[str]:
-        """Get list of reserved filenames for Windows.
+    def get_reserved_names(self) -> Sequence[str]:
+        """Get reserved filenames for Windows.
         
         Returns:
-            List of reserved names
+            Tuple of reserved names
         """
-        return list(self.RESERVED_NAMES)
+        return self._RESERVED_NAMES_TUPLE
     
     def get_invalid_path_chars(self) -> str:
         """Get characters that are invalid in paths on Windows.
@@ -282,7 +274,15 @@ class WindowsPlatform(PlatformService):
         Returns:
             Fixed path
         """
-        path_str = str(path.resolve())
+        path_str = os.fspath(path)
+        
+        # Already prefixed, or absolute and short enough: nothing to do.
+        # Relative paths may grow past the limit once made absolute.
+        if path_str.startswith("\\\\?\\") or (os.path.isabs(path_str) and len(path_str) <= 260):
+            return path
+        
+        # The \\?\ prefix needs an absolute path, not a symlink-free one
+        path_str = os.path.abspath(path_str)
         
         # Only fix if path is long and doesn't already have the prefix
         if len(path_str) > 260 and not path_str.startswith("\\\\?\\"):
@@ -6,32 +6,67 @@ document processing, and API interactions.
 
 from __future__ import annotations
 
-import argparse
 import json
 import logging
+import os
 import sys
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TextIO, Tuple, Union
 
-from ...application.services import EmailFetcherService
-from ...application.use_cases import AttachmentProcessor
-from ...infrastructure.email import load_email_config_from_env
-from ...infrastructure.config import get_settings
-from ...infrastructure.logging import setup_logging
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Application and infrastructure modules are imported inside main() so that
+# --help and argument errors do not pay for loading them. argparse itself is
+# only needed for --help and command lines _parse_argv() does not handle.
+if TYPE_CHECKING:
+    import argparse
+    
+    from ...application.services import EmailFetcherService
+    from ...infrastructure.email import EmailSettings
+    
+    Arguments = Union[argparse.Namespace, SimpleNamespace]
 
 logger = logging.getLogger(__name__)
 
+# Parallel IMAP connections allowed per server (many servers limit
+# connections per client IP)
+_MAX_CONNECTIONS_PER_HOST = 2
 
-def setup_parser() -> argparse.ArgumentParser:
-    """Set up command-line argument parser.
+
+def _build_root_parser(lazy: bool = False) -> argparse.ArgumentParser:
+    """Build the parser for options shared by all commands.
     
+    Holds the general options, the command flags and the output options.
+    Options that only one command reads are added by the builders in
+    _COMMAND_ARGS.
+    
+    Args:
+        lazy: Build the first-phase parser of parse_arguments(), without
+            -h/--help and abbreviation matching; both are left to the
+            complete parser
+        
     Returns:
-        Configured ArgumentParser instance
+        ArgumentParser without command-specific options
     """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Paperless NGX Integration CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
+        add_help=not lazy,
+        allow_abbrev=not lazy,
         epilog="""
 Examples:
   # Fetch email attachments from all accounts
@@ -51,6 +86,9 @@ Examples:
   
   # Run continuous email fetching
   python -m paperless_ngx.cli --run-email-fetcher
+  
+  # Run several commands over one IMAP login per account
+  printf '%s\\n' --email-stats '--fetch-email-attachments --since-days 1' | python -m paperless_ngx.cli --repl
         """
     )
     
@@ -70,6 +108,17 @@ Examples:
         type=str,
         help="Path to .env configuration file"
     )
+    parser.add_argument(
+        "--config-cache",
+        action="store_true",
+        help="Reuse the email configuration of earlier runs until .env or EMAIL_* variables change"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        metavar="K",
+        help="Accounts processed in parallel (default: one per account, at most 8)"
+    )
     
     # Email fetching commands
     email_group = parser.add_argument_group("Email Commands")
@@ -78,29 +127,6 @@ Examples:
         action="store_true",
         help="Download attachments from configured email accounts"
     )
-    email_group.add_argument(
-        "--email-account",
-        type=str,
-        metavar="NAME",
-        help="Process specific email account only"
-    )
-    email_group.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Show what would be downloaded without actually downloading"
-    )
-    email_group.add_argument(
-        "--since-date",
-        type=str,
-        metavar="YYYY-MM-DD",
-        help="Only process emails after this date"
-    )
-    email_group.add_argument(
-        "--since-days",
-        type=int,
-        metavar="N",
-        help="Only process emails from last N days"
-    )
     email_group.add_argument(
         "--test-email-connections",
         action="store_true",
@@ -129,17 +155,9 @@ Examples:
         help="Run continuous email fetching service"
     )
     email_group.add_argument(
-        "--fetch-interval",
-        type=int,
-        default=300,
-        metavar="SECONDS",
-        help="Interval between email checks in continuous mode (default: 300)"
-    )
-    email_group.add_argument(
-        "--max-iterations",
-        type=int,
-        metavar="N",
-        help="Maximum iterations for continuous mode (default: infinite)"
+        "--repl",
+        action="store_true",
+        help="Read one command per line from stdin, keeping IMAP connections open"
     )
     
     # Output options
@@ -161,8 +179,291 @@ Examples:
     return parser
 
 
+def _add_fetch_args(parser: argparse.ArgumentParser) -> None:
+    """Add the options of --fetch-email-attachments.
+    
+    Args:
+        parser: Parser to extend
+    """
+    fetch_group = parser.add_argument_group("Fetch Options")
+    fetch_group.add_argument(
+        "--email-account",
+        type=str,
+        metavar="NAME",
+        help="Process specific email account only"
+    )
+    fetch_group.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be downloaded without actually downloading"
+    )
+    fetch_group.add_argument(
+        "--since-date",
+        type=str,
+        metavar="YYYY-MM-DD",
+        help="Only process emails after this date"
+    )
+    fetch_group.add_argument(
+        "--since-days",
+        type=int,
+        metavar="N",
+        help="Only process emails from last N days"
+    )
+    fetch_group.add_argument(
+        "--fetch-batch-size",
+        type=int,
+        default=100,
+        metavar="N",
+        help="Emails fetched per IMAP request (default: 100)"
+    )
+
+
+def _add_continuous_args(parser: argparse.ArgumentParser) -> None:
+    """Add the options of --run-email-fetcher.
+    
+    Args:
+        parser: Parser to extend
+    """
+    continuous_group = parser.add_argument_group("Continuous Mode Options")
+    continuous_group.add_argument(
+        "--fetch-interval",
+        type=int,
+        default=300,
+        metavar="SECONDS",
+        help="Interval between email checks in continuous mode (default: 300)"
+    )
+    continuous_group.add_argument(
+        "--max-iterations",
+        type=int,
+        metavar="N",
+        help="Maximum iterations for continuous mode (default: infinite)"
+    )
+
+
+# Command-specific option builders, keyed by the dest of the command flag
+_COMMAND_ARGS = {
+    "fetch_email_attachments": _add_fetch_args,
+    "run_email_fetcher": _add_continuous_args,
+}
+
+
+@lru_cache(maxsize=1)
+def setup_parser() -> argparse.ArgumentParser:
+    """Set up the complete command-line argument parser.
+    
+    Used for --help and for command lines the two-phase parse in
+    parse_arguments() does not fully recognize. The parser is built once
+    per process; parse_args() does not modify it.
+    
+    Returns:
+        Configured ArgumentParser instance
+    """
+    parser = _build_root_parser()
+    for add_args in _COMMAND_ARGS.values():
+        add_args(parser)
+    return parser
+
+
+def _output_format(value: str) -> str:
+    """Validate an --output value.
+    
+    Args:
+        value: Command-line value
+        
+    Returns:
+        The value if it is a known format
+        
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if value not in ("json", "text"):
+        raise ValueError(value)
+    return value
+
+
+# Options understood by _parse_argv(): option -> (dest, converter), where a
+# converter of None marks a flag. Mirrors the complete parser; an option
+# added there must be added here too (checked by the unit tests).
+_FAST_OPTIONS: Dict[str, Tuple[str, Optional[Callable[[str], Any]]]] = {
+    "-v": ("verbose", None),
+    "--verbose": ("verbose", None),
+    "--debug": ("debug", None),
+    "--config": ("config", str),
+    "--config-cache": ("config_cache", None),
+    "--concurrency": ("concurrency", int),
+    "--fetch-email-attachments": ("fetch_email_attachments", None),
+    "--test-email-connections": ("test_email_connections", None),
+    "--list-email-folders": ("list_email_folders", str),
+    "--reset-email-state": ("reset_email_state", str),
+    "--email-stats": ("email_stats", None),
+    "--run-email-fetcher": ("run_email_fetcher", None),
+    "--repl": ("repl", None),
+    "--output": ("output", _output_format),
+    "--output-file": ("output_file", str),
+    "--email-account": ("email_account", str),
+    "--dry-run": ("dry_run", None),
+    "--since-date": ("since_date", str),
+    "--since-days": ("since_days", int),
+    "--fetch-batch-size": ("fetch_batch_size", int),
+    "--fetch-interval": ("fetch_interval", int),
+    "--max-iterations": ("max_iterations", int),
+}
+
+# Defaults of the complete parser, applied before scanning
+_FAST_DEFAULTS: Dict[str, Any] = {
+    dest: False if converter is None else None
+    for dest, converter in _FAST_OPTIONS.values()
+}
+_FAST_DEFAULTS.update(output="text", fetch_interval=300, fetch_batch_size=100)
+
+
+def _parse_argv(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse a plain command line without argparse.
+    
+    Handles the known long options (as "--opt value" or "--opt=value")
+    and -v. Anything else (help, abbreviations, unknown options, missing or
+    invalid values) returns None so argparse can handle it, including its
+    error messages.
+    
+    Args:
+        argv: Arguments to parse
+        
+    Returns:
+        Parsed arguments with the same attributes as the complete parser,
+        or None if the command line needs argparse
+    """
+    values = dict(_FAST_DEFAULTS)
+    tokens = iter(argv)
+    
+    for token in tokens:
+        option, has_value, value = token.partition("=")
+        spec = _FAST_OPTIONS.get(option if token.startswith("--") else token)
+        if spec is None:
+            return None
+        dest, converter = spec
+        
+        if converter is None:
+            if has_value:
+                return None
+            values[dest] = True
+            continue
+        
+        if not has_value:
+            value = next(tokens, None)
+            if value is None or value.startswith("-"):
+                return None
+        try:
+            values[dest] = converter(value)
+        except ValueError:
+            return None
+    
+    return SimpleNamespace(**values)
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> Arguments:
+    """Parse the command line.
+    
+    Plain command lines are handled by _parse_argv() without importing
+    argparse. Otherwise argparse parses in two phases: the first phase
+    only knows the shared options and finds the selected command, the
+    second adds that command's options. Help requests and anything left
+    over go through the complete parser, so the accepted command line and
+    error messages stay the same.
+    
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+        
+    Returns:
+        Parsed arguments
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    args = _parse_argv(argv)
+    if args is not None:
+        return args
+    
+    parser = _build_root_parser(lazy=True)
+    args, _ = parser.parse_known_args(argv)
+    
+    for dest, add_args in _COMMAND_ARGS.items():
+        if getattr(args, dest):
+            add_args(parser)
+    
+    args, remaining = parser.parse_known_args(argv)
+    if remaining:
+        return setup_parser().parse_args(argv)
+    return args
+
+
+class _AttachmentDicts(Sequence):
+    """Read-only list view that converts attachments on access.
+    
+    Text output only shows the count and the first few entries, so
+    to_dict() is called for those entries alone.
+    """
+    
+    def __init__(self, attachments: Sequence[Any]):
+        """Wrap a list of attachments.
+        
+        Args:
+            attachments: Attachments with a to_dict() method
+        """
+        self._attachments = attachments
+    
+    def __len__(self) -> int:
+        return len(self._attachments)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [att.to_dict() for att in self._attachments[index]]
+        return self._attachments[index].to_dict()
+
+
+def _run_per_account(
+    service: EmailFetcherService,
+    func: Callable[[str], Any],
+    concurrency: Optional[int] = None
+) -> Dict[str, Any]:
+    """Run a function for every configured account in parallel.
+    
+    IMAP round trips dominate and accounts are independent, so each
+    account gets its own worker thread. Accounts on the same server share
+    at most _MAX_CONNECTIONS_PER_HOST connections at a time.
+    
+    Args:
+        service: Email fetcher service
+        func: Function called with each account name
+        concurrency: Maximum worker threads (default: one per account,
+            at most 8)
+        
+    Returns:
+        Dictionary mapping account names to results, in configuration order
+    """
+    hosts = {
+        name: client.account.imap_server
+        for name, client in service.clients.items()
+    }
+    if not hosts:
+        return {}
+    
+    host_slots = {
+        host: threading.BoundedSemaphore(_MAX_CONNECTIONS_PER_HOST)
+        for host in set(hosts.values())
+    }
+    
+    def run(name: str) -> Any:
+        with host_slots[hosts[name]]:
+            return func(name)
+    
+    workers = max(1, concurrency or min(8, len(hosts)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {name: executor.submit(run, name) for name in hosts}
+        return {name: future.result() for name, future in futures.items()}
+
+
 def handle_fetch_email_attachments(
-    args: argparse.Namespace,
+    args: Arguments,
     service: EmailFetcherService
 ) -> Dict[str, Any]:
     """Handle email attachment fetching.
@@ -178,13 +479,22 @@ def handle_fetch_email_attachments(
     since_date = None
     if args.since_date:
         try:
-            since_date = datetime.strptime(args.since_date, "%Y-%m-%d")
+            # Accepts YYYY-MM-DD as well as full ISO 8601 timestamps
+            since_date = datetime.fromisoformat(args.since_date)
         except ValueError:
             logger.error(f"Invalid date format: {args.since_date}")
             sys.exit(1)
     elif args.since_days:
         since_date = datetime.now() - timedelta(days=args.since_days)
     
+    # Format the IMAP SEARCH date once instead of once per account
+    since_imap = since_date.strftime("%d-%b-%Y") if since_date else None
+    
+    def to_dicts(attachments: List[Any]) -> Sequence:
+        """Convert all attachments for JSON; text output converts lazily."""
+        view = _AttachmentDicts(attachments)
+        return list(view) if args.output == "json" else view
+    
     # Fetch attachments
     if args.email_account:
         # Specific account
@@ -192,50 +502,75 @@ def handle_fetch_email_attachments(
         attachments = service.fetch_account(
             args.email_account,
             since_date=since_date,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            batch_size=args.fetch_batch_size,
+            since_imap=since_imap
         )
         results = {
             "account": args.email_account,
             "attachments_processed": len(attachments),
             "dry_run": args.dry_run,
-            "files": [att.to_dict() for att in attachments]
+            "files": to_dicts(attachments)
         }
     else:
         # All accounts
         logger.info("Fetching from all configured accounts")
-        all_attachments = service.fetch_all_accounts(
-            since_date=since_date,
-            dry_run=args.dry_run
-        )
+        
+        def fetch(account_name: str) -> List[Any]:
+            try:
+                return service.fetch_account(
+                    account_name,
+                    since_date=since_date,
+                    dry_run=args.dry_run,
+                    batch_size=args.fetch_batch_size,
+                    since_imap=since_imap
+                )
+            except Exception as e:
+                logger.error(f"Failed to process {account_name}: {e}")
+                return []
+        
+        all_attachments = _run_per_account(service, fetch, args.concurrency)
+        total = 0
+        by_account = {}
+        for name, atts in all_attachments.items():
+            by_account[name] = to_dicts(atts)
+            total += len(atts)
+        
         results = {
             "accounts_processed": len(all_attachments),
-            "total_attachments": sum(len(atts) for atts in all_attachments.values()),
+            "total_attachments": total,
             "dry_run": args.dry_run,
-            "by_account": {
-                name: [att.to_dict() for att in atts]
-                for name, atts in all_attachments.items()
-            }
+            "by_account": by_account
         }
     
     return results
 
 
-def handle_test_email_connections(service: EmailFetcherService) -> Dict[str, Any]:
+def handle_test_email_connections(
+    service: EmailFetcherService,
+    concurrency: Optional[int] = None
+) -> Dict[str, Any]:
     """Test email account connections.
     
     Args:
         service: Email fetcher service
+        concurrency: Maximum accounts tested in parallel
         
     Returns:
         Test results dictionary
     """
     logger.info("Testing email account connections...")
-    connection_results = service.test_connections()
+    connection_results = _run_per_account(
+        service, service.test_account_connection, concurrency
+    )
+    
+    # One pass: every account that did not succeed failed
+    successful = sum(map(bool, connection_results.values()))
     
     results = {
         "tested_accounts": len(connection_results),
-        "successful": sum(1 for success in connection_results.values() if success),
-        "failed": sum(1 for success in connection_results.values() if not success),
+        "successful": successful,
+        "failed": len(connection_results) - successful,
         "accounts": connection_results
     }
     
@@ -301,7 +636,7 @@ def handle_email_stats(service: EmailFetcherService) -> Dict[str, Any]:
 
 
 def handle_run_email_fetcher(
-    args: argparse.Namespace,
+    args: Arguments,
     service: EmailFetcherService
 ) -> None:
     """Run continuous email fetching.
@@ -317,50 +652,276 @@ def handle_run_email_fetcher(
     )
 
 
-def format_output(results: Dict[str, Any], output_format: str) -> str:
-    """Format results for output.
+def render_json(results: Dict[str, Any]) -> bytes:
+    """Render results as indented UTF-8 JSON with a trailing newline.
+    
+    Uses orjson when available. Datetimes and dataclasses go through
+    default=str in both cases, so the document is the same either way.
     
     Args:
         results: Results dictionary
-        output_format: Output format (json or text)
         
     Returns:
-        Formatted output string
+        Encoded JSON document
     """
-    if output_format == "json":
-        return json.dumps(results, indent=2, ensure_ascii=False, default=str)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            results,
+            default=str,
+            option=(
+                orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_APPEND_NEWLINE
+            ),
+        )
+    return (json.dumps(results, indent=2, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def format_output(
+    results: Dict[str, Any],
+    output_format: str,
+    sink: Optional[TextIO] = None
+) -> None:
+    """Write formatted results to a stream.
     
-    # Text format
-    lines = []
+    Lines are written as they are produced instead of being collected
+    into one string first.
     
-    def format_dict(d: Dict, indent: int = 0) -> None:
-        """Recursively format dictionary."""
-        prefix = "  " * indent
-        for key, value in d.items():
+    Args:
+        results: Results dictionary
+        output_format: Output format (json or text)
+        sink: Stream to write to (defaults to sys.stdout)
+    """
+    if sink is None:
+        sink = sys.stdout
+    write = sink.write
+    
+    if output_format == "json":
+        write(render_json(results).decode("utf-8"))
+        return
+    
+    # Text format: walk nested dicts with an explicit stack of item
+    # iterators, so output order matches a depth-first recursion
+    stack = [("", iter(results.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
             if isinstance(value, dict):
-                lines.append(f"{prefix}{key}:")
-                format_dict(value, indent + 1)
-            elif isinstance(value, list):
-                lines.append(f"{prefix}{key}: [{len(value)} items]")
+                write(f"{prefix}{key}:\n")
+                stack.append((prefix + "  ", iter(value.items())))
+                break
+            elif isinstance(value, (list, _AttachmentDicts)):
+                write(f"{prefix}{key}: [{len(value)} items]\n")
                 if value and not isinstance(value[0], (dict, list)):
-                    for item in value[:5]:  # Show first 5 items
-                        lines.append(f"{prefix}  - {item}")
+                    for item in islice(value, 5):  # Show first 5 items
+                        write(f"{prefix}  - {item}\n")
                     if len(value) > 5:
-                        lines.append(f"{prefix}  ... and {len(value) - 5} more")
+                        write(f"{prefix}  ... and {len(value) - 5} more\n")
+            else:
+                write(f"{prefix}{key}: {value}\n")
+        else:
+            stack.pop()
+
+
+def _config_cache_key(config_path: Path) -> str:
+    """Fingerprint the inputs of the email configuration.
+    
+    Args:
+        config_path: .env file the configuration comes from
+        
+    Returns:
+        Hex digest that changes when the file or non-credential EMAIL_*
+        variables change
+    """
+    import hashlib
+    
+    from ...infrastructure.email import CREDENTIAL_ENV_VARS
+    
+    try:
+        stat = config_path.stat()
+        file_state = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        file_state = (str(config_path), None, None)
+    
+    # The settings are read from the process environment, so a changed
+    # variable must invalidate the cache even if the file did not change.
+    # Credentials are not cached, so they stay out of the key as well.
+    credential_vars = set(CREDENTIAL_ENV_VARS.values())
+    env_state = sorted(
+        (name, value) for name, value in os.environ.items()
+        if name.startswith("EMAIL_") and name not in credential_vars
+    )
+    return hashlib.sha256(repr((file_state, env_state)).encode("utf-8")).hexdigest()
+
+
+def _cached_load_email_config(config_path: Optional[str] = None) -> EmailSettings:
+    """Load the email configuration through an on-disk cache.
+    
+    The cache lives in $XDG_CACHE_HOME/paperless_ngx/cfg.json (default
+    ~/.cache) and holds the settings without the account credentials
+    together with the key from _config_cache_key(). Credentials are always
+    read from the environment. The file is only readable by the owner and
+    replaced atomically.
+    
+    Args:
+        config_path: .env file the configuration comes from (default: .env)
+        
+    Returns:
+        Email settings
+    """
+    import tempfile
+    
+    from ...infrastructure.email import (
+        CREDENTIAL_ENV_VARS,
+        EmailSettings,
+        load_credentials_from_env,
+        load_email_config_from_env,
+    )
+    
+    cache_root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    cache_dir = Path(cache_root) / "paperless_ngx"
+    cache_file = cache_dir / "cfg.json"
+    key = _config_cache_key(Path(config_path or ".env"))
+    
+    try:
+        with open(cache_file, "rb") as f:
+            cached = json.load(f)
+        if cached["key"] == key:
+            logger.debug(f"Using cached email configuration from {cache_file}")
+            return EmailSettings.model_validate(
+                {**cached["settings"], **load_credentials_from_env()}
+            )
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config cache {cache_file}: {e}")
+    
+    settings = load_email_config_from_env()
+    
+    tmp_name = None
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkstemp creates the file with mode 0600
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix=".cfg-", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({
+                "key": key,
+                "settings": settings.model_dump(mode="json", exclude=set(CREDENTIAL_ENV_VARS)),
+            }, f)
+        os.replace(tmp_name, cache_file)
+        # Earlier versions pickled the settings including the credentials
+        (cache_dir / "cfg.pkl").unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {cache_file}: {e}")
+        if tmp_name:
+            Path(tmp_name).unlink(missing_ok=True)
+    
+    return settings
+
+
+# Command flag -> handler, in precedence order. Handlers take the parsed
+# arguments and the service; continuous mode returns no results.
+_COMMANDS: Tuple[Tuple[str, Callable[[Arguments, EmailFetcherService], Any]], ...] = (
+    ("fetch_email_attachments", handle_fetch_email_attachments),
+    ("test_email_connections", lambda args, service: handle_test_email_connections(service, args.concurrency)),
+    ("list_email_folders", lambda args, service: handle_list_email_folders(args.list_email_folders, service)),
+    ("reset_email_state", lambda args, service: handle_reset_email_state(args.reset_email_state, service)),
+    ("email_stats", lambda args, service: handle_email_stats(service)),
+    ("run_email_fetcher", handle_run_email_fetcher),
+)
+
+
+def run_command(args: Arguments, service: EmailFetcherService) -> None:
+    """Run the selected command and output its results.
+    
+    Args:
+        args: Parsed arguments
+        service: Email fetcher service
+    """
+    for flag, handler in _COMMANDS:
+        if getattr(args, flag):
+            results = handler(args, service)
+            break
+    else:
+        return
+    
+    # Format and output results
+    if results:
+        if args.output_file:
+            if args.output == "json":
+                # Already encoded: one unbuffered write, no text layer
+                with open(args.output_file, "wb", buffering=0) as f:
+                    f.write(render_json(results))
             else:
-                lines.append(f"{prefix}{key}: {value}")
+                with open(args.output_file, "w", encoding="utf-8") as f:
+                    format_output(results, args.output, f)
+            logger.info(f"Results saved to {args.output_file}")
+        elif args.output == "json" and hasattr(sys.stdout, "buffer"):
+            # Hand the encoded document to the binary layer in one write;
+            # flush first so earlier text output stays in order
+            sys.stdout.flush()
+            sys.stdout.buffer.write(render_json(results))
+            sys.stdout.buffer.flush()
+        else:
+            format_output(results, args.output)
+
+
+def run_repl(
+    service: EmailFetcherService,
+    stream: Optional[TextIO] = None,
+    debug: bool = False
+) -> None:
+    """Run commands read line by line on one service.
+    
+    Each line holds the options of one CLI invocation, e.g.
+    "--fetch-email-attachments --since-days 1". The service keeps its IMAP
+    connections open between commands, so a session does not log in again
+    for every command; servers limit logins and connections per client IP.
+    Reading stops at end of input or at a line reading "exit" or "quit".
     
-    format_dict(results)
-    return "\n".join(lines)
+    Args:
+        service: Email fetcher service, ideally created with keep_alive=True
+        stream: Command source (defaults to sys.stdin)
+        debug: Log tracebacks of failed commands (the session's --debug)
+    """
+    import shlex
+    
+    for line in stream if stream is not None else sys.stdin:
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            logger.error(f"Invalid command line: {e}")
+            continue
+        if not argv:
+            continue
+        if argv[0] in ("exit", "quit"):
+            break
+        
+        try:
+            args = parse_arguments(argv)
+            run_command(args, service)
+        except SystemExit:
+            # Usage errors were already reported; keep the session open
+            continue
+        except Exception as e:
+            logger.error(f"Error: {e}", exc_info=debug)
 
 
 def main() -> None:
     """Main CLI entry point."""
     # Parse arguments
-    parser = setup_parser()
-    args = parser.parse_args()
+    args = parse_arguments()
     
-    # Setup logging
+    # Without a command only help is printed, so skip configuration and
+    # service construction
+    wants_work = args.repl or any(getattr(args, flag) for flag, _ in _COMMANDS)
+    if not wants_work:
+        setup_parser().print_help()
+        sys.exit(0)
+    
+    # Setup logging on stderr, keeping stdout for results
     if args.debug:
         log_level = logging.DEBUG
     elif args.verbose:
@@ -370,63 +931,38 @@ def main() -> None:
     
     logging.basicConfig(
         level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stderr
     )
     
+    from ...application.services import EmailFetcherService
+    from ...infrastructure.email import load_email_config_from_env
+    
     # Load configuration
-    if args.config:
+    if args.config_cache:
+        email_settings = _cached_load_email_config(args.config)
+    elif args.config:
         # Load from specific file
         email_settings = load_email_config_from_env()
     else:
         email_settings = load_email_config_from_env()
     
-    # Initialize service
-    service = EmailFetcherService(email_settings=email_settings)
-    
-    # Handle commands
-    results = None
-    
-    try:
-        if args.fetch_email_attachments:
-            results = handle_fetch_email_attachments(args, service)
-        
-        elif args.test_email_connections:
-            results = handle_test_email_connections(service)
-        
-        elif args.list_email_folders:
-            results = handle_list_email_folders(args.list_email_folders, service)
-        
-        elif args.reset_email_state:
-            results = handle_reset_email_state(args.reset_email_state, service)
-        
-        elif args.email_stats:
-            results = handle_email_stats(service)
-        
-        elif args.run_email_fetcher:
-            handle_run_email_fetcher(args, service)
-            return  # Continuous mode doesn't return results
-        
-        else:
-            parser.print_help()
-            sys.exit(0)
-        
-        # Format and output results
-        if results:
-            output = format_output(results, args.output)
-            
-            if args.output_file:
-                with open(args.output_file, "w", encoding="utf-8") as f:
-                    f.write(output)
-                logger.info(f"Results saved to {args.output_file}")
+    # Long-running modes keep their IMAP logins between operations;
+    # closing() logs out of every account on exit
+    keep_alive = args.repl or args.run_email_fetcher
+    with closing(EmailFetcherService(email_settings=email_settings, keep_alive=keep_alive)) as service:
+        try:
+            if args.repl:
+                run_repl(service, debug=args.debug)
             else:
-                print(output)
-        
-    except KeyboardInterrupt:
-        logger.info("Operation cancelled by user")
-        sys.exit(0)
-    except Exception as e:
-        logger.error(f"Error: {e}", exc_info=args.debug)
-        sys.exit(1)
+                run_command(args, service)
+            
+        except KeyboardInterrupt:
+            logger.info("Operation cancelled by user")
+            sys.exit(0)
+        except Exception as e:
+            logger.error(f"Error: {e}", exc_info=args.debug)
+            sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -7,9 +7,11 @@ for quarterly accounting document processing.
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
+import os
 import sys
-from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
@@ -31,40 +33,82 @@ from src.paperless_ngx.application.services.report_generator_service import Repo
 from src.paperless_ngx.application.use_cases.metadata_extraction import MetadataExtractor
 from src.paperless_ngx.infrastructure.config import get_settings
 from src.paperless_ngx.infrastructure.llm.litellm_client import LiteLLMClient
-from src.paperless_ngx.infrastructure.paperless.api_client import PaperlessApiClient
+from src.paperless_ngx.infrastructure.paperless.api_client import PaperlessApiClient, get_client
 from src.paperless_ngx.infrastructure.logging import setup_logging
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Attachment types stored by the email workflow
+_ALLOWED_EXT = frozenset({'.pdf', '.png', '.jpg', '.jpeg'})
+
 
 class SimplifiedWorkflowCLI:
     """Simplified 3-point workflow CLI interface."""
     
+    # Accounts fetched concurrently; providers cap connections per account
+    MAX_PARALLEL_ACCOUNTS = 4
+    # Documents whose OCR text is fetched concurrently
+    OCR_WORKERS = 8
+    # Concurrent document updates sent to Paperless
+    MAX_PARALLEL_UPDATES = 10
+    
     def __init__(self):
-        """Initialize the CLI with necessary services."""
+        """Initialize the CLI.
+        
+        Services are created on first use, so a workflow only pays for
+        the clients it needs (e.g. no LLM setup for the email fetch).
+        """
         self.settings = get_settings()
         setup_logging(self.settings.log_level)
         
-        # Initialize services
-        self.paperless_client = PaperlessApiClient()  # Low-level API client
-        self.paperless_service = PaperlessApiService(self.paperless_client)  # High-level service
-        self.document_metadata_service = DocumentMetadataService(
+        # Staging directory for downloads
+        self.staging_dir = Path("staging")
+        self.staging_dir.mkdir(exist_ok=True)
+    
+    @cached_property
+    def paperless_client(self) -> PaperlessApiClient:
+        """Low-level API client (shared)."""
+        return get_client()
+    
+    @cached_property
+    def paperless_service(self) -> PaperlessApiService:
+        """High-level Paperless service."""
+        return PaperlessApiService(self.paperless_client)
+    
+    @cached_property
+    def document_metadata_service(self) -> DocumentMetadataService:
+        """Document metadata service with ID mapping."""
+        return DocumentMetadataService(
             api_client=self.paperless_client,
             api_service=self.paperless_service
-        )  # Document metadata service with ID mapping
-        self.llm_client = LiteLLMClient()  # Uses settings internally
-        self.metadata_extractor = MetadataExtractor()  # For metadata extraction (uses its own LLM client)
-        self.email_fetcher = EmailFetcherService()
-        self.tag_matcher = SmartTagMatcher(
+        )
+    
+    @cached_property
+    def llm_client(self) -> LiteLLMClient:
+        """LLM client (uses settings internally)."""
+        return LiteLLMClient()
+    
+    @cached_property
+    def metadata_extractor(self) -> MetadataExtractor:
+        """Metadata extraction (uses its own LLM client)."""
+        return MetadataExtractor()
+    
+    @cached_property
+    def email_fetcher(self) -> EmailFetcherService:
+        """Email fetcher whose connections stay open between workflow runs."""
+        email_fetcher = EmailFetcherService(keep_alive=True)
+        atexit.register(email_fetcher.close)
+        return email_fetcher
+    
+    @cached_property
+    def tag_matcher(self) -> SmartTagMatcher:
+        """Tag matcher with 95% threshold."""
+        return SmartTagMatcher(
             paperless_client=self.paperless_client,
             llm_client=self.llm_client,
             similarity_threshold=0.95
         )
-        
-        # Staging directory for downloads
-        self.staging_dir = Path("staging")
-        self.staging_dir.mkdir(exist_ok=True)
     
     def show_main_menu(self) -> int:
         """Display the main 3-point workflow menu.
@@ -178,6 +222,7 @@ class SimplifiedWorkflowCLI:
         
         # Select date range
         date_range = self.select_date_range("Email-Abruf")
+        months = date_range.get_months()
         
         # Get available email accounts
         accounts = self.email_fetcher.get_configured_accounts()
@@ -213,65 +258,107 @@ class SimplifiedWorkflowCLI:
             console=console
         ) as progress:
             
-            for account in selected_accounts:
-                task = progress.add_task(f"Verarbeite {account}...", total=100)
+            semaphore = asyncio.Semaphore(self.MAX_PARALLEL_ACCOUNTS)
+            results = await asyncio.gather(
+                *(self._fetch_one_account(account, date_range, progress, semaphore)
+                  for account in selected_accounts),
+                return_exceptions=True
+            )
+            for account, result in zip(selected_accounts, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Email fetch error for {account}: {result}")
+        
+        # Summary
+        console.print("\n[bold green]Email-Abruf abgeschlossen![/bold green]")
+        # scandir yields names without building Path objects; hidden files
+        # are skipped like glob("*") does
+        total_files = 0
+        for month in months:
+            month_dir = self.staging_dir / month
+            if os.path.isdir(month_dir):
+                with os.scandir(month_dir) as entries:
+                    total_files += sum(1 for entry in entries if not entry.name.startswith('.'))
+        console.print(f"Gesamt: {total_files} Dokumente heruntergeladen")
+        console.print(f"Gespeichert in: {self.staging_dir.absolute()}")
+    
+    async def _fetch_one_account(
+        self,
+        account: str,
+        date_range: DateRange,
+        progress: Progress,
+        semaphore: asyncio.Semaphore
+    ) -> None:
+        """Fetch and store the attachments of one email account.
+        
+        Args:
+            account: Account name
+            date_range: Date range to fetch emails from
+            progress: Shared progress display
+            semaphore: Limits the number of accounts fetched at once
+        """
+        async with semaphore:
+            task = progress.add_task(f"Verarbeite {account}...", total=100)
+            
+            try:
+                # Connect to email (reuses the connection of earlier runs)
+                progress.update(task, advance=20, description=f"Verbinde mit {account}...")
+                if await self.email_fetcher.acquire(account) is None:
+                    raise ConnectionError("Verbindung fehlgeschlagen")
                 
-                try:
-                    # Connect to email
-                    progress.update(task, advance=20, description=f"Verbinde mit {account}...")
-                    await self.email_fetcher.connect(account)
-                    
-                    # Fetch emails in date range
-                    progress.update(task, advance=30, description=f"Suche Emails...")
-                    emails = await self.email_fetcher.fetch_emails_in_range(
-                        account=account,
-                        date_range=date_range
-                    )
-                    
-                    console.print(f"[green]Gefunden: {len(emails)} Emails mit Anhängen[/green]")
+                # Fetch emails in date range
+                progress.update(task, advance=30, description=f"Suche Emails...")
+                emails = await self.email_fetcher.fetch_emails_in_range(
+                    account=account,
+                    date_range=date_range
+                )
+                
+                progress.console.print(f"[green]{account}: {len(emails)} Emails mit Anhängen gefunden[/green]")
+                
+                # Download attachments by month; emails are bucketed in one pass
+                by_month: Dict[str, List[Dict[str, Any]]] = {}
+                for email in emails:
+                    by_month.setdefault(email['date'].strftime('%Y-%m'), []).append(email)
+                
+                months = date_range.get_months()
+                for month in months:
+                    month_dir = self.staging_dir / month
+                    month_dir.mkdir(exist_ok=True)
                     
-                    # Download attachments by month
-                    for month in date_range.get_months():
-                        month_dir = self.staging_dir / month
-                        month_dir.mkdir(exist_ok=True)
-                        
-                        month_emails = [e for e in emails if e['date'].strftime('%Y-%m') == month]
-                        if not month_emails:
-                            continue
-                        
-                        progress.update(
-                            task,
-                            advance=30/len(date_range.get_months()),
-                            description=f"Lade {month}: {len(month_emails)} Dokumente..."
-                        )
-                        
-                        for email in month_emails:
-                            for attachment in email.get('attachments', []):
-                                if attachment['type'].lower() in ['.pdf', '.png', '.jpg', '.jpeg']:
-                                    filepath = month_dir / attachment['filename']
-                                    await self.email_fetcher.download_attachment(
-                                        attachment['data'],
-                                        filepath
-                                    )
-                        
-                        console.print(f"  [green]✓[/green] {month}: {len(month_emails)} Dokumente gespeichert")
+                    month_emails = by_month.get(month)
+                    if not month_emails:
+                        continue
                     
-                    progress.update(task, advance=20, description=f"Trenne Verbindung...")
-                    await self.email_fetcher.disconnect(account)
+                    progress.update(
+                        task,
+                        advance=30/len(months),
+                        description=f"Lade {month}: {len(month_emails)} Dokumente..."
+                    )
                     
-                    progress.update(task, completed=100, description=f"[green]✓ {account} abgeschlossen[/green]")
+                    # The bulk fetch already holds the attachment content; it
+                    # is written off the event loop so other accounts keep going
+                    await asyncio.to_thread(self._write_attachments, month_dir, month_emails)
                     
-                except Exception as e:
-                    console.print(f"[red]Fehler bei {account}: {e}[/red]")
-                    logger.error(f"Email fetch error for {account}: {e}")
+                    progress.console.print(f"  [green]✓[/green] {account} {month}: {len(month_emails)} Dokumente gespeichert")
+                
+                progress.update(task, completed=100, description=f"[green]✓ {account} abgeschlossen[/green]")
+                
+            except Exception as e:
+                progress.console.print(f"[red]Fehler bei {account}: {e}[/red]")
+                logger.error(f"Email fetch error for {account}: {e}")
+    
+    @staticmethod
+    def _write_attachments(month_dir: Path, emails: List[Dict[str, Any]]) -> None:
+        """Write the document attachments of emails into month_dir.
         
-        # Summary
-        console.print("\n[bold green]Email-Abruf abgeschlossen![/bold green]")
-        total_files = sum(len(list((self.staging_dir / month).glob("*"))) 
-                         for month in date_range.get_months() 
-                         if (self.staging_dir / month).exists())
-        console.print(f"Gesamt: {total_files} Dokumente heruntergeladen")
-        console.print(f"Gespeichert in: {self.staging_dir.absolute()}")
+        Args:
+            month_dir: Staging directory of the month
+            emails: Emails as returned by fetch_emails_in_range()
+        """
+        for email in emails:
+            for attachment in email.get('attachments', []):
+                if attachment['type'].lower() in _ALLOWED_EXT and attachment['data']:
+                    # One write call per file; the content is already in memory
+                    (month_dir / attachment['filename']).write_bytes(attachment['data'])
     
     async def workflow_2_process_documents(self):
         """Workflow 2: Dokumente verarbeiten & Metadaten anreichern."""
@@ -283,7 +370,9 @@ class SimplifiedWorkflowCLI:
     async def _process_staging_documents(self):
         """Process documents from staging directory."""
         # Get available months in staging
-        available_months = [d.name for d in self.staging_dir.iterdir() if d.is_dir()]
+        # DirEntry.is_dir() uses the cached directory entry type, no stat per entry
+        with os.scandir(self.staging_dir) as entries:
+            available_months = [entry.name for entry in entries if entry.is_dir()]
         
         if not available_months:
             console.print("[red]Keine Dokumente im Staging-Verzeichnis gefunden![/red]")
@@ -311,12 +400,14 @@ class SimplifiedWorkflowCLI:
                 console.print(f"[yellow]Warnung: {month} nicht gefunden[/yellow]")
                 continue
             
-            for file_path in month_dir.glob("*.pdf"):
-                documents.append({
-                    'path': file_path,
-                    'month': month,
-                    'filename': file_path.name
-                })
+            with os.scandir(month_dir) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith('.pdf') and not entry.name.startswith('.') and entry.is_file():
+                        documents.append({
+                            'path': Path(entry.path),
+                            'month': month,
+                            'filename': entry.name
+                        })
         
         if not documents:
             console.print("[red]Keine PDF-Dokumente gefunden![/red]")
@@ -381,70 +472,136 @@ class SimplifiedWorkflowCLI:
             
             task = progress.add_task("Verarbeite Dokumente...", total=len(documents))
             
-            for i, doc in enumerate(documents):
-                doc_name = doc.get('filename', doc.get('title', f'Dokument {i+1}'))
-                
-                try:
-                    progress.update(task, description=f"[{i+1}/{len(documents)}] {doc_name[:30]}...")
-                    
-                    # Extract OCR text
-                    if source == "staging":
-                        # Upload to Paperless first for OCR
-                        ocr_text = await self._upload_and_get_ocr(doc['path'])
-                    else:
-                        # Get OCR from Paperless
-                        ocr_text = doc.get('content', '') or doc.get('ocr', '')
+            # Three-stage pipeline: OCR -> LLM -> tag matching and Paperless
+            # update. Bounded queues let the stages overlap without holding
+            # more than a few documents in memory.
+            llm_workers = min(8, self.settings.llm_max_parallel)
+            ocr_queue: asyncio.Queue = asyncio.Queue(maxsize=2 * llm_workers)
+            update_queue: asyncio.Queue = asyncio.Queue(maxsize=2 * llm_workers)
+            pending = iter(enumerate(documents))
+            update_slots = asyncio.Semaphore(self.MAX_PARALLEL_UPDATES)
+            update_tasks = []
+            
+            def fail(doc_name: str, error: Exception) -> None:
+                console.print(f"  [red]✗[/red] {doc_name}: {str(error)[:50]}")
+                errors.append(doc_name)
+                logger.error(f"Processing error for {doc_name}: {error}")
+                progress.advance(task)
+            
+            async def ocr_worker():
+                # Workers share the iterator, so each document is taken once
+                for i, doc in pending:
+                    doc_name = doc.get('filename', doc.get('title', f'Dokument {i+1}'))
+                    try:
+                        if source == "staging":
+                            # Upload to Paperless first for OCR
+                            ocr_text = await self._upload_and_get_ocr(doc['path'])
+                        else:
+                            # Get OCR from Paperless
+                            ocr_text = doc.get('content') or doc.get('ocr') or ''
+                    except Exception as e:
+                        fail(doc_name, e)
+                        continue
                     
-                    if not ocr_text or len(ocr_text) < 50:
+                    if len(ocr_text or '') < 50:
                         console.print(f"  [yellow]⚠[/yellow] {doc_name}: OCR-Text zu kurz oder fehlt")
                         errors.append(doc_name)
                         progress.advance(task)
                         continue
                     
-                    # LLM metadata extraction
-                    progress.update(task, description=f"LLM-Analyse: {doc_name[:30]}...")
-                    metadata = self.metadata_extractor.extract_metadata(
-                        ocr_text=ocr_text,
-                        document_id=doc.get('id')
-                    )
-                    
-                    # Smart tag matching
-                    progress.update(task, description=f"Tag-Matching: {doc_name[:30]}...")
-                    original_tags = metadata.get('tags', [])
-                    matched_tags = []
-                    
-                    for tag in original_tags:
-                        match_result = await self.tag_matcher.match_tag(tag, existing_tags)
-                        
-                        if match_result.is_new_tag:
-                            matched_tags.append(tag)
-                            new_tags_created.add(tag)
-                            existing_tags.append(tag)  # Add to cache
-                            console.print(f"    [green]✓[/green] Neuer Tag: '{tag}'")
-                        else:
-                            matched_tags.append(match_result.matched_tag)
-                            if tag != match_result.matched_tag:
-                                tag_matches.append((tag, match_result.matched_tag, match_result.similarity_score))
-                                console.print(f"    [cyan]→[/cyan] Tag-Match: '{tag}' → '{match_result.matched_tag}' ({match_result.similarity_score:.0%})")
-                    
-                    metadata['tags'] = list(set(matched_tags))  # Remove duplicates
-                    
-                    # Update in Paperless
-                    if source == "paperless":
+                    await ocr_queue.put((doc, doc_name, ocr_text))
+            
+            async def ocr_stage():
+                await asyncio.gather(*(ocr_worker() for _ in range(self.OCR_WORKERS)))
+                for _ in range(llm_workers):
+                    await ocr_queue.put(None)
+            
+            async def llm_worker():
+                while True:
+                    item = await ocr_queue.get()
+                    if item is None:
+                        return
+                    doc, doc_name, ocr_text = item
+                    try:
+                        # LLM metadata extraction (blocking client, runs in a thread)
+                        metadata = await asyncio.to_thread(
+                            self.metadata_extractor.extract_metadata,
+                            ocr_text=ocr_text,
+                            document_id=doc.get('id')
+                        )
+                    except Exception as e:
+                        fail(doc_name, e)
+                        continue
+                    await update_queue.put((doc, doc_name, metadata))
+            
+            async def llm_stage():
+                await asyncio.gather(*(llm_worker() for _ in range(llm_workers)))
+                await update_queue.put(None)
+            
+            async def send_update(doc, doc_name, metadata):
+                nonlocal processed
+                try:
+                    async with update_slots:
                         # Use DocumentMetadataService for proper ID mapping
-                        self.document_metadata_service.update_document_with_metadata(
+                        await asyncio.to_thread(
+                            self.document_metadata_service.update_document_with_metadata,
                             document_id=doc['id'],
                             metadata=metadata
                         )
+                except Exception as e:
+                    fail(doc_name, e)
+                    return
+                processed += 1
+                progress.advance(task)
+            
+            async def update_stage():
+                # A single consumer keeps tag matching in order, as new tags
+                # are added to existing_tags for the following documents.
+                # Paperless updates are sent in the background meanwhile.
+                nonlocal processed
+                while True:
+                    item = await update_queue.get()
+                    if item is None:
+                        await asyncio.gather(*update_tasks)
+                        return
+                    doc, doc_name, metadata = item
                     
-                    processed += 1
-                    progress.advance(task)
+                    try:
+                        # Smart tag matching
+                        progress.update(task, description=f"Tag-Matching: {doc_name[:30]}...")
+                        original_tags = metadata.get('tags', [])
+                        matched_tags = []
+                        
+                        # New tags are added to existing_tags by the batch match;
+                        # the document's tag lines are printed in one call
+                        match_results = await self.tag_matcher.match_tags_batch(original_tags, existing_tags)
+                        log_lines = []
+                        for tag, match_result in zip(original_tags, match_results):
+                            if match_result.is_new_tag:
+                                matched_tags.append(tag)
+                                new_tags_created.add(tag)
+                                log_lines.append(f"    [green]✓[/green] Neuer Tag: '{tag}'")
+                            else:
+                                matched_tags.append(match_result.matched_tag)
+                                if tag != match_result.matched_tag:
+                                    tag_matches.append((tag, match_result.matched_tag, match_result.similarity_score))
+                                    log_lines.append(f"    [cyan]→[/cyan] Tag-Match: '{tag}' → '{match_result.matched_tag}' ({match_result.similarity_score:.0%})")
+                        if log_lines:
+                            console.print("\n".join(log_lines))
+                        
+                        metadata['tags'] = list(set(matched_tags))  # Remove duplicates
+                    except Exception as e:
+                        fail(doc_name, e)
+                        continue
                     
-                except Exception as e:
-                    console.print(f"  [red]✗[/red] {doc_name}: {str(e)[:50]}")
-                    errors.append(doc_name)
-                    logger.error(f"Processing error for {doc_name}: {e}")
-                    progress.advance(task)
+                    # Update in Paperless
+                    if source == "paperless":
+                        update_tasks.append(asyncio.create_task(send_update(doc, doc_name, metadata)))
+                    else:
+                        processed += 1
+                        progress.advance(task)
+            
+            await asyncio.gather(ocr_stage(), llm_stage(), update_stage())
         
         # Summary
         console.print("\n" + "="*60)
@@ -510,9 +667,16 @@ class SimplifiedWorkflowCLI:
                 
                 task = progress.add_task("Qualitätsprüfung...", total=len(documents))
                 
+                # ISO dates compare correctly as strings, so the period check
+                # needs no datetime parsing and matches the created__date
+                # filters of the query (the whole last day is included)
+                start_day = date_range.start_date.strftime('%Y-%m-%d')
+                end_day = date_range.end_date.strftime('%Y-%m-%d')
+                
                 for doc in documents:
                     # Check title
-                    if not doc.get('title') or doc['title'].startswith('scan_'):
+                    title = doc.get('title')
+                    if not title or title.startswith('scan_'):
                         issues['missing_title'].append(doc)
                     
                     # Check correspondent
@@ -527,20 +691,18 @@ class SimplifiedWorkflowCLI:
                         issues['few_tags'].append(doc)
                     
                     # Check OCR
-                    ocr_text = doc.get('content', '') or doc.get('ocr', '')
-                    if not ocr_text or len(ocr_text) < 50:
+                    if len(doc.get('content') or doc.get('ocr') or '') < 50:
                         issues['missing_ocr'].append(doc)
                     
                     # Check date
-                    if not doc.get('created'):
+                    created = doc.get('created')
+                    if not created:
                         issues['missing_date'].append(doc)
-                    else:
-                        # Check if in correct period
-                        doc_date = datetime.fromisoformat(doc['created'].replace('Z', '+00:00'))
-                        if not date_range.contains(doc_date):
-                            issues['wrong_period'].append(doc)
-                    
-                    progress.advance(task)
+                    elif not start_day <= created[:10] <= end_day:
+                        # Not in the selected period
+                        issues['wrong_period'].append(doc)
+                
+                progress.update(task, completed=len(documents))
             
             # Display results
             console.print("\n[bold]Qualitätsprüfung abgeschlossen[/bold]\n")
@@ -608,28 +770,29 @@ class SimplifiedWorkflowCLI:
         report_path = Path("reports") / report_name
         report_path.parent.mkdir(exist_ok=True)
         
-        with open(report_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['document_id', 'title', 'created', 'issues', 'action_needed']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            
+        # Index the issues by document once instead of searching every
+        # issue list for every document
+        issues_by_doc: Dict[int, List[str]] = {}
+        for issue_type, issue_docs in issues.items():
+            for doc in issue_docs:
+                issues_by_doc.setdefault(id(doc), []).append(issue_type)
+        
+        def rows():
             for doc in documents:
-                doc_issues = []
-                
-                # Check which issues apply
-                for issue_type, issue_docs in issues.items():
-                    if doc in issue_docs:
-                        doc_issues.append(issue_type)
-                
+                doc_issues = issues_by_doc.get(id(doc))
                 if doc_issues:
-                    writer.writerow({
-                        'document_id': doc.get('id', ''),
-                        'title': doc.get('title', 'Kein Titel'),
-                        'created': doc.get('created', ''),
-                        'issues': ', '.join(doc_issues),
-                        'action_needed': 'Metadaten ergänzen' if doc_issues else 'Keine'
-                    })
+                    yield (
+                        doc.get('id', ''),
+                        doc.get('title', 'Kein Titel'),
+                        doc.get('created', ''),
+                        ', '.join(doc_issues),
+                        'Metadaten ergänzen'
+                    )
+        
+        with open(report_path, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['document_id', 'title', 'created', 'issues', 'action_needed'])
+            writer.writerows(rows())
         
         return report_path
     
@@ -646,6 +809,20 @@ class SimplifiedWorkflowCLI:
         # For now, return placeholder
         return f"OCR text for {file_path.name}"
     
+    @staticmethod
+    def _wait_for_enter() -> None:
+        """Pause until the user presses Enter.
+        
+        The hint goes through the console so its markup is rendered;
+        input() would print the tags literally.
+        
+        Raises:
+            EOFError: If stdin is closed
+        """
+        console.print("\n[dim]Drücken Sie Enter um fortzufahren...[/dim]")
+        if not sys.stdin.readline():
+            raise EOFError
+    
     async def run(self):
         """Main run loop for the CLI."""
         console.print("[bold cyan]Willkommen zum Paperless NGX Workflow-System![/bold cyan]\n")
@@ -665,16 +842,23 @@ class SimplifiedWorkflowCLI:
                     await self.workflow_3_quality_scan()
                 
                 if choice != 0:
-                    input("\n[dim]Drücken Sie Enter um fortzufahren...[/dim]")
+                    self._wait_for_enter()
                     
             except KeyboardInterrupt:
                 console.print("\n\n[yellow]Unterbrochen durch Benutzer[/yellow]")
-                if Confirm.ask("Wirklich beenden?"):
+                try:
+                    if Confirm.ask("Wirklich beenden?"):
+                        break
+                except (EOFError, KeyboardInterrupt):
                     break
+            except EOFError:
+                # stdin closed, no further input possible
+                console.print("\n[bold]Auf Wiedersehen![/bold]")
+                break
             except Exception as e:
                 console.print(f"\n[red]Fehler: {e}[/red]")
                 logger.error(f"Unexpected error: {e}", exc_info=True)
-                input("\n[dim]Drücken Sie Enter um fortzufahren...[/dim]")
+                self._wait_for_enter()
 
 
 @click.command()
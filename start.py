@@ -6,8 +6,10 @@ Funktioniert auf Windows, Linux und macOS
 
 import sys
 import os
+import hashlib
+import importlib.util
 import platform
-import subprocess
+import shutil
 from pathlib import Path
 
 # Farben für Terminal (funktioniert auf Windows 10+ und Linux/Mac)
@@ -21,11 +23,17 @@ BLUE = '\033[94m'
 BOLD = '\033[1m'
 RESET = '\033[0m'
 
+# Marker of the last successful dependency check (FORCE_DEP_CHECK=1 ignores it)
+DEPS_CACHE_FILE = Path.home() / ".cache" / "paperless_ngx" / "deps_ok"
+
 def print_header():
     """Print application header."""
-    print(f"\n{BOLD}{'=' * 60}{RESET}")
-    print(f"{BOLD}    Paperless NGX Integration System v1.0{RESET}")
-    print(f"{BOLD}{'=' * 60}{RESET}\n")
+    sys.stdout.write(
+        f"\n{BOLD}{'=' * 60}{RESET}\n"
+        f"{BOLD}    Paperless NGX Integration System v1.0{RESET}\n"
+        f"{BOLD}{'=' * 60}{RESET}\n\n"
+    )
+    sys.stdout.flush()
 
 def setup_python_path():
     """Setup Python path for imports."""
@@ -57,7 +65,6 @@ def check_env_file():
         
         example_file = Path(".env.example")
         if example_file.exists():
-            import shutil
             shutil.copy(example_file, env_file)
             print(f"{GREEN}✅ .env erstellt. Bitte konfigurieren!{RESET}")
             
@@ -71,17 +78,44 @@ def check_env_file():
             print(f"{RED}❌ .env.example nicht gefunden!{RESET}")
             sys.exit(1)
 
+def _deps_cache_key():
+    """Key of the dependency check: requirements, Python version and environment."""
+    try:
+        requirements = Path("requirements.txt").read_bytes()
+    except OSError:
+        return None
+    environment = f"{sys.version_info[:2]}|{sys.prefix}".encode()
+    return hashlib.sha1(requirements + environment).hexdigest()
+
+def _write_deps_cache(cache_key):
+    """Remember a successful dependency check."""
+    if not cache_key:
+        return
+    try:
+        DEPS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        DEPS_CACHE_FILE.write_text(cache_key)
+    except OSError:
+        pass
+
 def check_dependencies():
     """Check and install missing dependencies."""
     print(f"{BLUE}🔍 Prüfe Dependencies...{RESET}")
     
+    # Skip the check while requirements and environment are unchanged
+    cache_key = _deps_cache_key()
+    if cache_key and os.environ.get('FORCE_DEP_CHECK') != '1':
+        try:
+            if DEPS_CACHE_FILE.read_text().strip() == cache_key:
+                print(f"{GREEN}✅ Alle Dependencies vorhanden{RESET}")
+                return
+        except OSError:
+            pass
+    
     required = [
-        'pythonjsonlogger',
         'structlog',
         'rich',
         'click',
         'rapidfuzz',
-        'tenacity',
         'pydantic',
         'pydantic_settings',
         'dotenv',
@@ -91,31 +125,35 @@ def check_dependencies():
         'requests'
     ]
     
-    missing = []
-    for module in required:
-        try:
-            __import__(module)
-        except ImportError:
-            missing.append(module)
+    # find_spec only locates the packages; importing them would run the
+    # (heavy) package code of litellm, openai, pydantic, ... on every start
+    missing = [module for module in required if importlib.util.find_spec(module) is None]
     
     if missing:
         print(f"{YELLOW}📦 Installiere fehlende Pakete...{RESET}")
+        import subprocess
         subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
         print(f"{GREEN}✅ Installation abgeschlossen{RESET}")
     else:
         print(f"{GREEN}✅ Alle Dependencies vorhanden{RESET}")
+    
+    _write_deps_cache(cache_key)
 
 def show_menu():
     """Show main menu and get user choice."""
-    print(f"\n{BOLD}Hauptmenü:{RESET}\n")
-    print(f"  {GREEN}1{RESET} → 🚀 Vereinfachtes 3-Punkt-Menü ({BOLD}empfohlen{RESET})")
-    print(f"  {GREEN}2{RESET} → 📋 Vollständiges Hauptmenü (8 Optionen)")
-    print(f"  {GREEN}3{RESET} → 🧪 Verbindungen testen")
-    print(f"  {GREEN}4{RESET} → 📧 Email-Download (Workflow 1)")
-    print(f"  {GREEN}5{RESET} → 🤖 Dokumente verarbeiten (Workflow 2)")
-    print(f"  {GREEN}6{RESET} → 📊 Quality Scan (Workflow 3)")
-    print(f"  {GREEN}7{RESET} → 🔄 Kompletter Durchlauf (1→2→3)")
-    print(f"\n  {RED}0{RESET} → Beenden\n")
+    # The whole menu in one write instead of one print per line
+    sys.stdout.write(
+        f"\n{BOLD}Hauptmenü:{RESET}\n\n"
+        f"  {GREEN}1{RESET} → 🚀 Vereinfachtes 3-Punkt-Menü ({BOLD}empfohlen{RESET})\n"
+        f"  {GREEN}2{RESET} → 📋 Vollständiges Hauptmenü (8 Optionen)\n"
+        f"  {GREEN}3{RESET} → 🧪 Verbindungen testen\n"
+        f"  {GREEN}4{RESET} → 📧 Email-Download (Workflow 1)\n"
+        f"  {GREEN}5{RESET} → 🤖 Dokumente verarbeiten (Workflow 2)\n"
+        f"  {GREEN}6{RESET} → 📊 Quality Scan (Workflow 3)\n"
+        f"  {GREEN}7{RESET} → 🔄 Kompletter Durchlauf (1→2→3)\n"
+        f"\n  {RED}0{RESET} → Beenden\n\n"
+    )
+    sys.stdout.flush()
     
     choice = input(f"Ihre Wahl [1]: ").strip() or "1"
     return choice
@@ -139,6 +177,26 @@ def run_workflow(workflow_num):
         import traceback
         traceback.print_exc()
 
+def run_connection_test():
+    """Run the connection test script in this interpreter."""
+    test_script = Path("tests/scripts/test_connections_simple.py")
+    if not test_script.exists():
+        print(f"{RED}Test-Script nicht gefunden!{RESET}")
+        return
+    
+    try:
+        spec = importlib.util.spec_from_file_location("test_connections_simple", test_script)
+        connection_test = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(connection_test)
+        connection_test.main()
+    except SystemExit:
+        # The script exits when .env is missing or empty
+        pass
+    except Exception as e:
+        print(f"{RED}❌ Fehler: {e}{RESET}")
+        import traceback
+        traceback.print_exc()
+
 def main():
     """Main entry point."""
     try:
@@ -173,11 +231,7 @@ def main():
         elif choice == "3":
             # Test connections
             print(f"\n{BLUE}🧪 Teste Verbindungen...{RESET}")
-            test_script = Path("tests/scripts/test_connections_simple.py")
-            if test_script.exists():
-                subprocess.run([sys.executable, str(test_script)])
-            else:
-                print(f"{RED}Test-Script nicht gefunden!{RESET}")
+            run_connection_test()
                 
         elif choice == "4":
             run_workflow(1)
@@ -4,17 +4,22 @@ Einfacher Verbindungstest für Paperless NGX Integration.
 Testet alle konfigurierten Verbindungen ohne externe Dependencies.
 """
 
+import asyncio
 import os
+import re
 import sys
 import json
 import imaplib
 import ssl
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import urllib.request
 import urllib.error
 
+# KEY=VALUE-Zeile der .env Datei; Kommentarzeilen beginnen nicht mit einem Schlüssel
+ENV_LINE = re.compile(r'^[ \t]*([^#=\s][^=\r\n]*?)[ \t]*=([^\r\n]*)', re.MULTILINE)
+
 # Farben für Terminal-Ausgabe
 class Colors:
     GREEN = '\033[92m'
@@ -45,15 +50,9 @@ def load_env_file(env_path: Path) -> Dict[str, str]:
         print(f"Bitte erstellen Sie eine .env Datei basierend auf .env.example")
         return env_vars
     
-    with open(env_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    # Remove quotes if present
-                    value = value.strip('"').strip("'")
-                    env_vars[key.strip()] = value
+    # Ganze Datei in einem Durchgang parsen; Anführungszeichen entfernen
+    for match in ENV_LINE.finditer(env_path.read_text()):
+        env_vars[match[1]] = match[2].rstrip().strip('"').strip("'")
     
     return env_vars
 
@@ -74,8 +73,8 @@ def test_paperless_connection(env: Dict[str, str]) -> Dict[str, Any]:
         return result
     
     try:
-        # Test API endpoint
-        test_url = f"{base_url}/documents/"
+        # Test API endpoint; one document per page is enough for the count
+        test_url = f"{base_url}/documents/?page_size=1"
         req = urllib.request.Request(test_url)
         req.add_header('Authorization', f'Token {api_token}')
         
@@ -233,6 +232,20 @@ def test_tag_matching_config(env: Dict[str, str]) -> Dict[str, Any]:
     
     return result
 
+async def run_network_tests(env: Dict[str, str]) -> Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]:
+    """Führt die Netzwerk-Tests parallel aus.
+    
+    Die Tests blockieren auf Netzwerk-I/O und laufen deshalb in eigenen
+    Threads; die Gesamtdauer entspricht dem langsamsten statt der Summe
+    aller Tests.
+    """
+    paperless, llm, *emails = await asyncio.gather(
+        asyncio.to_thread(test_paperless_connection, env),
+        asyncio.to_thread(test_llm_provider, env),
+        *(asyncio.to_thread(test_email_account, env, i) for i in range(1, 4))
+    )
+    return paperless, llm, emails
+
 def main():
     """Hauptfunktion für Verbindungstests."""
     print_header("Paperless NGX Integration - Verbindungstest")
@@ -248,9 +261,12 @@ def main():
     
     all_results = []
     
+    # Alle Verbindungen gleichzeitig testen, Ausgabe danach in fester Reihenfolge
+    paperless_result, llm_result, email_results = asyncio.run(run_network_tests(env))
+    
     # Test Paperless
     print(f"{Colors.BOLD}1. Paperless NGX Verbindung{Colors.RESET}")
-    result = test_paperless_connection(env)
+    result = paperless_result
     print_test(result['name'], result['status'], result['message'])
     if result['details'].get('document_count') is not None:
         print(f"        Dokumente in Paperless: {result['details']['document_count']}")
@@ -258,7 +274,7 @@ def main():
     
     # Test LLM Provider Priority
     print(f"\n{Colors.BOLD}2. LLM Provider Priorität{Colors.RESET}")
-    result = test_llm_provider(env)
+    result = llm_result
     print_test(result['name'], result['status'], result['message'])
     if result['details'].get('priority'):
         print(f"        Priorität: {result['details']['priority']}")
@@ -266,8 +282,7 @@ def main():
     
     # Test Email Accounts
     print(f"\n{Colors.BOLD}3. Email Konten (3 konfiguriert){Colors.RESET}")
-    for i in range(1, 4):
-        result = test_email_account(env, i)
+    for i, result in enumerate(email_results, 1):
         if result['name'] != f'Email Account {i}':  # Only test if configured
             print_test(result['name'], result['status'], result['message'])
             if result['status'] and result['details'].get('inbox_messages') is not None:
@@ -0,0 +1,444 @@
+"""Unit tests for the low-level PaperlessApiClient.
+
+These tests exercise request plumbing (rate limiting, URL building, caching)
+against a mocked requests session, without any network access.
+"""
+
+import io
+import json
+import socket
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from urllib3.exceptions import ProtocolError
+
+from src.paperless_ngx.domain.exceptions import PaperlessAPIError, PaperlessConnectionError
+from src.paperless_ngx.infrastructure.paperless.api_client import PaperlessApiClient, get_client
+
+
+@pytest.fixture
+def client():
+    """Create an API client with a mocked session."""
+    api_client = PaperlessApiClient(
+        base_url="http://paperless.test/api",
+        api_token="test-token",
+        rate_limit=10.0,
+    )
+    api_client.session = MagicMock()
+    yield api_client
+
+
+def make_response(body=None, status_code=200, headers=None):
+    """Build a mocked response carrying a JSON body."""
+    raw = json.dumps(body).encode("utf-8") if body is not None else b""
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    response.content = raw
+    response.raw = io.BytesIO(raw)
+    response.json.return_value = body
+    return response
+
+
+class TestRateLimit:
+    """Token bucket rate limiting."""
+
+    def test_burst_does_not_sleep(self, client):
+        """Requests within the burst capacity go out without sleeping."""
+        with patch("time.sleep") as mock_sleep:
+            for _ in range(int(client.burst)):
+                client._apply_rate_limit()
+
+        mock_sleep.assert_not_called()
+
+    def test_empty_bucket_sleeps(self, client):
+        """Once the bucket is drained the client waits for a refill."""
+        with patch("time.sleep") as mock_sleep:
+            for _ in range(int(client.burst) + 1):
+                client._apply_rate_limit()
+
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 1 / client.rate_limit
+
+    def test_concurrent_callers_are_spaced(self, client):
+        """Waiting threads reserve consecutive slots instead of sharing one."""
+        client._tokens = 0.0
+        client._last_refill = time.monotonic()
+
+        with patch("time.sleep") as mock_sleep:
+            threads = [threading.Thread(target=client._apply_rate_limit) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        waits = sorted(call.args[0] for call in mock_sleep.call_args_list)
+        assert len(waits) == 3
+        assert waits[2] > waits[1] > waits[0] > 0
+
+    def test_zero_rate_limit_disables_limiting(self):
+        """rate_limit=0 means unlimited rather than the configured default."""
+        unlimited = PaperlessApiClient(
+            base_url="http://paperless.test/api", api_token="test-token", rate_limit=0
+        )
+
+        with patch("time.sleep") as mock_sleep:
+            for _ in range(100):
+                unlimited._apply_rate_limit()
+
+        assert unlimited.rate_limit == 0
+        mock_sleep.assert_not_called()
+
+
+class TestClientRegistry:
+    """Shared clients per server and token."""
+
+    def test_same_server_and_token_share_a_client(self):
+        """get_client() hands out one instance per (base_url, token)."""
+        first = get_client("http://paperless.test/api", "token-a")
+        try:
+            assert get_client("http://paperless.test/api/", "token-a") is first
+            assert get_client("http://paperless.test/api", "token-b") is not first
+        finally:
+            get_client("http://paperless.test/api", "token-b").close()
+            first.close()
+
+    def test_close_removes_client_from_registry(self):
+        """A closed client is replaced on the next lookup."""
+        first = get_client("http://paperless.test/api", "token-a")
+        first.close()
+
+        second = get_client("http://paperless.test/api", "token-a")
+        second.close()
+
+        assert second is not first
+
+
+class TestRequestUrl:
+    """URL construction in _make_request."""
+
+    def test_endpoint_is_appended_to_api_base(self, client):
+        """The /api prefix of the base URL is preserved."""
+        client.session.request.return_value = MagicMock(status_code=200)
+
+        client._make_request("GET", "/documents/")
+
+        assert client.session.request.call_args.kwargs["url"] == (
+            "http://paperless.test/api/documents/"
+        )
+
+    def test_document_url_is_prebuilt(self, client):
+        """Single-document calls hit /documents/<id>/ under the API base."""
+        client.session.request.return_value = make_response({"id": 42})
+
+        client.update_document(42, {"title": "Rechnung"})
+
+        call = client.session.request.call_args
+        assert call.kwargs["method"] == "PATCH"
+        assert call.kwargs["url"] == "http://paperless.test/api/documents/42/"
+
+    def test_session_forces_json_format(self, client):
+        """format=json is a session default merged into every request."""
+        session = client._create_session()
+
+        prepared = session.prepare_request(
+            requests.Request("GET", "http://paperless.test/api/tags/", params={"page": 2})
+        )
+
+        assert prepared.url == "http://paperless.test/api/tags/?format=json&page=2"
+
+    def test_session_requests_compressed_responses(self, client):
+        """Responses are requested gzip-compressed over kept-alive connections."""
+        session = client._create_session()
+
+        assert "gzip" in session.headers["Accept-Encoding"]
+        assert session.headers["Connection"] == "keep-alive"
+
+    def test_pooled_sockets_use_tcp_keepalive(self, client):
+        """The mounted adapter enables SO_KEEPALIVE on new connections."""
+        adapter = client._create_session().get_adapter("https://paperless.test/api/")
+
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+
+
+class TestConditionalGet:
+    """ETag revalidation for reference endpoints."""
+
+    def test_not_modified_returns_cached_body(self, client):
+        """A 304 answer reuses the body of the previous 200 response."""
+        body = {"count": 1, "next": None, "results": [{"id": 1}]}
+        client.session.request.side_effect = [
+            make_response(body, headers={"ETag": '"v1"'}),
+            make_response(status_code=304),
+        ]
+
+        assert client.get_tags() == body
+        assert client.get_tags() == body
+
+        second_call = client.session.request.call_args_list[1]
+        assert second_call.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_last_modified_is_revalidated(self, client):
+        """Last-Modified is sent back as If-Modified-Since."""
+        stamp = "Wed, 01 Oct 2025 10:00:00 GMT"
+        body = {"count": 1, "next": None, "results": [{"id": 3}]}
+        client.session.request.side_effect = [
+            make_response(body, headers={"Last-Modified": stamp}),
+            make_response(status_code=304),
+        ]
+
+        client.get_document_types()
+
+        assert client.get_document_types() == body
+        second_call = client.session.request.call_args_list[1]
+        assert second_call.kwargs["headers"] == {"If-Modified-Since": stamp}
+
+    def test_use_cache_false_skips_revalidation(self, client):
+        """Without the cache no validators are sent or stored."""
+        client.session.request.return_value = make_response(
+            {"results": []}, headers={"ETag": '"v1"'}
+        )
+
+        client._get_json("/tags/", use_cache=False)
+        client._get_json("/tags/", use_cache=False)
+
+        for call in client.session.request.call_args_list:
+            assert call.kwargs["headers"] is None
+        assert client._etag_cache == {}
+
+    def test_mutating_result_does_not_corrupt_cache(self, client):
+        """Callers get copies of the cached result list."""
+        client.session.request.side_effect = [
+            make_response({"results": [{"id": 1}]}, headers={"ETag": '"v1"'}),
+            make_response(status_code=304),
+            make_response(status_code=304),
+        ]
+
+        client.get_custom_fields().append({"id": 99})
+        client.get_custom_fields().clear()
+
+        assert client.get_custom_fields() == [{"id": 1}]
+
+
+class TestBulkEdit:
+    """Batch operations on many documents."""
+
+    def test_bulk_edit_posts_one_request(self, client):
+        """All document IDs go to /documents/bulk_edit/ in a single POST."""
+        client.session.request.return_value = make_response({"result": "OK"})
+
+        assert client.bulk_edit([1, 2, 3], "set_correspondent", {"correspondent": 5}) == {"result": "OK"}
+
+        call = client.session.request.call_args
+        assert call.kwargs["method"] == "POST"
+        assert call.kwargs["url"] == "http://paperless.test/api/documents/bulk_edit/"
+        assert call.kwargs["json"] == {
+            "documents": [1, 2, 3],
+            "method": "set_correspondent",
+            "parameters": {"correspondent": 5},
+        }
+
+
+class TestUpload:
+    """Document upload."""
+
+    def test_upload_streams_multipart_body(self, client, tmp_path):
+        """The file is sent as a streamed multipart body with its own Content-Type."""
+        pdf = tmp_path / "rechnung.pdf"
+        pdf.write_bytes(b"%PDF-1.4 test")
+        sent = {}
+
+        def request(**kwargs):
+            sent.update(kwargs, payload=kwargs["data"].read())
+            return make_response("task-id")
+
+        client.session.request.side_effect = request
+
+        client.upload_document(pdf, title="Rechnung", tag_ids=[1, 2])
+
+        assert sent["files"] is None
+        assert sent["headers"]["Content-Type"].startswith("multipart/form-data; boundary=")
+        payload = sent["payload"]
+        assert b"%PDF-1.4 test" in payload
+        assert b'name="tags"' in payload and b"1,2" in payload
+
+    def test_server_error_is_retried_with_fresh_body(self, client, tmp_path):
+        """A 503 leads to a second attempt that sends the whole file again."""
+        pdf = tmp_path / "rechnung.pdf"
+        pdf.write_bytes(b"%PDF-1.4 test")
+        payloads = []
+        responses = iter([make_response(status_code=503), make_response("task-id")])
+
+        def request(**kwargs):
+            body = kwargs["data"]
+            payloads.append(body.read() if hasattr(body, "read") else kwargs["files"]["document"][1].read())
+            return next(responses)
+
+        client.session.request.side_effect = request
+
+        with patch("time.sleep"):
+            assert client.upload_document(pdf) == "task-id"
+
+        assert len(payloads) == 2
+        assert all(b"%PDF-1.4 test" in payload for payload in payloads)
+
+    def test_session_does_not_resend_uploads(self, client):
+        """The upload URL is served by an adapter without status/read retries."""
+        session = client._create_session()
+
+        retries = session.get_adapter(client._upload_url + "?format=json").max_retries
+
+        assert not retries.status_forcelist
+        assert retries.read == 0
+
+
+class TestTtlCache:
+    """Short-lived caching of health and info calls."""
+
+    def test_server_info_cached_until_expiry(self, client):
+        """Repeated calls within the TTL do not hit the server."""
+        client.session.request.return_value = make_response({"version": "2.7"})
+
+        assert client.get_server_info() == {"version": "2.7"}
+        assert client.get_server_info() == {"version": "2.7"}
+        assert client.session.request.call_count == 1
+
+        cached_at, value = client._ttl_cache["get_server_info"]
+        client._ttl_cache["get_server_info"] = (cached_at - 31, value)
+        client.get_server_info()
+        assert client.session.request.call_count == 2
+
+    def test_statistics_are_not_cached(self, client):
+        """Document counts are fetched fresh on every call."""
+        client.session.request.return_value = make_response({"documents_total": 7})
+
+        client.get_statistics()
+        client.get_statistics()
+
+        assert client.session.request.call_count == 2
+
+    def test_failed_connection_test_is_not_cached(self, client):
+        """A failed check is repeated on the next call instead of served stale."""
+        client.session.request.side_effect = [
+            requests.ConnectionError("refused"),
+            make_response({"count": 0, "next": None, "results": []}),
+        ]
+
+        assert client.test_connection() is False
+        assert client.test_connection() is True
+        assert client.session.request.call_count == 2
+
+    def test_mutating_result_does_not_corrupt_cache(self, client):
+        """Callers get copies of cached dictionaries."""
+        client.session.request.return_value = make_response({"version": "2.7", "settings": {"dark": True}})
+
+        client.get_server_info()["settings"]["dark"] = False
+        client.get_server_info().clear()
+
+        assert client.get_server_info() == {"version": "2.7", "settings": {"dark": True}}
+
+    def test_close_drops_cached_results(self, client):
+        """close() invalidates cached results."""
+        client.session.request.return_value = make_response({"version": "2.7"})
+
+        client.get_server_info()
+        client.close()
+        client.get_server_info()
+
+        assert client.session.request.call_count == 2
+
+
+class TestReferenceTables:
+    """Unpaginated reference table helpers."""
+
+    def test_all_tags_in_one_request(self, client):
+        """The whole tag table is requested with the maximum page size."""
+        client.session.request.return_value = make_response(
+            {"count": 2, "next": None, "results": [{"id": 1}, {"id": 2}]}
+        )
+
+        tags = client.get_all_tags()
+
+        assert [tag["id"] for tag in tags] == [1, 2]
+        client.session.request.assert_called_once()
+        params = client.session.request.call_args.kwargs["params"]
+        assert params["page_size"] == PaperlessApiClient.MAX_PAGE_SIZE
+
+    def test_capped_pages_are_fetched_concurrently_in_order(self, client):
+        """If the server caps the page size, the rest is fetched in parallel."""
+        tag_ids = [1, 2, 3, 4, 5]
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_tags(page, page_size):
+            # The server caps the page size at 2; pages 2 and 3 wait for each other
+            if page > 1:
+                barrier.wait()
+            ids = tag_ids[(page - 1) * 2:page * 2]
+            return {"count": len(tag_ids), "next": "more" if page < 3 else None,
+                    "results": [{"id": tag_id} for tag_id in ids]}
+
+        with patch.object(client, "get_tags", side_effect=get_tags) as mock_get_tags:
+            tags = client.get_all_tags()
+
+        assert [tag["id"] for tag in tags] == tag_ids
+        assert sorted(c.kwargs["page"] for c in mock_get_tags.call_args_list) == [1, 2, 3]
+        assert not barrier.broken
+
+
+class TestDocumentsGenerator:
+    """Paginated document iteration."""
+
+    def test_yields_documents_across_pages(self, client):
+        """All pages are walked until 'next' is empty."""
+        client.session.request.side_effect = [
+            make_response({"count": 3, "next": "http://internal:8000/api/documents/?page=2&page_size=2",
+                        "results": [{"id": 1, "tags": [1, 2]}, {"id": 2, "tags": []}]}),
+            make_response({"count": 3, "next": None, "results": [{"id": 3, "tags": [3]}]}),
+        ]
+
+        documents = list(client.get_documents_generator(page_size=2))
+
+        assert [doc["id"] for doc in documents] == [1, 2, 3]
+        assert documents[0]["tags"] == [1, 2]
+        assert client.session.request.call_count == 2
+
+    def test_follows_next_cursor_on_configured_host(self, client):
+        """The 'next' query is replayed against the client's own base URL."""
+        client.session.request.side_effect = [
+            make_response({"count": 2, "next": "http://internal:8000/api/documents/?page=2&page_size=1",
+                           "results": [{"id": 1}]}),
+            make_response({"count": 2, "next": None, "results": [{"id": 2}]}),
+        ]
+
+        list(client.get_documents_generator(page_size=1))
+
+        second_call = client.session.request.call_args_list[1]
+        assert second_call.kwargs["url"] == "http://paperless.test/api/documents/?page=2&page_size=1"
+        assert second_call.kwargs["params"] is None
+
+    def test_truncated_body_raises_api_error(self, client):
+        """A body cut off mid-page surfaces as a domain error."""
+        response = make_response()
+        response.raw = io.BytesIO(b'{"count": 2, "next": null, "results": [{"id": 1}, {"id"')
+        client.session.request.return_value = response
+
+        documents = client.get_documents_generator()
+
+        assert next(documents) == {"id": 1}
+        with pytest.raises(PaperlessAPIError):
+            next(documents)
+        response.close.assert_called_once()
+
+    def test_broken_connection_raises_connection_error(self, client):
+        """A connection reset while streaming is mapped like one in _make_request."""
+        response = make_response()
+        response.raw = MagicMock()
+        response.raw.read.side_effect = ProtocolError("Connection broken")
+        client.session.request.return_value = response
+
+        with pytest.raises(PaperlessConnectionError):
+            list(client.get_documents_generator())
@@ -0,0 +1,533 @@
+"""Unit tests for the email CLI in presentation/cli/main.py.
+
+Argument parsing and output formatting are tested without constructing
+the email service.
+"""
+
+import importlib
+import io
+import json
+import logging
+import os
+import stat
+import sys
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.paperless_ngx.application import services as services_package
+from src.paperless_ngx.infrastructure import email as email_package
+
+# The package re-exports main(), which shadows the module attribute
+cli = importlib.import_module("src.paperless_ngx.presentation.cli.main")
+
+
+class TestParseArguments:
+    """Two-phase argument parsing."""
+
+    def test_command_options_are_parsed(self):
+        """Options of the selected command are recognized."""
+        args = cli.parse_arguments(
+            ["--fetch-email-attachments", "--email-account", "Gmail Account 1", "--since-days", "7"]
+        )
+
+        assert args.fetch_email_attachments is True
+        assert args.email_account == "Gmail Account 1"
+        assert args.since_days == 7
+        assert args.output == "text"
+
+    def test_continuous_defaults(self):
+        """Defaults of the continuous mode options are applied."""
+        args = cli.parse_arguments(["--run-email-fetcher"])
+
+        assert args.fetch_interval == 300
+        assert args.max_iterations is None
+
+    def test_options_of_other_commands_are_still_accepted(self):
+        """Leftover options fall back to the complete parser."""
+        args = cli.parse_arguments(["--test-email-connections", "--dry-run"])
+
+        assert args.test_email_connections is True
+        assert args.dry_run is True
+
+    def test_unknown_option_is_rejected(self, capsys):
+        """Unknown options still fail with argparse's usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            cli.parse_arguments(["--email-stats", "--no-such-option"])
+
+        assert exc_info.value.code == 2
+        assert "unrecognized arguments" in capsys.readouterr().err
+
+    def test_complete_parser_is_built_once(self):
+        """Repeated calls reuse the same parser instance."""
+        assert cli.setup_parser() is cli.setup_parser()
+
+
+class TestFastParse:
+    """argparse-free parsing of plain command lines."""
+
+    def test_matches_complete_parser(self):
+        """The fast path yields the same attributes as argparse."""
+        argv = [
+            "-v", "--fetch-email-attachments", "--email-account=Gmail Account 1",
+            "--since-days", "7", "--output", "json",
+        ]
+
+        fast = cli._parse_argv(argv)
+
+        assert fast is not None
+        assert vars(fast) == vars(cli.setup_parser().parse_args(argv))
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--help"],
+            ["--fetch-email"],
+            ["--since-days", "seven"],
+            ["--output", "xml"],
+            ["--email-account"],
+            ["--dry-run=yes"],
+            ["positional"],
+        ],
+    )
+    def test_defers_to_argparse(self, argv):
+        """Help, abbreviations and invalid input are left to argparse."""
+        assert cli._parse_argv(argv) is None
+
+    def test_option_table_mirrors_complete_parser(self):
+        """_FAST_OPTIONS and _FAST_DEFAULTS match the argparse definition."""
+        parser = cli.setup_parser()
+        expected = {}
+        for action in parser._actions:
+            if action.dest == "help":
+                continue
+            if action.nargs == 0:
+                converter = None
+            elif action.choices:
+                converter = cli._output_format
+            else:
+                converter = action.type
+            for option in action.option_strings:
+                expected[option] = (action.dest, converter)
+
+        assert cli._FAST_OPTIONS == expected
+        assert cli._FAST_DEFAULTS == vars(parser.parse_args([]))
+
+
+class TestFormatOutput:
+    """Streaming result formatting."""
+
+    RESULTS = {
+        "total": 7,
+        "by_account": {"Gmail": {"count": 2}, "IONOS": {"count": 0}},
+        "files": ["a.pdf", "b.pdf", "c.pdf", "d.pdf", "e.pdf", "f.pdf"],
+    }
+
+    def test_text_is_written_to_sink(self):
+        """Nested dicts are indented and long lists truncated."""
+        sink = io.StringIO()
+
+        cli.format_output(self.RESULTS, "text", sink)
+
+        assert sink.getvalue() == (
+            "total: 7\n"
+            "by_account:\n"
+            "  Gmail:\n"
+            "    count: 2\n"
+            "  IONOS:\n"
+            "    count: 0\n"
+            "files: [6 items]\n"
+            "  - a.pdf\n  - b.pdf\n  - c.pdf\n  - d.pdf\n  - e.pdf\n"
+            "  ... and 1 more\n"
+        )
+
+    def test_json_defaults_to_stdout(self, capsys):
+        """JSON is dumped to stdout when no sink is given."""
+        cli.format_output({"name": "Müller"}, "json")
+
+        assert json.loads(capsys.readouterr().out) == {"name": "Müller"}
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_json_rendering_matches_stdlib(self, monkeypatch, orjson_available):
+        """orjson and the json fallback render the same document."""
+        if orjson_available and not cli.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(cli, "ORJSON_AVAILABLE", orjson_available)
+        results = {"count": 2, "since": datetime(2025, 7, 1, 8, 30), "name": "Müller", 3: [1.5]}
+
+        rendered = cli.render_json(results)
+
+        expected = json.dumps(results, indent=2, ensure_ascii=False, default=str) + "\n"
+        assert rendered == expected.encode("utf-8")
+
+    def test_deep_nesting(self):
+        """Nesting deeper than the recursion limit is formatted."""
+        results = current = {}
+        for _ in range(2000):
+            current["level"] = current = {}
+        sink = io.StringIO()
+
+        cli.format_output(results, "text", sink)
+
+        assert sink.getvalue().count("level:") == 2000
+
+
+class TestFetchResults:
+    """Result building for --fetch-email-attachments."""
+
+    @staticmethod
+    def make_service(counts):
+        """Create a service mock returning attachment mocks per account."""
+        service = MagicMock()
+        service.attachments = {
+            name: [MagicMock(**{"to_dict.return_value": {"n": i}}) for i in range(count)]
+            for name, count in counts.items()
+        }
+        service.clients = {
+            name: MagicMock(**{"account.imap_server": f"imap.{name.lower()}.de"})
+            for name in counts
+        }
+        service.fetch_account.side_effect = lambda name, **kwargs: service.attachments.get(name, [])
+        return service
+
+    def test_text_output_converts_only_shown_entries(self):
+        """Text output leaves attachments past the first lines unconverted."""
+        service = self.make_service({"Gmail": 20, "IONOS": 3})
+        args = cli.parse_arguments(["--fetch-email-attachments"])
+
+        results = cli.handle_fetch_email_attachments(args, service)
+        cli.format_output(results, "text", io.StringIO())
+
+        assert results["total_attachments"] == 23
+        assert len(results["by_account"]["Gmail"]) == 20
+        converted = [
+            att.to_dict.called
+            for atts in service.attachments.values()
+            for att in atts
+        ]
+        assert sum(converted) == 2
+
+    def test_batch_size_is_passed_to_service(self):
+        """--fetch-batch-size reaches the service, defaulting to 100."""
+        service = self.make_service({"Gmail": 0})
+
+        cli.handle_fetch_email_attachments(cli.parse_arguments(["--fetch-email-attachments"]), service)
+        cli.handle_fetch_email_attachments(
+            cli.parse_arguments(["--fetch-email-attachments", "--email-account", "Gmail", "--fetch-batch-size", "25"]),
+            service,
+        )
+
+        batch_sizes = [c.kwargs["batch_size"] for c in service.fetch_account.call_args_list]
+        assert batch_sizes == [100, 25]
+
+    def test_failing_account_does_not_stop_others(self):
+        """An account raising an error yields an empty list."""
+        service = self.make_service({"Gmail": 1, "IONOS": 2})
+        service.fetch_account.side_effect = lambda name, **kwargs: (
+            service.attachments[name] if name == "IONOS" else 1 / 0
+        )
+        args = cli.parse_arguments(["--fetch-email-attachments", "--concurrency", "2"])
+
+        results = cli.handle_fetch_email_attachments(args, service)
+
+        assert results["total_attachments"] == 2
+        assert list(results["by_account"]) == ["Gmail", "IONOS"]
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2025-07-01", datetime(2025, 7, 1)),
+            ("2025-07-01T08:30:00", datetime(2025, 7, 1, 8, 30)),
+        ],
+    )
+    def test_since_date_is_parsed(self, value, expected):
+        """--since-date accepts dates and ISO timestamps."""
+        service = self.make_service({"Gmail": 0})
+        args = cli.parse_arguments(["--fetch-email-attachments", "--since-date", value])
+
+        cli.handle_fetch_email_attachments(args, service)
+
+        kwargs = service.fetch_account.call_args.kwargs
+        assert kwargs["since_date"] == expected
+        assert kwargs["since_imap"] == "01-Jul-2025"
+
+    def test_invalid_since_date_exits(self):
+        """An unparseable date ends the command with exit code 1."""
+        args = cli.parse_arguments(["--fetch-email-attachments", "--since-date", "01.07.2025"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            cli.handle_fetch_email_attachments(args, self.make_service({}))
+
+        assert exc_info.value.code == 1
+
+    def test_json_output_converts_everything(self):
+        """JSON output holds plain lists of attachment dicts."""
+        service = self.make_service({"Gmail": 2})
+        args = cli.parse_arguments(["--fetch-email-attachments", "--output", "json"])
+
+        results = cli.handle_fetch_email_attachments(args, service)
+
+        assert results["by_account"] == {"Gmail": [{"n": 0}, {"n": 1}]}
+
+
+class TestConnectionTests:
+    """Parallel connection tests."""
+
+    def test_accounts_are_tested_in_parallel(self):
+        """Accounts on different servers are tested concurrently."""
+        barrier = threading.Barrier(3, timeout=5)
+        service = MagicMock()
+        service.clients = {
+            name: MagicMock(**{"account.imap_server": f"imap.{name.lower()}.de"})
+            for name in ("Gmail", "IONOS", "GMX")
+        }
+        service.test_account_connection.side_effect = lambda name: barrier.wait() >= 0
+
+        results = cli.handle_test_email_connections(service)
+
+        assert results["successful"] == 3
+        assert results["failed"] == 0
+        assert list(results["accounts"]) == ["Gmail", "IONOS", "GMX"]
+
+    def test_failed_accounts_are_counted(self):
+        """Accounts whose test fails are reported as failed."""
+        service = MagicMock()
+        service.clients = {
+            name: MagicMock(**{"account.imap_server": "imap.ionos.de"})
+            for name in ("IONOS 1", "IONOS 2", "IONOS 3")
+        }
+        service.test_account_connection.side_effect = lambda name: name != "IONOS 2"
+
+        results = cli.handle_test_email_connections(service)
+
+        assert (results["tested_accounts"], results["successful"], results["failed"]) == (3, 2, 1)
+
+    def test_connections_per_host_are_capped(self):
+        """No more than the per-host limit run against one server."""
+        lock = threading.Lock()
+        active = peak = 0
+        service = MagicMock()
+        service.clients = {
+            f"Konto {i}": MagicMock(**{"account.imap_server": "imap.gmail.com"})
+            for i in range(6)
+        }
+
+        def check(name):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return True
+
+        service.test_account_connection.side_effect = check
+
+        results = cli.handle_test_email_connections(service, concurrency=6)
+
+        assert (results["successful"], results["failed"]) == (6, 0)
+        assert peak <= cli._MAX_CONNECTIONS_PER_HOST
+
+
+class TestMain:
+    """CLI entry point."""
+
+    def test_no_command_prints_help_without_loading_config(self, monkeypatch, capsys):
+        """Help is printed before configuration is read."""
+        load_config = MagicMock()
+        monkeypatch.setattr(email_package, "load_email_config_from_env", load_config)
+        monkeypatch.setattr(sys, "argv", ["paperless-cli", "--verbose"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            cli.main()
+
+        assert exc_info.value.code == 0
+        assert "Email Commands" in capsys.readouterr().out
+        load_config.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "flags, level",
+        [
+            ([], logging.WARNING),
+            (["--verbose"], logging.INFO),
+            (["--debug"], logging.DEBUG),
+        ],
+    )
+    def test_logging_setup(self, monkeypatch, flags, level):
+        """Logs go to stderr with timestamps and logger names at every level."""
+        basic_config = MagicMock()
+        monkeypatch.setattr(logging, "basicConfig", basic_config)
+        monkeypatch.setattr(email_package, "load_email_config_from_env", MagicMock())
+        monkeypatch.setattr(services_package, "EmailFetcherService", MagicMock())
+        monkeypatch.setattr(sys, "argv", ["paperless-cli", "--email-stats", *flags])
+
+        cli.main()
+
+        kwargs = basic_config.call_args.kwargs
+        assert kwargs["level"] == level
+        assert kwargs["stream"] is sys.stderr
+        assert kwargs["format"] == "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+    def test_repl_runs_commands_on_one_service(self, monkeypatch, capsys):
+        """Each stdin line is a command; bad lines do not end the session."""
+        service = MagicMock()
+        service.get_statistics.return_value = {"configured_accounts": 2}
+        service.reset_account_state.return_value = True
+        monkeypatch.setattr(sys, "stdin", io.StringIO(
+            "--email-stats\n"
+            "--no-such-option\n"
+            "\n"
+            "--reset-email-state 'Gmail Account 1' --output json\n"
+            "exit\n"
+            "--email-stats\n"
+        ))
+
+        cli.run_repl(service)
+
+        assert service.get_statistics.call_count == 1
+        service.reset_account_state.assert_called_once_with("Gmail Account 1")
+        assert "configured_accounts: 2" in capsys.readouterr().out
+
+    def test_repl_reports_failing_first_command(self, monkeypatch, caplog):
+        """A failing command is logged with the session's debug flag."""
+        monkeypatch.setattr(cli, "run_command", MagicMock(side_effect=RuntimeError("IMAP down")))
+
+        with caplog.at_level(logging.ERROR):
+            cli.run_repl(MagicMock(), io.StringIO("--email-stats --debug\n"), debug=False)
+
+        [record] = caplog.records
+        assert record.getMessage() == "Error: IMAP down"
+        assert not record.exc_info
+
+    def test_json_output_file_is_written_as_bytes(self, tmp_path):
+        """--output-file receives the encoded JSON document."""
+        target = tmp_path / "stats.json"
+        service = MagicMock()
+        service.get_statistics.return_value = {"name": "Müller"}
+        args = cli.parse_arguments(["--email-stats", "--output", "json", "--output-file", str(target)])
+
+        cli.run_command(args, service)
+
+        assert json.loads(target.read_bytes()) == {"name": "Müller"}
+
+
+class TestConfigCache:
+    """On-disk cache of the email configuration."""
+
+    @pytest.fixture
+    def loader(self, monkeypatch, tmp_path):
+        """Count real loads and keep the cache inside tmp_path."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.setenv("EMAIL_CHECK_INTERVAL", "300")
+        monkeypatch.setenv("EMAIL_ACCOUNT_1_USERNAME", "user@gmail.com")
+        monkeypatch.setenv("EMAIL_ACCOUNT_1_PASSWORD", "geheim-123")
+        load = MagicMock(wraps=email_package.load_email_config_from_env)
+        monkeypatch.setattr(email_package, "load_email_config_from_env", load)
+        return load
+
+    @pytest.fixture
+    def cache_file(self, tmp_path):
+        """Location of the cache file."""
+        return tmp_path / "cache" / "paperless_ngx" / "cfg.json"
+
+    def test_second_load_uses_cache(self, loader, cache_file, tmp_path):
+        """The configuration is loaded once and cached with owner-only access."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("EMAIL_CHECK_INTERVAL=300\n")
+
+        first = cli._cached_load_email_config(str(env_file))
+        second = cli._cached_load_email_config(str(env_file))
+
+        assert second.model_dump() == first.model_dump()
+        assert second.get_email_accounts()[0].password == "geheim-123"
+        assert loader.call_count == 1
+        assert stat.S_IMODE(cache_file.stat().st_mode) == 0o600
+
+    def test_credentials_are_not_cached(self, loader, cache_file, monkeypatch, tmp_path):
+        """The cache holds no credentials; they are read from the environment."""
+        cli._cached_load_email_config(str(tmp_path / "missing.env"))
+        monkeypatch.setenv("EMAIL_ACCOUNT_1_PASSWORD", "neu-456")
+
+        settings = cli._cached_load_email_config(str(tmp_path / "missing.env"))
+
+        content = cache_file.read_text()
+        assert "geheim-123" not in content
+        assert "user@gmail.com" not in content
+        assert settings.get_email_accounts()[0].password == "neu-456"
+        assert loader.call_count == 1
+
+    def test_legacy_pickle_is_removed(self, loader, cache_file, tmp_path):
+        """A pickle cache of earlier versions is deleted, never loaded."""
+        legacy = cache_file.with_name("cfg.pkl")
+        legacy.parent.mkdir(parents=True)
+        legacy.write_bytes(b"not a pickle")
+
+        cli._cached_load_email_config(str(tmp_path / "missing.env"))
+
+        assert not legacy.exists()
+
+    def test_changed_env_file_invalidates_cache(self, loader, tmp_path):
+        """A modified .env triggers a fresh load."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("EMAIL_CHECK_INTERVAL=300\n")
+        cli._cached_load_email_config(str(env_file))
+
+        env_file.write_text("EMAIL_CHECK_INTERVAL=600\n")
+        os.utime(env_file, ns=(0, 10**18))
+        cli._cached_load_email_config(str(env_file))
+
+        assert loader.call_count == 2
+
+    def test_changed_variable_invalidates_cache(self, loader, monkeypatch, tmp_path):
+        """A changed EMAIL_* variable triggers a fresh load."""
+        cli._cached_load_email_config(str(tmp_path / "missing.env"))
+        monkeypatch.setenv("EMAIL_CHECK_INTERVAL", "600")
+
+        settings = cli._cached_load_email_config(str(tmp_path / "missing.env"))
+
+        assert settings.email_check_interval == 600
+        assert loader.call_count == 2
+
+
+class TestRunCommand:
+    """Command dispatch."""
+
+    def test_first_selected_command_wins(self):
+        """Commands are checked in the documented precedence order."""
+        service = MagicMock()
+        service.reset_account_state.return_value = True
+        args = cli.parse_arguments(["--email-stats", "--reset-email-state", "Gmail"])
+
+        cli.run_command(args, service)
+
+        service.reset_account_state.assert_called_once_with("Gmail")
+        service.get_statistics.assert_not_called()
+
+    def test_json_goes_to_binary_stdout(self, monkeypatch):
+        """JSON results are written as bytes after pending text output."""
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        monkeypatch.setattr(sys, "stdout", stdout)
+        service = MagicMock()
+        service.get_statistics.return_value = {"name": "Müller"}
+        args = cli.parse_arguments(["--email-stats", "--output", "json"])
+
+        stdout.write("Statistik:\n")
+        cli.run_command(args, service)
+
+        raw = stdout.buffer.getvalue()
+        assert raw.startswith("Statistik:\n".encode("utf-8"))
+        assert json.loads(raw[len("Statistik:\n"):]) == {"name": "Müller"}
+
+    def test_continuous_mode_prints_nothing(self, capsys):
+        """--run-email-fetcher runs the service loop without output."""
+        service = MagicMock()
+        args = cli.parse_arguments(["--run-email-fetcher", "--max-iterations", "1"])
+
+        cli.run_command(args, service)
+
+        service.run_continuous.assert_called_once_with(interval=300, max_iterations=1)
+        assert capsys.readouterr().out == ""
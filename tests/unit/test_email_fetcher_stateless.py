@@ -4,8 +4,10 @@ This test suite verifies that the EmailFetcherService operates in a completely
 stateless manner, without creating or maintaining any persistent state files.
 """
 
+import asyncio
 import json
 import tempfile
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
@@ -16,6 +18,7 @@ from paperless_ngx.application.services.email_fetcher_service import (
     EmailFetcherService,
     EmailProcessingState,
 )
+from paperless_ngx.domain.value_objects import DateRange
 from paperless_ngx.infrastructure.email import EmailAccount, EmailSettings
 
 
@@ -189,6 +192,50 @@ class TestEmailFetcherStatelessBehavior:
             for uid in test_uids:
                 mock_imap_client.fetch_email.assert_any_call(uid)
 
+    def test_batched_fetch(
+        self, mock_email_settings, mock_attachment_processor, mock_imap_client
+    ):
+        """Emails are fetched per batch; emails missing from a batch singly."""
+        # Arrange
+        service = EmailFetcherService(
+            email_settings=mock_email_settings,
+            attachment_processor=mock_attachment_processor,
+        )
+        mock_imap_client.search_emails.return_value = ["1", "2", "3", "4", "5"]
+        mock_imap_client.fetch_emails = Mock(
+            side_effect=lambda batch: {uid: Mock(attachments=[]) for uid in batch if uid != "2"}
+        )
+        mock_imap_client.fetch_email.return_value = Mock(attachments=[])
+        service.clients["Test Account 1"] = mock_imap_client
+        
+        # Act
+        service.fetch_account("Test Account 1", batch_size=2)
+        
+        # Assert - Two batch requests, the trailing single email and the gap fetched alone
+        assert [c.args[0] for c in mock_imap_client.fetch_emails.call_args_list] == [
+            ["1", "2"],
+            ["3", "4"],
+        ]
+        assert [c.args[0] for c in mock_imap_client.fetch_email.call_args_list] == ["2", "5"]
+        assert service.processing_states["Test Account 1"].total_processed == 5
+
+    def test_preformatted_imap_date_is_used(
+        self, mock_email_settings, mock_attachment_processor, mock_imap_client
+    ):
+        """A preformatted IMAP date is passed to the search as is."""
+        # Arrange
+        service = EmailFetcherService(
+            email_settings=mock_email_settings,
+            attachment_processor=mock_attachment_processor,
+        )
+        service.clients["Test Account 1"] = mock_imap_client
+        
+        # Act
+        service.fetch_account("Test Account 1", since_imap="01-Jul-2025")
+        
+        # Assert
+        mock_imap_client.search_emails.assert_called_once_with(since_imap="01-Jul-2025")
+
     def test_date_filtering_only(
         self, mock_email_settings, mock_attachment_processor, mock_imap_client
     ):
@@ -374,6 +421,117 @@ class TestDateRangeProcessing:
             assert result == []
             assert mock_imap_client.fetch_email.call_count == 0
 
+    def test_range_is_fetched_in_bulk(
+        self, mock_email_settings, mock_attachment_processor, mock_imap_client
+    ):
+        """Emails in a range are fetched per bulk and returned with content."""
+        # Arrange
+        service = EmailFetcherService(
+            email_settings=mock_email_settings,
+            attachment_processor=mock_attachment_processor,
+        )
+        mock_imap_client.connection = None
+        mock_imap_client.search_emails.return_value = ["1", "2", "3"]
+        attachment = Mock(filename="rechnung.pdf", content=b"%PDF")
+        mock_imap_client.fetch_emails = Mock(
+            side_effect=lambda batch: {
+                uid: Mock(date=None, subject=uid, sender="a@b.de",
+                          attachments=[attachment] if uid != "2" else [])
+                for uid in batch
+            }
+        )
+        service.clients["Test Account 1"] = mock_imap_client
+        date_range = DateRange(start_date=datetime(2025, 7, 1), end_date=datetime(2025, 7, 31))
+        
+        # Act
+        emails = asyncio.run(
+            service.fetch_emails_in_range("Test Account 1", date_range, bulk_size=2)
+        )
+        
+        # Assert
+        assert [c.args[0] for c in mock_imap_client.fetch_emails.call_args_list] == [
+            ["1", "2"],
+            ["3"],
+        ]
+        assert [e["subject"] for e in emails] == ["1", "3"]
+        assert emails[0]["attachments"] == [
+            {"filename": "rechnung.pdf", "type": ".pdf", "data": b"%PDF"}
+        ]
+        mock_imap_client.search_emails.assert_called_once_with(criteria='SINCE "01-Jul-2025"')
+        mock_imap_client.disconnect.assert_called_once()
+
+    def test_range_fetch_falls_back_for_missing_emails(
+        self, mock_email_settings, mock_attachment_processor, mock_imap_client, caplog
+    ):
+        """Emails missing from a bulk response are fetched singly and post-processed."""
+        # Arrange
+        mock_email_settings.mark_as_read = True
+        mock_email_settings.delete_after_processing = True
+        service = EmailFetcherService(
+            email_settings=mock_email_settings,
+            attachment_processor=mock_attachment_processor,
+        )
+        mock_imap_client.connection = None
+        mock_imap_client.search_emails.return_value = ["1", "2", "3"]
+        attachment = Mock(filename="rechnung.pdf", content=b"%PDF")
+        
+        def make_email(uid):
+            return Mock(date=None, subject=uid, sender="a@b.de", attachments=[attachment])
+        
+        # The server leaves out email 2 of the bulk response
+        mock_imap_client.fetch_emails = Mock(
+            side_effect=lambda batch: {uid: make_email(uid) for uid in batch if uid != "2"}
+        )
+        mock_imap_client.fetch_email = Mock(side_effect=make_email)
+        service.clients["Test Account 1"] = mock_imap_client
+        date_range = DateRange(start_date=datetime(2025, 7, 1), end_date=datetime(2025, 7, 31))
+        
+        # Act
+        with caplog.at_level("WARNING"):
+            emails = asyncio.run(service.fetch_emails_in_range("Test Account 1", date_range))
+        
+        # Assert
+        assert [e["subject"] for e in emails] == ["1", "2", "3"]
+        mock_imap_client.fetch_email.assert_called_once_with("2")
+        assert "missing from bulk fetch" in caplog.text
+        assert [c.args[0] for c in mock_imap_client.mark_as_read.call_args_list] == ["1", "2", "3"]
+        assert [c.args[0] for c in mock_imap_client.delete_email.call_args_list] == ["1", "2", "3"]
+        state = service.processing_states["Test Account 1"]
+        assert state.total_processed == 3
+        assert state.total_attachments == 3
+        assert state.last_check is not None
+
+    def test_ranges_of_accounts_are_fetched_concurrently(
+        self, mock_email_settings, mock_attachment_processor
+    ):
+        """Gathered range fetches do not block each other."""
+        # Arrange
+        service = EmailFetcherService(
+            email_settings=mock_email_settings,
+            attachment_processor=mock_attachment_processor,
+        )
+        barrier = threading.Barrier(2, timeout=5)
+        for name in ("Test Account 1", "Test Account 2"):
+            client = Mock(connection=None)
+            client.search_emails.return_value = ["1"]
+            client.fetch_emails = Mock(side_effect=lambda batch: (barrier.wait(), {})[1])
+            client.fetch_email.return_value = None
+            service.clients[name] = client
+        date_range = DateRange(start_date=datetime(2025, 7, 1), end_date=datetime(2025, 7, 31))
+        
+        async def fetch_both():
+            return await asyncio.gather(
+                service.fetch_emails_in_range("Test Account 1", date_range),
+                service.fetch_emails_in_range("Test Account 2", date_range),
+            )
+        
+        # Act - Each fetch waits at the barrier for the other one
+        results = asyncio.run(fetch_both())
+        
+        # Assert
+        assert results == [[], []]
+        assert not barrier.broken
+
     def test_custom_date_range(
         self, mock_email_settings, mock_attachment_processor, mock_imap_client
     ):
@@ -624,6 +782,86 @@ class TestConnectionManagement:
         assert results["Test Account 1"] is True
         assert results["Test Account 2"] is False
 
+    def test_keep_alive_reuses_connection(
+        self, mock_email_settings, mock_attachment_processor, mock_imap_client
+    ):
+        """Keep-alive services log in once and log out on close()."""
+        # Arrange
+        service = EmailFetcherService(
+            email_settings=mock_email_settings,
+            attachment_processor=mock_attachment_processor,
+            keep_alive=True,
+        )
+        mock_imap_client.connection = None
+        mock_imap_client.connect.side_effect = lambda: setattr(
+            mock_imap_client, "connection", Mock(**{"noop.return_value": ("OK", [b""])})
+        )
+        service.clients = {"Test Account 1": mock_imap_client}
+        
+        # Act
+        service.fetch_account("Test Account 1")
+        service.list_folders("Test Account 1")
+        service.fetch_account("Test Account 1")
+        
+        # Assert
+        mock_imap_client.connect.assert_called_once()
+        mock_imap_client.disconnect.assert_not_called()
+        
+        service.close()
+        mock_imap_client.disconnect.assert_called_once()
+
+    def test_acquire_pools_connection(
+        self, mock_email_settings, mock_attachment_processor, mock_imap_client
+    ):
+        """Repeated acquire() calls share one login and start the keepalive."""
+        # Arrange
+        service = EmailFetcherService(
+            email_settings=mock_email_settings,
+            attachment_processor=mock_attachment_processor,
+            keep_alive=True,
+        )
+        mock_imap_client.connection = None
+        mock_imap_client.connect.side_effect = lambda: setattr(
+            mock_imap_client, "connection", Mock(**{"noop.return_value": ("OK", [b""])})
+        )
+        service.clients = {"Test Account 1": mock_imap_client}
+        
+        async def acquire_twice():
+            first = await service.acquire("Test Account 1")
+            second = await service.acquire("Test Account 1")
+            return first, second, service._keepalive_task.done()
+        
+        # Act
+        first, second, keepalive_done = asyncio.run(acquire_twice())
+        
+        # Assert
+        assert first is second is mock_imap_client
+        assert keepalive_done is False
+        mock_imap_client.connect.assert_called_once()
+
+    def test_keepalive_drops_dead_and_skips_busy_connections(
+        self, mock_email_settings, mock_attachment_processor
+    ):
+        """NOOP failures evict the connection; clients in use are left alone."""
+        # Arrange
+        service = EmailFetcherService(
+            email_settings=mock_email_settings,
+            attachment_processor=mock_attachment_processor,
+            keep_alive=True,
+        )
+        dead = Mock(connection=Mock(**{"noop.side_effect": OSError("reset")}))
+        busy = Mock(connection=Mock())
+        service.clients = {"dead": dead, "busy": busy}
+        service._client_locks["busy"] = threading.Lock()
+        service._client_locks["busy"].acquire()
+        
+        # Act
+        service._noop_idle_clients()
+        
+        # Assert
+        dead.disconnect.assert_called_once()
+        busy.connection.noop.assert_not_called()
+
     def test_folder_listing(
         self, mock_email_settings, mock_attachment_processor, mock_imap_client
     ):
@@ -0,0 +1,116 @@
+"""Unit tests for the logging infrastructure.
+
+Covers the custom handler and filters in logger.py without calling
+setup_logging(), so the global logging configuration stays untouched.
+"""
+
+import logging
+
+import pytest
+
+from src.paperless_ngx.infrastructure.logging.logger import (
+    FastRotatingFileHandler,
+    SensitiveDataFilter,
+)
+
+
+@pytest.fixture
+def make_handler(tmp_path):
+    """Create FastRotatingFileHandlers writing plain messages into tmp_path."""
+    handlers = []
+
+    def factory(max_bytes=100, backup_count=2):
+        handler = FastRotatingFileHandler(
+            tmp_path / "app.log",
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers.append(handler)
+        return handler
+
+    yield factory
+
+    for handler in handlers:
+        handler.close()
+
+
+def make_record(message, args=None):
+    """Build a log record carrying a message and optional args."""
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, args, None)
+
+
+class TestFastRotatingFileHandler:
+    """Byte-counting rotating file handler."""
+
+    def test_counter_seeded_from_existing_file(self, tmp_path, make_handler):
+        """An existing log file's size is picked up on open."""
+        (tmp_path / "app.log").write_bytes(b"x" * 42)
+
+        handler = make_handler()
+
+        assert handler._bytes_written == 42
+
+    def test_counter_matches_file_size_for_umlauts(self, tmp_path, make_handler):
+        """Multi-byte characters are counted as bytes, not characters."""
+        handler = make_handler(max_bytes=10_000)
+
+        for _ in range(5):
+            handler.emit(make_record("Prüfe Dokument für Müller"))
+        handler.flush()
+
+        assert handler._bytes_written == (tmp_path / "app.log").stat().st_size
+
+    def test_rollover_when_limit_reached(self, tmp_path, make_handler):
+        """The file is rotated once the counter reaches maxBytes."""
+        handler = make_handler(max_bytes=100)
+
+        for _ in range(15):
+            handler.emit(make_record("x" * 19))
+        handler.flush()
+
+        assert (tmp_path / "app.log.1").stat().st_size == 100
+        assert handler._bytes_written == (tmp_path / "app.log").stat().st_size == 100
+
+
+class TestSensitiveDataFilter:
+    """Masking of tokens, keys and passwords in log records."""
+
+    @pytest.fixture
+    def log_filter(self):
+        """Create the filter under test."""
+        return SensitiveDataFilter()
+
+    def test_trailing_prefix_without_value(self, log_filter):
+        """A prefix at the very end of the message is left as is."""
+        record = make_record("Authorization header: Token ")
+
+        assert log_filter.filter(record) is True
+        assert record.msg == "Authorization header: Token "
+
+    def test_masks_every_secret_in_message(self, log_filter):
+        """All occurrences of all prefixes are masked."""
+        record = make_record("Token abc then Token def, password=geheim secret=s3cr3t done")
+
+        log_filter.filter(record)
+
+        assert record.msg == (
+            "Token [MASKED] then Token [MASKED] password=[MASKED] secret=[MASKED] done"
+        )
+
+    def test_masks_structlog_event_dict(self, log_filter):
+        """Structlog event dicts keep their shape; only string values are masked."""
+        record = make_record({"event": "login api_key=xyz", "user_id": 7})
+
+        log_filter.filter(record)
+
+        assert record.msg == {"event": "login api_key=[MASKED]", "user_id": 7}
+
+    def test_masks_args(self, log_filter):
+        """Positional arguments are masked as well."""
+        record = make_record("Header: %s", ("Bearer eyJhbGciOi",))
+
+        log_filter.filter(record)
+
+        assert record.getMessage() == "Header: Bearer [MASKED]"
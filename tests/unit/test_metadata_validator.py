@@ -5,9 +5,10 @@ especially the German sender/recipient rules and tag validation.
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
+from src.paperless_ngx.domain.validators import metadata_validator
 from src.paperless_ngx.domain.validators.metadata_validator import MetadataValidator
 
 
@@ -721,4 +722,21 @@ class TestMetadataValidator:
         is_valid, errors, suggestions = validator.validate(metadata)
         
         # Should handle Unicode/German characters properly
-        assert not any("ungültige Zeichen" in error for error in errors)
\ No newline at end of file
+        assert not any("ungültige Zeichen" in error for error in errors)
+
+
+class TestParseIso:
+    """ISO timestamp parsing with and without native 'Z' support."""
+
+    @pytest.mark.parametrize("accepts_z", [True, False])
+    def test_trailing_z_is_utc(self, accepts_z):
+        """A trailing 'Z' parses as UTC whichever branch is taken."""
+        with patch.object(metadata_validator, "_FROMISOFORMAT_ACCEPTS_Z", accepts_z):
+            parsed = metadata_validator._parse_iso("2024-03-15T10:00:00Z")
+
+        assert parsed == datetime(2024, 3, 15, 10, tzinfo=timezone.utc)
+
+    def test_offset_and_naive_values_are_unchanged(self):
+        """Values without 'Z' go straight to fromisoformat."""
+        assert metadata_validator._parse_iso("2024-03-15T10:00:00+02:00").utcoffset() == timedelta(hours=2)
+        assert metadata_validator._parse_iso("2024-03-15") == datetime(2024, 3, 15)
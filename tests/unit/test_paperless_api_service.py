@@ -0,0 +1,65 @@
+"""Unit tests for PaperlessApiService document retrieval."""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.paperless_ngx.application.services.paperless_api_service import PaperlessApiService
+from src.paperless_ngx.domain.value_objects import DateRange
+
+
+@pytest.fixture
+def make_service():
+    """Create services whose client serves `count` numbered documents."""
+
+    def factory(count):
+        client = Mock(pool_maxsize=4)
+
+        def get_documents(page, page_size, ordering=None, **filters):
+            start = (page - 1) * page_size
+            return {
+                "count": count,
+                "next": None,
+                "results": list(range(start, min(count, start + page_size))),
+            }
+
+        client.get_documents.side_effect = get_documents
+        return PaperlessApiService(api_client=client)
+
+    return factory
+
+
+@pytest.fixture
+def date_range():
+    """First quarter of 2025."""
+    return DateRange(start_date=datetime(2025, 1, 1), end_date=datetime(2025, 3, 31))
+
+
+class TestGetDocumentsInRange:
+    """Concurrent page retrieval for a date range."""
+
+    def test_pages_are_returned_in_order(self, make_service, date_range):
+        """All pages are fetched once and concatenated in page order."""
+        service = make_service(1050)
+
+        documents = service.get_documents_in_range(date_range, chunk_size=100)
+
+        assert documents == list(range(1050))
+        pages = sorted(c.kwargs["page"] for c in service.api_client.get_documents.call_args_list)
+        assert pages == list(range(1, 12))
+
+    def test_date_filters_are_sent(self, make_service, date_range):
+        """Every page request carries the date range filters."""
+        service = make_service(10)
+
+        service.get_documents_in_range(date_range)
+
+        service.api_client.get_documents.assert_called_once_with(
+            page=1,
+            page_size=500,
+            ordering="-created",
+            format="json",
+            created__date__gte="2025-01-01",
+            created__date__lte="2025-03-31",
+        )
@@ -0,0 +1,210 @@
+"""Unit tests for the platform abstraction layer.
+
+Both implementations are pure Python, so the Windows rules are exercised on
+any host by instantiating WindowsPlatform directly.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.paperless_ngx.infrastructure.platform import factory
+from src.paperless_ngx.infrastructure.platform.posix_platform import PosixPlatform
+from src.paperless_ngx.infrastructure.platform.windows_platform import WindowsPlatform
+
+
+class TestDetectPlatform:
+    """Platform detection from sys.platform."""
+
+    @pytest.mark.parametrize(
+        "sys_platform, expected",
+        [
+            ("win32", "Windows"),
+            ("darwin", "Darwin"),
+            ("linux", "Linux"),
+            ("freebsd14", "FreeBSD"),
+        ],
+    )
+    def test_maps_sys_platform_to_system_name(self, sys_platform, expected):
+        """sys.platform values map to the names platform.system() reports."""
+        factory.detect_platform.cache_clear()
+        try:
+            with patch.object(factory, "_SYS_PLATFORM", sys_platform):
+                assert factory.detect_platform() == expected
+        finally:
+            factory.detect_platform.cache_clear()
+
+    def test_platform_checks_are_cached(self):
+        """Repeated checks do not re-run detection."""
+        factory.is_linux.cache_clear()
+        try:
+            with patch.object(factory, "detect_platform", return_value="Linux") as mock_detect:
+                assert factory.is_linux() is True
+                assert factory.is_linux() is True
+
+            mock_detect.assert_called_once()
+        finally:
+            factory.is_linux.cache_clear()
+
+
+class TestPlatformServiceSingleton:
+    """Process-wide platform service."""
+
+    def test_service_is_created_once(self):
+        """Every call returns the instance built at import."""
+        assert factory.get_platform_service() is factory.get_platform_service()
+
+    def test_reset_builds_a_new_instance(self):
+        """reset_platform_service() swaps in a fresh service."""
+        before = factory.get_platform_service()
+
+        factory.reset_platform_service()
+
+        assert factory.get_platform_service() is not before
+
+
+class TestSanitizeFilename:
+    """Filename sanitizing per platform."""
+
+    def test_windows_replaces_invalid_and_control_chars(self):
+        """Reserved punctuation and control characters become underscores."""
+        assert WindowsPlatform().sanitize_filename('a<b>c:d"e|f?g*h\ti\x00.pdf') == "a_b_c_d_e_f_g_h_i_.pdf"
+
+    def test_posix_drops_null_bytes_and_separators(self):
+        """Null bytes are removed and slashes replaced."""
+        assert PosixPlatform().sanitize_filename("rech\x00nung/2025.pdf") == "rechnung_2025.pdf"
+
+    def test_windows_prefixes_reserved_names(self):
+        """Device names are reserved regardless of extension and case."""
+        assert WindowsPlatform().sanitize_filename("con.tar.gz") == "file_con.tar.gz"
+        assert WindowsPlatform().sanitize_filename("console.txt") == "console.txt"
+
+    def test_posix_strips_leading_dots(self):
+        """Hidden-file dots are removed; a name of only dots is replaced."""
+        assert PosixPlatform().sanitize_filename("..rechnung.pdf") == "rechnung.pdf"
+        assert PosixPlatform().sanitize_filename("...") == "unnamed_file"
+
+    def test_posix_truncates_to_255_bytes_keeping_extension(self):
+        """Long names are cut on a character boundary before the extension."""
+        sanitized = PosixPlatform().sanitize_filename("ü" * 200 + ".pdf")
+
+        assert sanitized == "ü" * 125 + ".pdf"
+        assert len(sanitized.encode("utf-8")) == 254
+
+    def test_posix_truncates_name_without_extension(self):
+        """Names without an extension are cut from the end."""
+        sanitized = PosixPlatform().sanitize_filename("a" + "ä" * 300)
+
+        assert sanitized == "a" + "ä" * 127
+
+
+class TestCaseSensitivity:
+    """Filesystem case-sensitivity probe."""
+
+    def test_darwin_probe_runs_once(self, tmp_path):
+        """The temp-file probe is not repeated on later calls."""
+        service = PosixPlatform()
+        service._system = "Darwin"
+
+        with patch.object(service, "get_temp_dir", return_value=tmp_path), \
+                patch.object(Path, "touch", autospec=True, side_effect=Path.touch) as mock_touch:
+            first = service.is_case_sensitive_filesystem()
+            second = service.is_case_sensitive_filesystem()
+
+        assert first == second
+        assert mock_touch.call_count == 2
+
+
+class TestNormalizePath:
+    """Lexical normalization versus symlink resolution."""
+
+    def test_normalize_is_lexical(self, tmp_path):
+        """normalize_path cleans up the path but keeps symlinks."""
+        (tmp_path / "real").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+
+        normalized = PosixPlatform().normalize_path(tmp_path / "link" / "sub" / ".." / "doc.pdf")
+
+        assert normalized == tmp_path / "link" / "doc.pdf"
+
+    def test_resolve_follows_symlinks(self, tmp_path):
+        """resolve_path returns the symlink target."""
+        (tmp_path / "real").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+
+        resolved = PosixPlatform().resolve_path(tmp_path / "link" / "doc.pdf")
+
+        assert resolved == (tmp_path / "real" / "doc.pdf").resolve()
+
+
+class TestWindowsPathValidation:
+    """Windows path rules, checked on any host."""
+
+    def test_invalid_characters_are_rejected(self):
+        """Wildcards and pipes are not allowed in paths."""
+        valid, error = WindowsPlatform().is_valid_path(Path("docs/rech?nung.pdf"))
+
+        assert valid is False
+        assert "invalid characters" in error
+
+    def test_extended_length_prefix_is_allowed(self):
+        """The ? of a \\\\?\\ prefix is not treated as a wildcard."""
+        assert WindowsPlatform().is_valid_path(Path("\\\\?\\C:\\docs\\rechnung.pdf")) == (True, None)
+
+
+class TestPlatformInfo:
+    """Platform information snapshot."""
+
+    def test_info_is_collected_once(self):
+        """uname() is queried once; callers get independent copies."""
+        factory._platform_snapshot.cache_clear()
+        try:
+            with patch.object(factory.platform, "uname", wraps=factory.platform.uname) as mock_uname:
+                first = factory.get_platform_info()
+                first["system"] = "changed"
+                second = factory.get_platform_info()
+
+            mock_uname.assert_called_once()
+            assert second["system"] != "changed"
+        finally:
+            factory._platform_snapshot.cache_clear()
+
+    def test_short_absolute_path_is_returned_untouched(self):
+        """Short absolute paths skip the absolute-path computation."""
+        path = Path("/docs/rechnung.pdf")
+
+        with patch("os.path.abspath") as mock_abspath:
+            assert WindowsPlatform().fix_long_path(path) is path
+
+        mock_abspath.assert_not_called()
+
+    def test_long_path_gets_extended_prefix(self):
+        """Paths beyond 260 characters get the \\\\?\\ prefix."""
+        path = Path("/" + "a" * 300)
+
+        assert WindowsPlatform().fix_long_path(path) == Path("\\\\?\\/" + "a" * 300)
+
+
+class TestTempFiles:
+    """Temporary file creation."""
+
+    def test_posix_text_temp_file(self):
+        """Text temp files are UTF-8 and removed on close."""
+        with PosixPlatform().create_temp_file(suffix=".txt") as handle:
+            handle.write("Prüfung")
+            name = handle.name
+            assert handle.encoding == "utf-8"
+
+        assert not Path(name).exists()
+
+    def test_windows_binary_temp_file_is_kept(self):
+        """Windows temp files are not auto-deleted."""
+        with WindowsPlatform().create_temp_file(text=False) as handle:
+            handle.write(b"%PDF")
+            name = handle.name
+
+        try:
+            assert Path(name).read_bytes() == b"%PDF"
+        finally:
+            Path(name).unlink()
@@ -0,0 +1,61 @@
+"""Unit tests for the interactive loop of the simplified workflow CLI."""
+
+import asyncio
+import io
+from unittest.mock import patch
+
+import pytest
+
+from src.paperless_ngx.presentation.cli.simplified_menu import SimplifiedWorkflowCLI
+
+
+class MenuLooped(BaseException):
+    """Raised when the menu is shown again; escapes the loop's handlers."""
+
+
+@pytest.fixture
+def cli():
+    """CLI without settings, logging setup or staging directory."""
+    return object.__new__(SimplifiedWorkflowCLI)
+
+
+def run_with_stdin(cli, text):
+    """Run the menu loop on the given stdin, allowing a single menu display."""
+    show_menu = cli.show_main_menu
+    shown = []
+
+    def show_once():
+        if shown:
+            raise MenuLooped
+        shown.append(True)
+        return show_menu()
+
+    with patch("sys.stdin", io.StringIO(text)), \
+            patch.object(cli, "show_main_menu", side_effect=show_once):
+        asyncio.run(cli.run())
+
+
+class TestRunLoop:
+    """Main menu loop."""
+
+    def test_closed_stdin_ends_the_loop(self, cli):
+        """EOF at the menu prompt exits instead of showing the menu again."""
+        run_with_stdin(cli, "")
+
+    def test_closed_stdin_after_workflow_ends_the_loop(self, cli):
+        """EOF while waiting for Enter exits after the workflow."""
+        calls = []
+
+        async def workflow():
+            calls.append(3)
+
+        cli.workflow_3_quality_scan = workflow
+        run_with_stdin(cli, "3\n")
+
+        assert calls == [3]
+
+    def test_wait_for_enter_raises_on_eof(self):
+        """An empty readline() is reported as EOF."""
+        with patch("sys.stdin", io.StringIO("")):
+            with pytest.raises(EOFError):
+                SimplifiedWorkflowCLI._wait_for_enter()
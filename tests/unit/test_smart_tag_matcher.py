@@ -7,6 +7,8 @@ Tests:
 - Tag hierarchy management
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from rapidfuzz import fuzz
@@ -372,6 +374,52 @@ class TestSmartTagMatcher:
         assert len(tags) == 2
         assert tags[0]["name"] == "Rechnung"
     
+    def test_batch_match_normalizes_existing_tags_once(self):
+        """A batch normalizes the existing tags once and sees its own new tags."""
+        matcher = SmartTagMatcher(similarity_threshold=0.95)
+        existing_tags = ["Rechnung", "Telekom"]
+        
+        with patch.object(
+            TagSimilarity, "normalize_candidates", wraps=TagSimilarity.normalize_candidates
+        ) as mock_normalize:
+            results = asyncio.run(
+                matcher.match_tags_batch([" rechnung", "Versicherung", "versicherung"], existing_tags)
+            )
+        
+        assert [r.matched_tag for r in results] == ["Rechnung", None, "Versicherung"]
+        assert existing_tags == ["Rechnung", "Telekom", "Versicherung"]
+        # Once for the batch, once for the new tag
+        assert mock_normalize.call_count == 2
+        assert mock_normalize.call_args.args[0] == ["Versicherung"]
+    
+    def test_cached_tags_are_normalized_once_per_run(self):
+        """Batches against the cached Paperless tags reuse one normalization."""
+        matcher = SmartTagMatcher(similarity_threshold=0.95)
+        matcher.existing_tags_cache = ["Rechnung", "Telekom", "Mobilfunk"]
+        
+        with patch.object(
+            TagSimilarity, "normalize_candidates", wraps=TagSimilarity.normalize_candidates
+        ) as mock_normalize:
+            first = asyncio.run(matcher.match_tags_batch(["Versicherung"], matcher.existing_tags_cache))
+            second = asyncio.run(matcher.match_tags_batch(["versicherung", "TELEKOM"], matcher.existing_tags_cache))
+        
+        assert first[0].is_new_tag
+        assert [r.matched_tag for r in second] == ["Versicherung", "Telekom"]
+        # The full list is normalized once; afterwards only added tags
+        full_calls = [c for c in mock_normalize.call_args_list if c.args[0] is matcher.existing_tags_cache]
+        assert len(full_calls) == 1
+        assert all(len(c.args[0]) == 1 for c in mock_normalize.call_args_list if c not in full_calls)
+    
+    def test_exact_match_skips_fuzzy_search(self):
+        """Tags differing only in case or whitespace are matched by lookup."""
+        matcher = SmartTagMatcher(similarity_threshold=0.95)
+        
+        with patch.object(TagSimilarity, "find_best_match") as mock_find:
+            results = asyncio.run(matcher.match_tags_batch([" TELEKOM ", "Rechnung"], ["Rechnung", "Telekom"]))
+        
+        assert [r.matched_tag for r in results] == ["Telekom", "Rechnung"]
+        mock_find.assert_not_called()
+    
     def test_prevent_aggressive_unification(self):
         """Test that aggressive tag unification is prevented."""
         matcher = SmartTagMatcher(similarity_threshold=0.95)